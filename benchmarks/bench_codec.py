@@ -0,0 +1,56 @@
+# coding: utf-8
+# Response decode cost of a ListTransactionsV2-sized page per JSON codec.
+#
+#   python benchmarks/bench_codec.py
+
+import base64
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pokepay.client import _decrypt_response  # noqa: E402
+from pokepay.codec import get_codec, orjson  # noqa: E402
+from pokepay.crypto import AESCipher  # noqa: E402
+
+KEY = base64.urlsafe_b64encode(os.urandom(32)).decode().rstrip('=')
+
+
+def page(rows):
+    account = {'id': 'ce82075e-0d91-419b-b5bc-31458306bc55',
+               'name': 'テスト口座', 'is_suspended': False,
+               'private_money': {'id': '4b138a4c-8944-4f98-a5c4-96d3c1c415eb',
+                                 'name': 'ポケペイ', 'unit': 'pt'}}
+    return {'rows': [{'id': str(i), 'type': 'topup', 'is_modified': False,
+                      'sender': {'id': 'u', 'name': '店舗', 'is_merchant': True},
+                      'sender_account': account, 'receiver_account': account,
+                      'amount': i, 'money_amount': i, 'point_amount': 0,
+                      'done_at': '2026-10-18T10:00:00.000000+09:00',
+                      'description': 'チャージ'} for i in range(rows)],
+            'per_page': rows, 'count': rows,
+            'next_page_cursor_id': None, 'prev_page_cursor_id': None}
+
+
+def main():
+    cipher = AESCipher(KEY)
+    names = ['json'] + (['orjson'] if orjson is not None else [])
+    body = page(1000)
+    for name in names:
+        codec = get_codec(name)
+        content = json.dumps({'response_data': cipher.encrypt_bytes(
+            codec.dumps(body)).decode('ascii')}).encode('utf-8')
+        number = 20
+        seconds = min(timeit.repeat(
+            lambda: _decrypt_response(cipher, content, codec),
+            number=number, repeat=5)) / number
+        print('{:<7} envelope {:>8} bytes  decode {:>8.2f} ms/page'.format(
+            name, len(content), seconds * 1e3))
+    legacy = json.dumps(body).encode('utf-8')
+    print('legacy json.dumps payload {} bytes, compact {} bytes'.format(
+        len(legacy), len(get_codec('json').dumps(body))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+# coding: utf-8
+# Per-call cost of the envelope cipher: reference functions vs AESCipher.
+#
+#   python benchmarks/bench_crypto.py
+
+import base64
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pokepay.crypto import AESCipher, _encrypt, _decrypt  # noqa: E402
+
+KEY = base64.urlsafe_b64encode(os.urandom(32)).decode().rstrip('=')
+
+
+def payload(rows):
+    return json.dumps({'rows': [{'id': str(i), 'amount': i * 100,
+                                 'description': 'x' * 40}
+                                for i in range(rows)]})
+
+
+def bench(label, func, number):
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print('  {:<34} {:>10.2f} us/call'.format(label, seconds * 1e6))
+
+
+def main():
+    cipher = AESCipher(KEY)
+    for rows in [1, 10, 1000]:
+        text = payload(rows)
+        data = text.encode('utf-8')
+        encrypted = cipher.encrypt(text)
+        number = max(20, 20000 // rows)
+        print('{} rows ({} bytes)'.format(rows, len(data)))
+        bench('encrypt  reference _encrypt', lambda: _encrypt(text, KEY),
+              number)
+        bench('encrypt  AESCipher.encrypt', lambda: cipher.encrypt(text),
+              number)
+        bench('encrypt  AESCipher.encrypt_bytes',
+              lambda: cipher.encrypt_bytes(data), number)
+        bench('decrypt  reference _decrypt',
+              lambda: _decrypt(encrypted, KEY), number)
+        bench('decrypt  AESCipher.decrypt',
+              lambda: cipher.decrypt(encrypted), number)
+        bench('decrypt  AESCipher.decrypt_bytes',
+              lambda: cipher.decrypt_bytes(encrypted), number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+# coding: utf-8
+# Cost of building an encrypted request envelope (timestamp, call id,
+# serialisation, encryption) before and after the low-overhead path.
+#
+#   python benchmarks/bench_envelope.py
+
+import json
+import os
+import sys
+import timeit
+import uuid
+from datetime import datetime
+
+import pytz
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pokepay as pp  # noqa: E402
+from pokepay.client import _request_params  # noqa: E402
+from pokepay.codec import get_codec  # noqa: E402
+from pokepay.crypto import AESCipher  # noqa: E402
+from bench_codec import KEY  # noqa: E402
+
+
+def legacy_request_params(client_id, cipher, timezone, request_object):
+    encrypt_data = {
+        'request_data': request_object.body_params,
+        'timestamp': datetime.now(tz=pytz.timezone(timezone)).isoformat(),
+        'partner_call_id': str(uuid.uuid4())
+    }
+    return {
+        'partner_client_id': client_id,
+        'data': cipher.encrypt(json.dumps(encrypt_data)),
+        'request_method': request_object.method
+    }
+
+
+def main():
+    cipher = AESCipher(KEY)
+    request = pp.CreateTopupTransaction(
+        '9ea7d6e2-86c5-4c57-9bb2-7dc0e7f1ac25',
+        'ce82075e-0d91-419b-b5bc-31458306bc55',
+        '4b138a4c-8944-4f98-a5c4-96d3c1c415eb',
+        money_amount=1000, point_amount=None, description='チャージ')
+    cases = [('legacy', lambda: legacy_request_params(
+                 'client', cipher, 'Asia/Tokyo', request)),
+             ('json', lambda: _request_params(
+                 'client', cipher, 'Asia/Tokyo', request, get_codec('json')))]
+    for name, build in cases:
+        number = 20000
+        seconds = min(timeit.repeat(build, number=number, repeat=5))
+        print('{:<8} {:7.2f} us/call  data {:4d} bytes'.format(
+            name, seconds / number * 1e6, len(build()['data'])))
+
+
+if __name__ == '__main__':
+    main()
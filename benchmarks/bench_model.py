@@ -0,0 +1,58 @@
+# coding: utf-8
+# Filtering a page of transaction rows: raw dicts, lazy row models, and
+# models that convert every nested object up front.
+#
+#   python benchmarks/bench_model.py [rows]
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pokepay import models  # noqa: E402
+
+
+class EagerModel(object):
+    # Converts the whole object tree when constructed.
+
+    def __init__(self, data):
+        for key, value in data.items():
+            if isinstance(value, dict):
+                value = EagerModel(value)
+            setattr(self, key, value)
+
+
+def row(i):
+    account = {'id': 'a{}'.format(i), 'name': 'テスト口座',
+               'is_suspended': False, 'status': 'active',
+               'private_money': {'id': 'm', 'name': 'テストマネー',
+                                 'unit': 'pt', 'type': 'own'}}
+    user = {'id': 'u{}'.format(i), 'name': 'テストユーザー',
+            'is_merchant': False}
+    return {'id': str(i), 'type': 'payment', 'is_modified': False,
+            'sender': user, 'sender_account': account,
+            'receiver': user, 'receiver_account': account,
+            'amount': i % 5000, 'money_amount': i % 5000, 'point_amount': 0,
+            'done_at': '2026-10-18T10:00:00.000000+09:00',
+            'description': ''}
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rows = [row(i) for i in range(count)]
+    cases = [
+        ('dict', lambda: [r for r in rows if r['amount'] > 4900]),
+        ('Transaction', lambda: [
+            t for t in map(models.Transaction, rows) if t.amount > 4900]),
+        ('EagerModel', lambda: [
+            t for t in map(EagerModel, rows) if t.amount > 4900]),
+    ]
+    for name, func in cases:
+        seconds = min(timeit.repeat(func, number=1, repeat=5))
+        print('{:<12} {:7.1f} ms  {:5.2f} us/row'.format(
+            name, seconds * 1e3, seconds * 1e6 / count))
+
+
+if __name__ == '__main__':
+    main()
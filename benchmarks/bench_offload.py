@@ -0,0 +1,48 @@
+# coding: utf-8
+# Decrypt-and-parse throughput of 1000-row pages, inline vs DecodeOffload.
+# Run on a multi-core host; with a single core the process pool can only
+# add IPC overhead.
+#
+#   python benchmarks/bench_offload.py [threads]
+
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_codec import KEY, page  # noqa: E402
+from pokepay.client import _decrypt_response  # noqa: E402
+from pokepay.codec import get_codec  # noqa: E402
+from pokepay.crypto import AESCipher  # noqa: E402
+from pokepay.offload import DecodeOffload  # noqa: E402
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count()
+    cipher = AESCipher(KEY)
+    codec = get_codec()
+    content = json.dumps({'response_data': cipher.encrypt_bytes(
+        codec.dumps(page(1000))).decode('ascii')}).encode('utf-8')
+    offload = DecodeOffload(KEY, threshold=0, max_workers=threads,
+                            codec_name=codec.name)
+    offload.decode(content)  # start the workers
+    pages = threads * 20
+    print('{} cpus, {} threads, {} pages of {} bytes'.format(
+        os.cpu_count(), threads, pages, len(content)))
+    for name, decode in [
+            ('inline', lambda _: _decrypt_response(cipher, content, codec)),
+            ('offload', lambda _: offload.decode(content))]:
+        with ThreadPoolExecutor(threads) as executor:
+            started = time.perf_counter()
+            list(executor.map(decode, range(pages)))
+            elapsed = time.perf_counter() - started
+        print('  {:<8} {:>8.1f} pages/s'.format(name, pages / elapsed))
+    offload.close()
+
+
+if __name__ == '__main__':
+    main()
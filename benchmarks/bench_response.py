@@ -0,0 +1,88 @@
+# coding: utf-8
+# Memory per response object: the former __dict__ models vs __slots__.
+#
+#   python benchmarks/bench_response.py [objects]
+
+import json
+import os
+import sys
+import tracemalloc
+from datetime import timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pokepay.response.transaction import Transaction  # noqa: E402
+
+
+class LegacyResponse(object):
+    # PokepayResponse and Transaction as generated before __slots__.
+
+    def __init__(self, response, response_body):
+        self.body = response_body
+        self.elapsed = response.elapsed
+        self.status_code = response.status_code
+        self.ok = response.ok
+        self.headers = response.headers
+        self.url = response.url
+
+
+class LegacyTransaction(LegacyResponse):
+    def __init__(self, response, response_body):
+        super().__init__(response, response_body)
+        self.id = response_body['id']
+        self.type = response_body['type']
+        self.is_modified = response_body['is_modified']
+        self.sender = response_body['sender']
+        self.sender_account = response_body['sender_account']
+        self.receiver = response_body['receiver']
+        self.receiver_account = response_body['receiver_account']
+        self.amount = response_body['amount']
+        self.money_amount = response_body['money_amount']
+        self.point_amount = response_body['point_amount']
+        self.done_at = response_body['done_at']
+        self.description = response_body['description']
+
+
+class FakeResponse(object):
+    status_code = 200
+    ok = True
+    headers = {'Content-Type': 'application/json'}
+    url = 'https://partner.example.com/transactions/0'
+    elapsed = timedelta(seconds=0.1)
+
+
+BODY = json.dumps({
+    'id': '7a2f3a05-6d83-4a2b-9f0b-6c2f2b7d0a11', 'type': 'payment',
+    'is_modified': False,
+    'sender': {'id': 'u', 'name': 'テストユーザー', 'is_merchant': False},
+    'sender_account': {'id': 'a', 'name': 'テスト口座'},
+    'receiver': {'id': 's', 'name': 'テスト店舗', 'is_merchant': True},
+    'receiver_account': {'id': 'b', 'name': '店舗口座'},
+    'amount': 1000, 'money_amount': 1000, 'point_amount': 0,
+    'done_at': '2026-10-18T10:00:00.000000+09:00', 'description': ''})
+
+
+def allocated(func):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = func()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    response = FakeResponse()
+    body = json.loads(BODY)
+    print('decoded body     {:6d} bytes'.format(
+        allocated(lambda: json.loads(BODY))))
+    for cls in (LegacyTransaction, Transaction):
+        size = allocated(lambda: [cls(response, body) for _ in range(count)])
+        print('{:<16} {:6.0f} bytes/object'.format(cls.__name__,
+                                                   size / count))
+
+
+if __name__ == '__main__':
+    main()
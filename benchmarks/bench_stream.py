@@ -0,0 +1,71 @@
+# coding: utf-8
+# Peak memory of decoding a large page whole vs through StreamedPage.
+#
+#   python benchmarks/bench_stream.py [rows]
+
+import io
+import json
+import os
+import sys
+import tracemalloc
+from datetime import timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_codec import KEY, page  # noqa: E402
+from pokepay.client import _decrypt_response  # noqa: E402
+from pokepay.codec import get_codec  # noqa: E402
+from pokepay.crypto import AESCipher  # noqa: E402
+from pokepay.stream import StreamedPage  # noqa: E402
+
+
+class BodyResponse(object):
+    # Serves a prepared body the way requests.Response.iter_content does.
+
+    def __init__(self, content):
+        self.content = content
+        self.status_code = 200
+        self.ok = True
+        self.headers = {}
+        self.url = ''
+        self.elapsed = timedelta(0)
+
+    def iter_content(self, chunk_size):
+        body = io.BytesIO(self.content)
+        return iter(lambda: body.read(chunk_size), b'')
+
+    def close(self):
+        pass
+
+
+def peak(func):
+    tracemalloc.start()
+    func()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak_bytes
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    cipher = AESCipher(KEY)
+    codec = get_codec()
+    content = json.dumps({'response_data': cipher.encrypt_bytes(
+        codec.dumps(page(rows))).decode('ascii')}).encode('utf-8')
+
+    def whole():
+        for row in _decrypt_response(cipher, content, codec)['rows']:
+            pass
+
+    def streamed():
+        for row in StreamedPage(BodyResponse(content), cipher.key_bytes):
+            pass
+
+    print('{} rows, body {} bytes'.format(rows, len(content)))
+    print('  whole     peak {:>12,} bytes'.format(peak(whole)))
+    print('  streamed  peak {:>12,} bytes'.format(peak(streamed)))
+
+
+if __name__ == '__main__':
+    main()
@@ -2,7 +2,26 @@
 # DO NOT EDIT: File is generated by code generator.
 
 from pokepay.crypto import *
+from pokepay.codec import *
+from pokepay.transport import *
+from pokepay.offload import *
+from pokepay.stream import *
+from pokepay.pipeline import *
+from pokepay.paginate import *
+from pokepay.export import *
+from pokepay.model import *
 from pokepay.client import *
+from pokepay.async_client import *
+from pokepay.concurrency import *
+from pokepay.batch import *
+from pokepay.pool import *
+from pokepay.retry import *
+from pokepay.endpoint import *
+from pokepay.ratelimit import *
+from pokepay.circuit import *
+from pokepay.hedge import *
+from pokepay.timeout import *
+from pokepay.clock import *
 from pokepay.request.request import *
 from pokepay.response.response import *
 from pokepay.request.get_ping import *
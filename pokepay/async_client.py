@@ -0,0 +1,101 @@
+import ssl
+import time
+from datetime import timedelta
+from urllib.parse import urlparse
+from .crypto import AESCipher
+from .client import _load_profile, _request_params, _decrypt_response
+from .timeout import TimeoutProfile
+from .codec import get_codec
+from .transport import TransportResponse
+
+try:
+    # pip install aiohttp
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class AsyncClient(object):
+
+    def __init__(self, path_to_inifile, profile_name='global',
+                 connection_limit=None, keepalive_timeout=None,
+                 json_codec=None):
+        if aiohttp is None:
+            raise ImportError(
+                'AsyncClient requires aiohttp: pip install aiohttp')
+        self.conf, profile = _load_profile(path_to_inifile, profile_name)
+        self.client_id = profile.get('CLIENT_ID')
+        self.client_secret = profile.get('CLIENT_SECRET')
+        self.api_base_url = profile.get('API_BASE_URL')
+        self.timezone = profile.get('TIMEZONE')
+        self.timeout = profile.get('TIMEOUT')
+        self.connection_timeout = profile.get('CONNECTTIMEOUT')
+        self.timeouts = TimeoutProfile.from_profile(profile)
+        if connection_limit is None:
+            connection_limit = profile.getint('POOL_MAXSIZE', 100)
+        if keepalive_timeout is None:
+            keepalive_timeout = profile.getfloat('KEEPALIVE', 30.0)
+        self.connection_limit = connection_limit
+        self.keepalive_timeout = keepalive_timeout
+        self.cipher = AESCipher(self.client_secret)
+        if json_codec is None:
+            json_codec = get_codec(profile.get('JSON_CODEC'))
+        self.codec = json_codec
+        self.session = None
+        self.use_ssl = False
+        self.ssl_context = None
+        if urlparse(self.api_base_url).scheme == 'https':
+            self.use_ssl = True
+            self.ssl_key_file = profile.get('SSL_KEY_FILE')
+            self.ssl_cert_file = profile.get('SSL_CERT_FILE')
+            self.ssl_context = ssl.create_default_context()
+            self.ssl_context.load_cert_chain(self.ssl_cert_file,
+                                             self.ssl_key_file)
+
+    def _client_timeout(self, request_object=None, timeout=None):
+        connect, read = (self.timeouts.connect, self.timeouts.read)
+        if request_object is not None:
+            connect, read = self.timeouts.for_request(request_object, timeout)
+        return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+
+    def _get_session(self):
+        # The connector must be created inside the running event loop, so
+        # the session is built on first use rather than in __init__.
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                keepalive_timeout=self.keepalive_timeout,
+                ssl=self.ssl_context if self.use_ssl else True)
+            self.session = aiohttp.ClientSession(
+                connector=connector, timeout=self._client_timeout())
+        return self.session
+
+    async def send(self, request_object, timeout=None):
+        params = _request_params(self.client_id, self.cipher, self.timezone,
+                                 request_object, self.codec)
+        session = self._get_session()
+        started = time.monotonic()
+        async with session.post(
+                self.api_base_url + request_object.path, data=params,
+                timeout=self._client_timeout(request_object, timeout)) as res:
+            content = await res.read()
+            response = TransportResponse(
+                res.status, res.headers, str(res.url), content,
+                timedelta(seconds=time.monotonic() - started))
+        if response.ok:
+            decrypt_data = _decrypt_response(self.cipher, response.content,
+                                             self.codec)
+            return request_object.response_class(response, decrypt_data)
+        else:
+            return response
+
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
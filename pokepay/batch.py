@@ -0,0 +1,84 @@
+import collections
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from .concurrency import AdaptiveLimit
+
+
+class BatchResult(object):
+    """Outcome of one request dispatched by Client.send_many.
+
+    Exactly one of response and error is set. A non-2xx reply is a response
+    (the raw requests.Response, as Client.send returns it), while an
+    exception raised during the call is captured in error.
+    """
+
+    def __init__(self, index, request, response=None, error=None):
+        self.index = index
+        self.request = request
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None and bool(getattr(self.response, 'ok',
+                                                   False))
+
+    def __repr__(self):
+        return '<BatchResult index={} ok={}>'.format(self.index, self.ok)
+
+
+def _call(send, index, request_object, limiter=None):
+    epoch = limiter.acquire() if limiter is not None else None
+    try:
+        result = BatchResult(index, request_object,
+                             response=send(request_object))
+    except Exception as e:
+        result = BatchResult(index, request_object, error=e)
+    if limiter is not None:
+        limiter.record(epoch, result.response, result.error)
+    return result
+
+
+def _dispatch(send, request_objects, max_concurrency=8, ordered=True):
+    # Only a bounded window of requests is submitted at a time, so an
+    # iterator of any length can be consumed without materializing it.
+    # An AdaptiveLimit sizes the pool for its maximum and gates each call.
+    limiter = None
+    if isinstance(max_concurrency, AdaptiveLimit):
+        limiter = max_concurrency
+        max_concurrency = limiter.max_limit
+    if max_concurrency < 1:
+        raise ValueError('max_concurrency must be positive')
+    window = max_concurrency * 2
+    source = enumerate(request_objects)
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+
+        def submit_next():
+            for index, request_object in source:
+                return executor.submit(_call, send, index, request_object,
+                                       limiter)
+            return None
+
+        if ordered:
+            queue = collections.deque()
+            while True:
+                while len(queue) < window:
+                    future = submit_next()
+                    if future is None:
+                        break
+                    queue.append(future)
+                if not queue:
+                    return
+                yield queue.popleft().result()
+        else:
+            pending = set()
+            while True:
+                while len(pending) < window:
+                    future = submit_next()
+                    if future is None:
+                        break
+                    pending.add(future)
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
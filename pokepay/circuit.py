@@ -0,0 +1,117 @@
+import threading
+import time
+from .concurrency import _is_overload
+from .endpoint import path_template
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """Raised by Client.send instead of calling a path whose circuit is open."""
+
+    def __init__(self, path, retry_after):
+        super().__init__(
+            'circuit for {} is open, retry after {:.1f}s'.format(
+                path, retry_after))
+        self.path = path
+        self.retry_after = retry_after
+
+
+class _Circuit(object):
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.probes = 0
+        # Bumped on every state change, so that results of calls admitted
+        # under an earlier state can be told apart.
+        self.generation = 0
+
+    def change(self, state, now=None):
+        self.state = state
+        self.generation += 1
+        if state == OPEN:
+            self.opened_at = now
+        elif state == HALF_OPEN:
+            self.probes = 0
+        else:
+            self.failures = 0
+
+
+class CircuitBreaker(object):
+    """One circuit per path template, tripped by consecutive failures.
+
+    A closed circuit opens after failure_threshold consecutive overload
+    failures (timeouts, connection errors, 5xx/429 and service unavailable
+    replies). While open every call fails immediately with CircuitOpenError.
+    After recovery_timeout seconds the circuit is half-open and lets
+    half_open_calls probe calls through: a success closes it, a failure
+    opens it again. before() returns a ticket to pass to record(); results
+    of calls admitted before the circuit last changed state are ignored.
+    """
+
+    def __init__(self, failure_threshold=5, recovery_timeout=30.0,
+                 half_open_calls=1, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_calls = half_open_calls
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.circuits = {}
+
+    @classmethod
+    def from_profile(cls, profile):
+        if profile.get('CIRCUIT_FAILURE_THRESHOLD') is None:
+            return None
+        return cls(
+            failure_threshold=profile.getint('CIRCUIT_FAILURE_THRESHOLD'),
+            recovery_timeout=profile.getfloat('CIRCUIT_RECOVERY_TIMEOUT',
+                                              30.0),
+            half_open_calls=profile.getint('CIRCUIT_HALF_OPEN_CALLS', 1))
+
+    def state(self, path):
+        with self.lock:
+            circuit = self.circuits.get(path_template(path))
+            if circuit is None:
+                return CLOSED
+            self._expire(circuit)
+            return circuit.state
+
+    def _expire(self, circuit):
+        if (circuit.state == OPEN and
+                self.clock() - circuit.opened_at >= self.recovery_timeout):
+            circuit.change(HALF_OPEN)
+
+    def before(self, path):
+        key = path_template(path)
+        with self.lock:
+            circuit = self.circuits.setdefault(key, _Circuit())
+            self._expire(circuit)
+            if circuit.state == OPEN:
+                raise CircuitOpenError(key, self.recovery_timeout - (
+                    self.clock() - circuit.opened_at))
+            if circuit.state == HALF_OPEN:
+                if circuit.probes >= self.half_open_calls:
+                    raise CircuitOpenError(key, 0.0)
+                circuit.probes += 1
+            return (key, circuit.generation)
+
+    def record(self, ticket, response=None, error=None):
+        key, generation = ticket
+        failed = _is_overload(response, error)
+        with self.lock:
+            circuit = self.circuits.setdefault(key, _Circuit())
+            if generation != circuit.generation:
+                return
+            if not failed:
+                if circuit.state == HALF_OPEN:
+                    circuit.change(CLOSED)
+                circuit.failures = 0
+                return
+            circuit.failures += 1
+            if (circuit.state == HALF_OPEN or
+                    circuit.failures >= self.failure_threshold):
+                circuit.change(OPEN, self.clock())
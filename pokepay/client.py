@@ -1,69 +1,354 @@
 import requests
 import configparser
-import json
-import uuid
-import pytz
-from datetime import datetime
+import functools
+import time
+from datetime import datetime, timedelta
 from urllib.parse import urlparse
 from .crypto import AESCipher
+from .codec import get_codec
+from .envelope import _fixed_zone, _partner_call_id, _compact_body_params
+from .batch import _dispatch
+from .pool import PoolingHTTPAdapter
+from .retry import RetryPolicy
+from .ratelimit import RateLimiter
+from .circuit import CircuitBreaker
+from .hedge import HedgePolicy
+from .timeout import TimeoutProfile, _bounded
+from .transport import Http2Transport
+from .offload import DecodeOffload
+from .stream import StreamedPage
+from .pipeline import PreparedCall, _prepared
+from .clock import ClockSkew, _is_expired
+from .paginate import (PageIterator, ParallelPageIterator, CursorIterator,
+                       WindowScan)
+from .export import LedgerExport
 
 
-def _current_timestamp(tz):
+def _current_timestamp(tz, offset=0.0):
     if not (tz):
         tz = 'Asia/Tokyo'
-    timezone_obj = pytz.timezone(tz)
-    now = datetime.now(tz=timezone_obj)
+    now = datetime.now(tz=_fixed_zone(tz))
+    if offset:
+        now += timedelta(seconds=offset)
     return now.isoformat()
 
 
-def _timeout_params(timeout, connection_timeout):
-    if not (timeout):
-        timeout = 5.0
-    if not (connection_timeout):
-        connection_timeout = 5.0
-    return (float(connection_timeout), float(timeout))
+def _load_profile(path_to_inifile, profile_name):
+    conf = configparser.ConfigParser()
+    conf.read(path_to_inifile, encoding='utf-8')
+    return conf, conf[profile_name]
+
+
+def _request_params(client_id, cipher, timezone, request_object, codec,
+                    clock_offset=0.0):
+    encrypt_data = {
+        'request_data': _compact_body_params(request_object),
+        'timestamp': _current_timestamp(timezone, clock_offset),
+        'partner_call_id': _partner_call_id()
+    }
+    return {
+        'partner_client_id': client_id,
+        'data': cipher.encrypt_bytes(codec.dumps(encrypt_data)).decode(
+            'ascii'),
+        'request_method': request_object.method
+    }
+
+
+def _decrypt_response(cipher, content, codec):
+    res_dict = codec.loads(content)
+    return codec.loads(cipher.decrypt_bytes(res_dict['response_data']))
 
 
 class Client(object):
 
-    def __init__(self, path_to_inifile, profile_name='global'):
-        self.conf = configparser.ConfigParser()
-        self.conf.read(path_to_inifile, encoding='utf-8')
-        profile = self.conf[profile_name]
+    def __init__(self, path_to_inifile, profile_name='global',
+                 pool_connections=None, pool_maxsize=None, pool_block=None,
+                 keepalive=None, retry=None, rate_limiter=None,
+                 circuit_breaker=None, hedge=None, http2=None,
+                 json_codec=None, offload=None, clock_skew=None):
+        self.conf, profile = _load_profile(path_to_inifile, profile_name)
         self.client_id = profile.get('CLIENT_ID')
         self.client_secret = profile.get('CLIENT_SECRET')
         self.api_base_url = profile.get('API_BASE_URL')
         self.timezone = profile.get('TIMEZONE')
         self.timeout = profile.get('TIMEOUT')
         self.connection_timeout = profile.get('CONNECTTIMEOUT')
+        self.timeouts = TimeoutProfile.from_profile(profile)
+        self.prepared_max_age = profile.getfloat('PREPARED_MAX_AGE', 30.0)
+        if pool_connections is None:
+            pool_connections = profile.getint('POOL_CONNECTIONS', 10)
+        if pool_maxsize is None:
+            pool_maxsize = profile.getint('POOL_MAXSIZE', 10)
+        if pool_block is None:
+            pool_block = profile.getboolean('POOL_BLOCK', False)
+        if keepalive is None:
+            keepalive = profile.getfloat('KEEPALIVE', None)
+        self.adapter = PoolingHTTPAdapter(pool_connections=pool_connections,
+                                          pool_maxsize=pool_maxsize,
+                                          pool_block=pool_block,
+                                          keepalive=keepalive)
         self.session = requests.Session()
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
         self.cipher = AESCipher(self.client_secret)
+        if json_codec is None:
+            json_codec = get_codec(profile.get('JSON_CODEC'))
+        self.codec = json_codec
+        if offload is None:
+            offload = DecodeOffload.from_profile(
+                profile, getattr(self.codec, 'name', None))
+        self.offload = offload
+        if retry is None:
+            retry = RetryPolicy.from_profile(profile)
+        self.retry = retry
+        if rate_limiter is None:
+            rate_limiter = RateLimiter.from_profile(profile)
+        self.rate_limiter = rate_limiter
+        if circuit_breaker is None:
+            circuit_breaker = CircuitBreaker.from_profile(profile)
+        self.circuit_breaker = circuit_breaker
+        if hedge is None:
+            hedge = HedgePolicy.from_profile(profile, pool_maxsize)
+        self.hedge = hedge
+        if clock_skew is None:
+            clock_skew = ClockSkew.from_profile(profile)
+        self.clock_skew = clock_skew
         self.use_ssl = False
         if urlparse(self.api_base_url).scheme == 'https':
             self.use_ssl = True
             self.ssl_key_file = profile.get('SSL_KEY_FILE')
             self.ssl_cert_file = profile.get('SSL_CERT_FILE')
             self.session.cert = (self.ssl_cert_file, self.ssl_key_file)
+        if http2 is None:
+            http2 = profile.getboolean('HTTP2', False)
+        self.transport = self.session
+        if http2:
+            self.transport = Http2Transport(
+                self.api_base_url,
+                cert=self.session.cert if self.use_ssl else None,
+                max_connections=pool_maxsize, keepalive=keepalive)
+
+    def send(self, request_object, timeout=None, deadline=None):
+        """Send a request and return its response object.
+
+        timeout overrides the profile's timeouts for this call, either as a
+        read timeout or a (connect, read) pair. deadline bounds the whole
+        call in seconds, retries included (default: DEADLINE in profile).
+        """
+        return self._send(request_object, timeout, deadline)
+
+    def prepare(self, request_object):
+        """Build the encrypted payload of a request for send_prepared."""
+        return PreparedCall(request_object, self._request_params(
+            request_object))
+
+    def send_prepared(self, prepared, timeout=None, deadline=None):
+        """Send a PreparedCall; otherwise the same as send.
+
+        The prepared payload is rebuilt if it is older than
+        prepared_max_age (PREPARED_MAX_AGE in profile, default 30 seconds)
+        so that its timestamp is still accepted by the server.
+        """
+        return self._send(prepared.request, timeout, deadline, prepared)
+
+    def _send(self, request_object, timeout, deadline, prepared=None):
+        timeout = self.timeouts.for_request(request_object, timeout)
+        expires_at = self.timeouts.expires_at(deadline)
+        send = functools.partial(self._send_once, timeout=timeout,
+                                 expires_at=expires_at, prepared=prepared)
+        if self.hedge is not None:
+            send = functools.partial(self.hedge.call, send)
+        if self.retry is None:
+            return send(request_object)
+        return self.retry.call(send, request_object, expires_at=expires_at)
+
+    def _send_once(self, request_object, timeout=None, expires_at=None,
+                   prepared=None):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(request_object.path, expires_at)
+        # Bounded after the rate limit wait, which the deadline covers too.
+        timeout = _bounded(timeout or self.timeouts.for_request(
+            request_object), expires_at)
+        if self.circuit_breaker is None:
+            return self._post(request_object, timeout, prepared)
+        ticket = self.circuit_breaker.before(request_object.path)
+        try:
+            response = self._post(request_object, timeout, prepared)
+        except Exception as e:
+            self.circuit_breaker.record(ticket, error=e)
+            raise
+        self.circuit_breaker.record(ticket, response=response)
+        return response
+
+    def _post(self, request_object, timeout, prepared=None):
+        params = None
+        if prepared is not None:
+            params = prepared.claim(self.prepared_max_age)
+        if params is None:
+            params = self._request_params(request_object)
+        response = self._post_params(request_object, params, timeout)
+        if self.clock_skew is not None and _is_expired(response):
+            # The envelope was rejected before being processed, and the
+            # estimate has just been reset from this reply's Date header.
+            self.clock_skew.record_resend()
+            response = self._post_params(
+                request_object, self._request_params(request_object),
+                timeout)
+        if response.ok:
+            return request_object.response_class(
+                response, self._decode(response.content))
+        else:
+            return response
+
+    def _post_params(self, request_object, params, timeout):
+        if self.hedge is not None:
+            self.hedge.sent()
+        sent_at = time.time()
+        response = self.transport.post(
+            url=self.api_base_url + request_object.path,
+            data=params,
+            timeout=timeout)
+        if self.clock_skew is not None:
+            self.clock_skew.observe(response.headers.get('Date'), sent_at,
+                                    time.time(), reset=_is_expired(response))
+        return response
+
+    def _request_params(self, request_object):
+        clock_offset = 0.0
+        if self.clock_skew is not None:
+            clock_offset = self.clock_skew.offset
+        return _request_params(self.client_id, self.cipher, self.timezone,
+                               request_object, self.codec, clock_offset)
 
-    def send(self, request_object):
-        encrypt_data = {
-            'request_data': request_object.body_params,
-            'timestamp': _current_timestamp(self.timezone),
-            'partner_call_id': str(uuid.uuid4())
-        }
-        params = {
-            'partner_client_id': self.client_id,
-            'data': self.cipher.encrypt(json.dumps(encrypt_data)),
-            'request_method': request_object.method
-        }
+    def _decode(self, content):
+        if self.offload is not None and self.offload.should_offload(content):
+            return self.offload.decode(content)
+        return _decrypt_response(self.cipher, content, self.codec)
+
+    def stream(self, request_object, chunk_size=64 * 1024, timeout=None):
+        """Send a list request and return its rows as a StreamedPage.
+
+        The body is read, base64-decoded, decrypted and parsed incrementally
+        while the page is iterated, so memory stays bounded by chunk_size
+        and one row. A non-2xx reply is returned as the raw response.
+        Retries, hedging and the circuit breaker do not apply here.
+        """
+        if self.transport is not self.session:
+            raise RuntimeError('streaming requires the HTTP/1.1 transport')
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(request_object.path)
+        params = self._request_params(request_object)
         response = self.session.post(
             url=self.api_base_url + request_object.path,
             data=params,
-            timeout=_timeout_params(self.timeout, self.connection_timeout))
-        if response.ok:
-            res_dict = json.loads(response.content)
-            decrypt_data_str = self.cipher.decrypt(res_dict['response_data'])
-            decrypt_data = json.loads(decrypt_data_str)
-            return request_object.response_class(response, decrypt_data)
-        else:
+            timeout=self.timeouts.for_request(request_object, timeout),
+            stream=True)
+        if not response.ok:
+            response.content
             return response
+        return StreamedPage(response, self.cipher.key_bytes, chunk_size)
+
+    def iterate(self, request_object, per_page=None, start_page=1,
+                max_pages=None, limit=None, prefetch=True):
+        """Yield the rows of a page-based list request across all pages.
+
+        Returns a PageIterator; see there for limits and prefetching. A
+        page that fails raises PageError. per_page='auto' (or an
+        AdaptivePageSize) sizes pages towards a target latency; the same
+        holds for iterate_cursor, iterate_windows and export.
+        """
+        return PageIterator(self.send, request_object, per_page=per_page,
+                            start_page=start_page, max_pages=max_pages,
+                            limit=limit, prefetch=prefetch)
+
+    def iterate_parallel(self, request_object, max_concurrency=8,
+                         ordered=True, dedupe=True, per_page=None,
+                         start_page=1, max_pages=None, limit=None):
+        """Like iterate, but fetch pages 2..max_page concurrently.
+
+        Returns a ParallelPageIterator. As with send_many, keep
+        max_concurrency at or below POOL_MAXSIZE.
+        """
+        return ParallelPageIterator(
+            self.send, request_object, max_concurrency=max_concurrency,
+            ordered=ordered, dedupe=dedupe, per_page=per_page,
+            start_page=start_page, max_pages=max_pages, limit=limit)
+
+    def iterate_cursor(self, request_object, per_page=None, cursor=None,
+                       direction='next', max_pages=None, limit=None,
+                       prefetch=1):
+        """Yield the rows of a cursor based list request across all pages.
+
+        For ListTransactionsV2 and ListTransfersV2 (per_page up to 1000).
+        Returns a CursorIterator, whose cursor attribute can be passed back
+        as cursor to resume the scan. A page that fails raises PageError.
+        """
+        return CursorIterator(self.send, request_object, per_page=per_page,
+                              cursor=cursor, direction=direction,
+                              max_pages=max_pages, limit=limit,
+                              prefetch=prefetch)
+
+    def iterate_windows(self, request_object, start, end, max_concurrency=8,
+                        per_page=1000, target_pages=5, buffer_pages=None,
+                        min_window=timedelta(seconds=1)):
+        """Scan a ListTransactionsV2 request over [start, end] in parallel.
+
+        start and end are datetimes. The range is followed as concurrent
+        time windows that are split further where the data is dense; rows
+        still come out in done_at order. Returns a WindowScan.
+        """
+        return WindowScan(self.send, request_object, start, end,
+                          max_concurrency=max_concurrency, per_page=per_page,
+                          target_pages=target_pages,
+                          buffer_pages=buffer_pages, min_window=min_window)
+
+    def export(self, request_object, checkpoint, per_page=1000, start=None,
+               end=None, shards=1):
+        """Return a resumable LedgerExport of a cursor based list request.
+
+        checkpoint is a FileCheckpoint or SqliteCheckpoint. Call run(sink)
+        on the result to export the remaining pages.
+        """
+        return LedgerExport(self.send, request_object, checkpoint,
+                            per_page=per_page, start=start, end=end,
+                            shards=shards)
+
+    def pool_stats(self):
+        if self.transport is not self.session:
+            return self.transport.pool_stats()
+        return self.adapter.pool_stats()
+
+    def send_many(self, request_objects, max_concurrency=8, ordered=True):
+        """Send requests concurrently over this client's session.
+
+        Yields a BatchResult per request, in input order when ordered is
+        True or as soon as each one completes otherwise. Exceptions are
+        captured per item instead of aborting the batch. Keep
+        max_concurrency at or below the pool size (POOL_MAXSIZE) so that
+        every worker gets a pooled connection. max_concurrency may also be
+        an AdaptiveLimit, which tunes the concurrency while the batch runs.
+        """
+        return _dispatch(self.send, request_objects,
+                         max_concurrency=max_concurrency, ordered=ordered)
+
+    def send_pipelined(self, request_objects, max_concurrency=8,
+                       ordered=True, queue_size=None):
+        """Like send_many, with payloads prepared ahead on a separate thread.
+
+        A CPU stage serializes and encrypts requests into a bounded queue
+        of queue_size calls (default 2 * max_concurrency) while the I/O
+        stage sends them with send_prepared, so the workers spend their
+        time on the network rather than on request preparation.
+        """
+        if queue_size is None:
+            queue_size = 2 * getattr(max_concurrency, 'max_limit',
+                                     max_concurrency)
+        prepared = _prepared(self.prepare, request_objects, queue_size)
+        try:
+            for result in _dispatch(self.send_prepared, prepared,
+                                    max_concurrency=max_concurrency,
+                                    ordered=ordered):
+                result.request = result.request.request
+                yield result
+        finally:
+            prepared.close()
@@ -0,0 +1,74 @@
+import threading
+from email.utils import parsedate_to_datetime
+
+
+def _is_expired(response):
+    # The server rejects envelopes whose timestamp is too far from its
+    # own clock with this error, before doing anything else.
+    if getattr(response, 'ok', True):
+        return False
+    try:
+        return response.json().get('type') == 'partner_request_expired'
+    except (ValueError, AttributeError):
+        return False
+
+
+def _server_time(date):
+    try:
+        return parsedate_to_datetime(date).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class ClockSkew(object):
+    """Estimate of how far the server clock is ahead of the local one.
+
+    Each reply's Date header is compared with the midpoint of the local
+    send and receive times. The header has one second resolution, so half
+    a second is added to each sample, and samples are smoothed with an
+    exponentially weighted moving average. Envelope timestamps are shifted
+    by the estimate only once it reaches `min_offset` seconds, so hosts
+    with a synchronized clock keep sending their own time.
+    """
+
+    def __init__(self, alpha=0.2, min_offset=1.0):
+        self.alpha = alpha
+        self.min_offset = min_offset
+        self.lock = threading.Lock()
+        self.estimate = None
+        self.samples = 0
+        self.resent = 0
+
+    @classmethod
+    def from_profile(cls, profile):
+        if not profile.getboolean('CLOCK_SKEW', True):
+            return None
+        return cls(min_offset=profile.getfloat('CLOCK_SKEW_MIN_OFFSET', 1.0))
+
+    def observe(self, date, sent_at, received_at, reset=False):
+        server_time = _server_time(date)
+        if server_time is None:
+            return
+        sample = server_time + 0.5 - (sent_at + received_at) / 2.0
+        with self.lock:
+            if self.estimate is None or reset:
+                self.estimate = sample
+            else:
+                self.estimate += self.alpha * (sample - self.estimate)
+            self.samples += 1
+
+    def record_resend(self):
+        with self.lock:
+            self.resent += 1
+
+    @property
+    def offset(self):
+        estimate = self.estimate
+        if estimate is None or abs(estimate) < self.min_offset:
+            return 0.0
+        return estimate
+
+    def stats(self):
+        with self.lock:
+            return {'offset': self.offset, 'estimate': self.estimate,
+                    'samples': self.samples, 'resent': self.resent}
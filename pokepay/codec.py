@@ -0,0 +1,43 @@
+import json
+
+try:
+    # pip install orjson
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonCodec(object):
+    """Standard library codec. dumps returns compact UTF-8 bytes."""
+
+    name = 'json'
+
+    def dumps(self, obj):
+        return json.dumps(obj, separators=(',', ':'),
+                          ensure_ascii=False).encode('utf-8')
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonCodec(object):
+    """orjson codec; its output is already compact UTF-8 bytes."""
+
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError('OrjsonCodec requires orjson: pip install orjson')
+        self.dumps = orjson.dumps
+        self.loads = orjson.loads
+
+
+def get_codec(name=None):
+    """Return the codec called name, or orjson when installed, else json."""
+    if name is None:
+        name = 'orjson' if orjson is not None else 'json'
+    if name == 'orjson':
+        return OrjsonCodec()
+    if name == 'json':
+        return JsonCodec()
+    raise ValueError('unknown JSON codec: {}'.format(name))
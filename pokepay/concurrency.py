@@ -0,0 +1,125 @@
+import threading
+import requests
+
+_OVERLOAD_TYPES = frozenset(['user_stats_operation_service_unavailable',
+                             'temporarily_unavailable'])
+
+
+def _is_overload(response=None, error=None):
+    # Failures that mean the server (or the path to it) is saturated, as
+    # opposed to client errors that say nothing about load.
+    if error is not None:
+        return isinstance(error, (requests.Timeout, requests.ConnectionError))
+    status_code = getattr(response, 'status_code', 200)
+    if status_code >= 500 or status_code == 429:
+        return True
+    if getattr(response, 'ok', True):
+        return False
+    try:
+        return response.json().get('type') in _OVERLOAD_TYPES
+    except (ValueError, AttributeError):
+        return False
+
+
+def _percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[int(fraction * (len(ordered) - 1))]
+
+
+class AdaptiveLimit(object):
+    """Concurrency limit tuned by additive increase / multiplicative decrease.
+
+    Completed calls are recorded in windows of `window` samples. After a
+    window without overload failures whose p90 latency stays within
+    `tolerance` times the baseline p90, the limit grows by `increase` (only
+    if the limit was actually reached during the window). An overload
+    failure (5xx, 429, timeout, connection error or an
+    user_stats_operation_service_unavailable reply) multiplies the limit by
+    `decrease` right away; failures of calls started before that cut do not
+    cut again.
+
+    Pass an instance as max_concurrency to Client.send_many; `limit` is the
+    current value and stats() returns it with the latest latency figures.
+    """
+
+    def __init__(self, initial=4, min_limit=1, max_limit=64, increase=1,
+                 decrease=0.5, window=20, tolerance=1.5):
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError('expected 1 <= min_limit <= initial <= max_limit')
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.window = window
+        self.tolerance = tolerance
+        self.limit = initial
+        self.in_flight = 0
+        self.baseline = None
+        self.last_p90 = None
+        self.cuts = 0
+        self.samples = []
+        self.failed = False
+        self.saturated = False
+        self.epoch = 0
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        with self.condition:
+            while self.in_flight >= self.limit:
+                self.saturated = True
+                self.condition.wait()
+            self.in_flight += 1
+            if self.in_flight >= self.limit:
+                self.saturated = True
+            return self.epoch
+
+    def release(self, epoch, elapsed=None, overload=False):
+        with self.condition:
+            self.in_flight -= 1
+            if overload:
+                self.failed = True
+                if epoch == self.epoch:
+                    self._cut()
+            elif elapsed is not None:
+                self.samples.append(elapsed)
+            if len(self.samples) >= self.window:
+                self._evaluate()
+            self.condition.notify_all()
+
+    def record(self, epoch, response=None, error=None):
+        elapsed = getattr(response, 'elapsed', None)
+        if elapsed is not None:
+            elapsed = elapsed.total_seconds()
+        self.release(epoch, elapsed, _is_overload(response, error))
+
+    def _cut(self):
+        self.limit = max(self.min_limit, int(self.limit * self.decrease))
+        self.cuts += 1
+        self.epoch += 1
+        self._reset_window()
+
+    def _evaluate(self):
+        p90 = _percentile(self.samples, 0.9)
+        self.last_p90 = p90
+        if self.baseline is None or p90 < self.baseline:
+            self.baseline = p90
+        else:
+            # Let the baseline follow a slowly degrading server.
+            self.baseline += (p90 - self.baseline) * 0.05
+        if (not self.failed and self.saturated
+                and p90 <= self.baseline * self.tolerance):
+            self.limit = min(self.max_limit, self.limit + self.increase)
+        self._reset_window()
+
+    def _reset_window(self):
+        self.samples = []
+        self.failed = False
+        self.saturated = False
+
+    def stats(self):
+        with self.condition:
+            return {'limit': self.limit,
+                    'in_flight': self.in_flight,
+                    'p90': self.last_p90,
+                    'baseline_p90': self.baseline,
+                    'cuts': self.cuts}
@@ -1,9 +1,17 @@
 import base64
+import binascii
 # pip install pycryptodomex
 from Cryptodome.Cipher import AES
 from Cryptodome import Random
 from Cryptodome.Util import Padding
 
+_BLOCK_SIZE = 16
+_URLSAFE_TO_STD = bytes.maketrans(b'-_', b'+/')
+_STD_TO_URLSAFE = bytes.maketrans(b'+/', b'-_')
+# Below this many ciphertext bytes, CBC decryption through the cached ECB
+# key schedule beats building a new AES object per call.
+_ECB_DECRYPT_MAX = 2048
+
 
 def _base64_url_decode(str):
     return base64.urlsafe_b64decode(str + '=' * (-len(str) % 4))
@@ -14,6 +22,19 @@ def _base64_url_encode(bytes):
         '=', '')
 
 
+def _b64url_decode(data):
+    # bytes or str in, bytes out; padding is restored before decoding.
+    if isinstance(data, str):
+        data = data.encode('ascii')
+    data = data.translate(_URLSAFE_TO_STD)
+    return binascii.a2b_base64(data + b'=' * (-len(data) % 4))
+
+
+def _b64url_encode(data):
+    return binascii.b2a_base64(data, newline=False).translate(
+        _STD_TO_URLSAFE).rstrip(b'=')
+
+
 def _encrypt(plaintext, key, block_size=16):
     iv = Random.get_random_bytes(block_size)
     key = _base64_url_decode(key)
@@ -37,11 +58,46 @@ def _decrypt(ciphertext, key, block_size=16):
 
 
 class AESCipher(object):
+    """AES-256-CBC envelope cipher keyed by the base64url CLIENT_SECRET.
+
+    The key is decoded once. encrypt_bytes/decrypt_bytes work on bytes and
+    skip the str round trips of encrypt/decrypt; both pairs produce and
+    accept the same wire format (unpadded base64url of a ciphertext whose
+    first block is the IV).
+    """
+
     def __init__(self, key):
         self.key = key
+        self.key_bytes = _base64_url_decode(key)
+        self.ecb = AES.new(self.key_bytes, AES.MODE_ECB)
+
+    def encrypt_bytes(self, plaintext):
+        # A throwaway first block stands in for sending the IV: the server
+        # decrypts from the second block using the first as IV.
+        pad_size = _BLOCK_SIZE - len(plaintext) % _BLOCK_SIZE
+        cipher = AES.new(self.key_bytes, AES.MODE_CBC,
+                         Random.get_random_bytes(_BLOCK_SIZE))
+        return _b64url_encode(cipher.encrypt(b''.join([
+            b'0' * _BLOCK_SIZE, plaintext, bytes([pad_size]) * pad_size])))
+
+    def decrypt_bytes(self, ciphertext):
+        data = _b64url_decode(ciphertext)
+        size = len(data) - _BLOCK_SIZE
+        if size <= 0 or size % _BLOCK_SIZE:
+            raise ValueError('ciphertext is not a whole number of blocks')
+        if size <= _ECB_DECRYPT_MAX:
+            # CBC: P_i = D(C_i) xor C_(i-1), with C_0 the IV.
+            decrypted = self.ecb.decrypt(memoryview(data)[_BLOCK_SIZE:])
+            plaintext = (int.from_bytes(decrypted, 'big') ^ int.from_bytes(
+                memoryview(data)[:-_BLOCK_SIZE], 'big')).to_bytes(size, 'big')
+        else:
+            cipher = AES.new(self.key_bytes, AES.MODE_CBC,
+                             data[:_BLOCK_SIZE])
+            plaintext = cipher.decrypt(memoryview(data)[_BLOCK_SIZE:])
+        return plaintext[:-plaintext[-1]]
 
     def encrypt(self, plaintext):
-        return _encrypt(plaintext, self.key)
+        return self.encrypt_bytes(plaintext.encode('utf-8')).decode('ascii')
 
     def decrypt(self, ciphertext):
-        return _decrypt(ciphertext, self.key)
+        return self.decrypt_bytes(ciphertext).decode('utf-8')
@@ -0,0 +1,21 @@
+import re
+
+_UUID = re.compile(
+    r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-'
+    r'[0-9a-fA-F]{12}$')
+_STATIC_SEGMENT = re.compile(r'^[a-z]+(-[a-z0-9]+)*$')
+
+
+def path_template(path):
+    """Replace the id segments of a request path with ':id'.
+
+    '/accounts/<uuid>/balances' becomes '/accounts/:id/balances', so that
+    per-endpoint state (rate limits, circuit breakers, timeouts) is keyed
+    on the operation rather than on each resource.
+    """
+    segments = path.split('/')
+    return '/'.join(
+        segment if (not segment or (_STATIC_SEGMENT.match(segment)
+                                    and not _UUID.match(segment)))
+        else ':id'
+        for segment in segments)
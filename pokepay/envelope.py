@@ -0,0 +1,69 @@
+import os
+import threading
+import time
+import pytz
+from datetime import datetime, timezone
+
+# Optional request parameters for which null is meaningful (e.g. UpdateBill
+# amount=None makes an open-amount bill), taken from the nullable request
+# properties in partner.yaml. Any other None-valued parameter is dropped
+# from the envelope.
+_NULLABLE_PARAMS = {
+    'CreateBill': frozenset(['amount']),
+    'CreateCheck': frozenset(['usage_limit']),
+    'UpdateBill': frozenset(['amount']),
+    'UpdateCampaign': frozenset([
+        'amount_based_point_rules', 'applicable_account_metadata',
+        'applicable_days_of_week', 'applicable_shop_ids',
+        'applicable_time_ranges', 'applicable_transaction_metadata',
+        'budget_caps_amount', 'max_point_amount', 'max_total_point_amount',
+        'minimum_number_for_combination_purchase', 'minimum_number_of_amount',
+        'minimum_number_of_products', 'point_expires_at',
+        'point_expires_in_days', 'product_based_point_rules']),
+    'UpdateCheck': frozenset(['point_expires_at', 'point_expires_in_days',
+                              'usage_limit']),
+    'UpdateCoupon': frozenset([
+        'code', 'discount_amount', 'discount_percentage',
+        'discount_upper_limit', 'display_ends_at', 'display_starts_at',
+        'min_amount', 'usage_limit']),
+    'UpdateShop': frozenset(['address', 'email', 'external_id',
+                             'postal_code', 'tel']),
+}
+_NO_NULLABLE_PARAMS = frozenset()
+
+# A fixed UTC offset per zone name, refreshed hourly. Even right after a DST
+# change a stale offset still denotes the same instant, which is all the
+# server's expiry check looks at.
+_ZONE_REFRESH = 3600.0
+_zones = {}
+_zones_lock = threading.Lock()
+
+
+def _fixed_zone(tz):
+    now = time.monotonic()
+    cached = _zones.get(tz)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+    offset = datetime.now(tz=pytz.timezone(tz)).utcoffset()
+    zone = timezone(offset)
+    with _zones_lock:
+        _zones[tz] = (zone, now + _ZONE_REFRESH)
+    return zone
+
+
+def _partner_call_id():
+    # Same format and randomness as str(uuid.uuid4()), at half the cost.
+    h = os.urandom(16).hex()
+    return '{}-{}-4{}-{:x}{}-{}'.format(h[:8], h[8:12], h[13:16],
+                                        8 | (int(h[16], 16) & 3), h[17:20],
+                                        h[20:])
+
+
+def _compact_body_params(request_object):
+    params = request_object.body_params
+    if None not in params.values():
+        return params
+    nullable = _NULLABLE_PARAMS.get(type(request_object).__name__,
+                                    _NO_NULLABLE_PARAMS)
+    return dict((key, value) for key, value in params.items()
+                if value is not None or key in nullable)
@@ -0,0 +1,211 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from .paginate import (AdaptivePageSize, _adaptive, _iter_cursor_pages,
+                       _split_window, _with_params)
+from .pipeline import _ReadAhead
+
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class FileCheckpoint(object):
+    """Export state kept in a JSON file.
+
+    Each save writes a temporary file next to it, fsyncs it and renames it
+    over the old one, so a crash leaves either the previous or the new
+    state on disk.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save(self, state):
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(
+            os.path.abspath(self.path)), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+
+class SqliteCheckpoint(object):
+    """Export state kept in a SQLite database, one row per export name."""
+
+    def __init__(self, path, name='default'):
+        self.name = name
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        with self.db:
+            self.db.execute('CREATE TABLE IF NOT EXISTS pokepay_export '
+                            '(name TEXT PRIMARY KEY, state TEXT NOT NULL)')
+
+    def load(self):
+        with self.lock:
+            row = self.db.execute(
+                'SELECT state FROM pokepay_export WHERE name = ?',
+                (self.name,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save(self, state):
+        with self.lock, self.db:
+            self.db.execute(
+                'INSERT OR REPLACE INTO pokepay_export (name, state) '
+                'VALUES (?, ?)', (self.name, json.dumps(state)))
+
+    def close(self):
+        self.db.close()
+
+
+class LedgerExport(object):
+    """Resumable export of a cursor based list (ListTransactionsV2, ...).
+
+    run(sink) follows the list and calls sink(rows) with the rows of each
+    page; once sink returns the page counts as committed and the position
+    is saved to the checkpoint (a FileCheckpoint or SqliteCheckpoint). The
+    state holds, per shard, the last exported row id (the cursor), the row
+    count and whether the shard is finished, together with the filters it
+    was started with. Running the same export again resumes from there; a
+    checkpoint written for other filters raises ValueError.
+
+    With start and end (datetimes) and shards > 1 the range is cut into
+    that many from/to windows exported concurrently, each checkpointed on
+    its own; sink is still called by one thread at a time. A crash between
+    sink and the save repeats at most that one page per shard on resume.
+    """
+
+    def __init__(self, send, request_object, checkpoint, per_page=1000,
+                 start=None, end=None, shards=1, prefetch=1):
+        self.send = send
+        self.request_object = request_object
+        self.checkpoint = checkpoint
+        self.per_page = _adaptive(per_page)
+        self.start = start
+        self.end = end
+        self.shards = shards
+        self.prefetch = prefetch
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.state = None
+
+    def _filters(self):
+        filters = dict(self.request_object.body_params)
+        if 'start' in filters:
+            filters['from'] = filters.pop('start')
+        if self.start is not None:
+            filters['from'] = self.start.isoformat()
+        if self.end is not None:
+            filters['to'] = self.end.isoformat()
+        return filters
+
+    def _initial_state(self, filters):
+        if self.shards > 1:
+            if self.start is None or self.end is None:
+                raise ValueError('a sharded export needs start and end')
+            # Unlike a WindowScan the shards run independently, so they
+            # must not share boundary rows: from and to are inclusive, and
+            # each shard but the last ends a microsecond before the next.
+            windows = [(start.isoformat(), (end if end == self.end else
+                                            end - _MICROSECOND).isoformat())
+                       for start, end in _split_window(self.start, self.end,
+                                                       self.shards)]
+        else:
+            windows = [(filters.get('from'), filters.get('to'))]
+        return {'path': self.request_object.path, 'filters': filters,
+                'per_page': ('auto' if isinstance(self.per_page,
+                                                  AdaptivePageSize)
+                             else self.per_page),
+                'shards': [{'from': start, 'to': end, 'cursor': None,
+                            'rows': 0, 'done': False}
+                           for start, end in windows]}
+
+    def load(self):
+        filters = self._filters()
+        state = self.checkpoint.load()
+        if state is None:
+            state = self._initial_state(filters)
+            self.checkpoint.save(state)
+        elif (state['path'] != self.request_object.path or
+              state['filters'] != filters):
+            raise ValueError('checkpoint belongs to another export: {} {}'
+                             .format(state['path'], state['filters']))
+        self.state = state
+        return state
+
+    @property
+    def rows(self):
+        return sum(shard['rows'] for shard in self.state['shards'])
+
+    @property
+    def done(self):
+        return all(shard['done'] for shard in self.state['shards'])
+
+    def _run_shard(self, shard, sink):
+        params = {}
+        if shard['from'] is not None:
+            params['from'] = shard['from']
+        if shard['to'] is not None:
+            params['to'] = shard['to']
+        request_object = _with_params(self.request_object, **params)
+        request_object.body_params.pop('start', None)
+        pages = _iter_cursor_pages(self.send, request_object,
+                                   'next_page_cursor_id',
+                                   per_page=self.per_page,
+                                   cursor=shard['cursor'])
+        if self.prefetch:
+            pages = _ReadAhead(pages, self.prefetch)
+        try:
+            for response in pages:
+                if self.stopped.is_set():
+                    return
+                rows = response.body['rows']
+                with self.lock:
+                    if rows:
+                        sink(rows)
+                        shard['cursor'] = rows[-1]['id']
+                        shard['rows'] += len(rows)
+                    if response.body['next_page_cursor_id'] is None:
+                        shard['done'] = True
+                    self.checkpoint.save(self.state)
+            with self.lock:
+                if not shard['done']:
+                    shard['done'] = True
+                    self.checkpoint.save(self.state)
+        except BaseException:
+            self.stopped.set()
+            raise
+        finally:
+            pages.close()
+
+    def run(self, sink):
+        """Export every remaining page to sink; return the total row count."""
+        if self.state is None:
+            self.load()
+        self.stopped.clear()
+        shards = [shard for shard in self.state['shards']
+                  if not shard['done']]
+        if len(shards) <= 1:
+            for shard in shards:
+                self._run_shard(shard, sink)
+        else:
+            with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+                futures = [executor.submit(self._run_shard, shard, sink)
+                           for shard in shards]
+                for future in futures:
+                    future.result()
+        return self.rows
@@ -0,0 +1,192 @@
+import collections
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .concurrency import _percentile
+from .endpoint import path_template
+
+
+def _succeeded(future):
+    return (future.exception() is None
+            and bool(getattr(future.result(), 'ok', False)))
+
+
+class _Race(object):
+    # One hedged call: the primary and the hedge (if any) run on the
+    # policy's executors while the caller waits for the first success.
+
+    def __init__(self, send, request_object):
+        self.send = send
+        self.request_object = request_object
+        self.cond = threading.Condition()
+        self.sent_at = None
+        self.finished = False
+        self.primary = None
+        self.hedge = None
+
+    def notify(self, future=None):
+        with self.cond:
+            self.cond.notify_all()
+
+    def legs(self):
+        return [leg for leg in (self.primary, self.hedge) if leg is not None]
+
+
+class HedgePolicy(object):
+    """Duplicate slow GET requests and keep whichever answer comes first.
+
+    When a GET has not been answered `percentile` latency of the recent
+    calls to its path template after it actually went out (initial_delay
+    until min_samples calls were seen, never less than min_delay), an
+    identical request is sent on another pooled connection. The first
+    successful reply is returned; the other call is cancelled if it has
+    not started yet, or left to finish in the background otherwise.
+    Requests and hedges each run on a pool of max_workers threads (by
+    default POOL_MAXSIZE). Writes are never hedged.
+    """
+
+    def __init__(self, percentile=0.95, min_delay=0.01, initial_delay=0.5,
+                 window=200, min_samples=20, max_workers=10):
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.lock = threading.Lock()
+        self.samples = collections.defaultdict(
+            lambda: collections.deque(maxlen=window))
+        self.primaries = ThreadPoolExecutor(max_workers=max_workers)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.local = threading.local()
+        self.timers = []
+        self.timer_seq = itertools.count()
+        self.timer_cond = threading.Condition(threading.Lock())
+        self.timer_thread = None
+        self.closed = False
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    @classmethod
+    def from_profile(cls, profile, pool_maxsize=10):
+        if profile.get('HEDGE_PERCENTILE') is None:
+            return None
+        return cls(percentile=profile.getfloat('HEDGE_PERCENTILE'),
+                   min_delay=profile.getfloat('HEDGE_MIN_DELAY', 0.01),
+                   initial_delay=profile.getfloat('HEDGE_INITIAL_DELAY', 0.5),
+                   max_workers=profile.getint('HEDGE_WORKERS', pool_maxsize))
+
+    def delay(self, path):
+        with self.lock:
+            samples = self.samples[path_template(path)]
+            if len(samples) < self.min_samples:
+                return max(self.min_delay, self.initial_delay)
+            return max(self.min_delay, _percentile(samples, self.percentile))
+
+    def _record(self, path, seconds):
+        with self.lock:
+            self.samples[path_template(path)].append(seconds)
+
+    def _timed(self, send, request_object):
+        started = time.monotonic()
+        response = send(request_object)
+        if getattr(response, 'ok', False):
+            self._record(request_object.path, time.monotonic() - started)
+        return response
+
+    def sent(self):
+        """Start the hedge timer of the call running on this thread.
+
+        Called by the client right before the request goes out, so that
+        rate limiting and envelope encryption do not count as latency.
+        """
+        race = getattr(self.local, 'race', None)
+        if race is None or race.sent_at is not None:
+            return
+        race.sent_at = time.monotonic()
+        due = race.sent_at + self.delay(race.request_object.path)
+        with self.timer_cond:
+            heapq.heappush(self.timers, (due, next(self.timer_seq), race))
+            if self.timer_thread is None:
+                self.timer_thread = threading.Thread(
+                    target=self._run_timers, name='pokepay-hedge-timer',
+                    daemon=True)
+                self.timer_thread.start()
+            self.timer_cond.notify()
+
+    def _run_timers(self):
+        while True:
+            with self.timer_cond:
+                while not self.closed:
+                    if not self.timers:
+                        self.timer_cond.wait()
+                        continue
+                    wait_for = self.timers[0][0] - time.monotonic()
+                    if wait_for <= 0:
+                        break
+                    self.timer_cond.wait(wait_for)
+                if self.closed:
+                    return
+                race = heapq.heappop(self.timers)[2]
+            self._fire(race)
+
+    def _fire(self, race):
+        with race.cond:
+            if race.finished:
+                return
+            race.hedge = self.executor.submit(self._timed, race.send,
+                                              race.request_object)
+            race.hedge.add_done_callback(race.notify)
+            race.cond.notify_all()
+        with self.lock:
+            self.hedged += 1
+
+    def _primary(self, race):
+        # The hedge timer starts from sent(), once this worker has got past
+        # rate limiting and encryption and the request goes out.
+        self.local.race = race
+        try:
+            response = race.send(race.request_object)
+        finally:
+            self.local.race = None
+        if getattr(response, 'ok', False) and race.sent_at is not None:
+            self._record(race.request_object.path,
+                         time.monotonic() - race.sent_at)
+        return response
+
+    def call(self, send, request_object):
+        if request_object.method != 'GET':
+            return send(request_object)
+        race = _Race(send, request_object)
+        race.primary = self.primaries.submit(self._primary, race)
+        race.primary.add_done_callback(race.notify)
+        with race.cond:
+            while True:
+                legs = race.legs()
+                winner = next((leg for leg in legs
+                               if leg.done() and _succeeded(leg)), None)
+                if winner is not None or all(leg.done() for leg in legs):
+                    break
+                race.cond.wait()
+            race.finished = True
+        for leg in legs:
+            if leg is not winner:
+                leg.cancel()
+        if winner is None:
+            winner = race.primary
+        elif winner is race.hedge:
+            with self.lock:
+                self.hedge_wins += 1
+        return winner.result()
+
+    def stats(self):
+        with self.lock:
+            return {'hedged': self.hedged, 'hedge_wins': self.hedge_wins}
+
+    def close(self):
+        with self.timer_cond:
+            self.closed = True
+            self.timer_cond.notify()
+        self.primaries.shutdown(wait=False)
+        self.executor.shutdown(wait=False)
@@ -0,0 +1,110 @@
+# Runtime for the generated row models in pokepay.models.
+
+_MODELS = {}
+
+
+class RowList(object):
+    """A list of row dicts seen through a model, one wrapper per access."""
+
+    __slots__ = ('_rows', '_model')
+
+    def __init__(self, rows, model):
+        self._rows = rows
+        self._model = model
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RowList(self._rows[index], self._model)
+        return self._model(self._rows[index])
+
+    def __iter__(self):
+        model = self._model
+        for row in self._rows:
+            yield model(row)
+
+    def __repr__(self):
+        return '<RowList of {} {}>'.format(len(self._rows),
+                                          self._model.__name__)
+
+
+class _Field(object):
+    # Reads key from the wrapped dict. A field holding another schema (or
+    # a list of them) is wrapped on first access and kept for the next.
+
+    __slots__ = ('key', 'model', 'many')
+
+    def __init__(self, key, model=None, many=False):
+        self.key = key
+        self.model = model
+        self.many = many
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        try:
+            value = obj._data[self.key]
+        except KeyError:
+            raise AttributeError(self.key)
+        if self.model is None or value is None:
+            return value
+        if obj._nested is None:
+            obj._nested = {}
+        elif self.key in obj._nested:
+            return obj._nested[self.key]
+        model = _MODELS[self.model]
+        value = RowList(value, model) if self.many else model(value)
+        obj._nested[self.key] = value
+        return value
+
+
+def _field(key, model=None, many=False):
+    return _Field(key, model, many)
+
+
+class Model(object):
+    """Typed, read-only view of a decoded JSON object.
+
+    The dict is wrapped as is, not copied: building a model costs one
+    small object, and fields are looked up only when read. Nested objects
+    become models on first access. A field missing from the dict raises
+    AttributeError; the dict itself is available as to_dict() and through
+    item access (model['id']).
+    """
+
+    __slots__ = ('_data', '_nested')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _MODELS[cls.__name__] = cls
+
+    def __init__(self, data):
+        self._data = data
+        self._nested = None
+
+    def to_dict(self):
+        return self._data
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self._data == other._data
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        if 'id' in self._data:
+            return '<{} id={}>'.format(type(self).__name__, self._data['id'])
+        return '<{}>'.format(type(self).__name__)
+
+
+def typed_rows(response):
+    """The rows of a paginated response as a RowList of their model."""
+    from .models import ROW_MODELS
+    return RowList(response.rows, _MODELS[ROW_MODELS[type(response).__name__]])
@@ -0,0 +1,763 @@
+# DO NOT EDIT: File is generated by code generator.
+
+from pokepay.model import Model, _field
+
+
+class Pong(Model):
+    __slots__ = ()
+    pong = _field('pong')
+
+
+class Echo(Model):
+    __slots__ = ()
+    status = _field('status')
+    message = _field('message')
+
+
+class Pagination(Model):
+    __slots__ = ()
+    current = _field('current')
+    per_page = _field('per_page')
+    max_page = _field('max_page')
+    has_prev = _field('has_prev')
+    has_next = _field('has_next')
+
+
+class AdminUserWithShopsAndPrivateMoneys(Model):
+    __slots__ = ()
+    id = _field('id')
+    role = _field('role')
+    email = _field('email')
+    name = _field('name')
+    is_active = _field('is_active')
+    organization = _field('organization', 'Organization')
+    shops = _field('shops', 'User', many=True)
+    private_moneys = _field('private_moneys', 'PrivateMoney', many=True)
+
+
+class Account(Model):
+    __slots__ = ()
+    id = _field('id')
+    name = _field('name')
+    is_suspended = _field('is_suspended')
+    status = _field('status')
+    private_money = _field('private_money', 'PrivateMoney')
+
+
+class AccountWithUser(Model):
+    __slots__ = ()
+    id = _field('id')
+    name = _field('name')
+    is_suspended = _field('is_suspended')
+    status = _field('status')
+    private_money = _field('private_money', 'PrivateMoney')
+    user = _field('user', 'User')
+
+
+class AccountDetail(Model):
+    __slots__ = ()
+    id = _field('id')
+    name = _field('name')
+    is_suspended = _field('is_suspended')
+    status = _field('status')
+    balance = _field('balance')
+    money_balance = _field('money_balance')
+    point_balance = _field('point_balance')
+    point_debt = _field('point_debt')
+    private_money = _field('private_money', 'PrivateMoney')
+    user = _field('user', 'User')
+    external_id = _field('external_id')
+
+
+class ShopAccount(Model):
+    __slots__ = ()
+    id = _field('id')
+    name = _field('name')
+    is_suspended = _field('is_suspended')
+    can_transfer_topup = _field('can_transfer_topup')
+    private_money = _field('private_money', 'PrivateMoney')
+
+
+class AccountBalance(Model):
+    __slots__ = ()
+    expires_at = _field('expires_at')
+    money_amount = _field('money_amount')
+    point_amount = _field('point_amount')
+
+
+class Bill(Model):
+    __slots__ = ()
+    id = _field('id')
+    amount = _field('amount')
+    max_amount = _field('max_amount')
+    min_amount = _field('min_amount')
+    description = _field('description')
+    account = _field('account', 'AccountWithUser')
+    is_disabled = _field('is_disabled')
+    token = _field('token')
+
+
+class Check(Model):
+    __slots__ = ()
+    id = _field('id')
+    created_at = _field('created_at')
+    amount = _field('amount')
+    money_amount = _field('money_amount')
+    point_amount = _field('point_amount')
+    description = _field('description')
+    user = _field('user', 'User')
+    is_onetime = _field('is_onetime')
+    is_disabled = _field('is_disabled')
+    expires_at = _field('expires_at')
+    last_used_at = _field('last_used_at')
+    private_money = _field('private_money', 'PrivateMoney')
+    usage_limit = _field('usage_limit')
+    usage_count = _field('usage_count')
+    point_expires_at = _field('point_expires_at')
+    point_expires_in_days = _field('point_expires_in_days')
+    token = _field('token')
+
+
+class PaginatedChecks(Model):
+    __slots__ = ()
+    rows = _field('rows', 'Check', many=True)
+    count = _field('count')
+    pagination = _field('pagination', 'Pagination')
+
+
+class CpmToken(Model):
+    __slots__ = ()
+    cpm_token = _field('cpm_token')
+    account = _field('account', 'AccountDetail')
+    transaction = _field('transaction', 'Transaction')
+    event = _field('event', 'ExternalTransaction')
+    scopes = _field('scopes')
+    expires_at = _field('expires_at')
+    metadata = _field('metadata')
+
+
+class Cashtray(Model):
+    __slots__ = ()
+    id = _field('id')
+    amount = _field('amount')
+    description = _field('description')
+    account = _field('account', 'AccountWithUser')
+    expires_at = _field('expires_at')
+    canceled_at = _field('canceled_at')
+    token = _field('token')
+
+
+class CashtrayWithResult(Model):
+    __slots__ = ()
+    id = _field('id')
+    amount = _field('amount')
+    description = _field('description')
+    account = _field('account', 'AccountWithUser')
+    expires_at = _field('expires_at')
+    canceled_at = _field('canceled_at')
+    token = _field('token')
+    attempt = _field('attempt', 'CashtrayAttempt')
+    transaction = _field('transaction', 'Transaction')
+
+
+class CashtrayAttempt(Model):
+    __slots__ = ()
+    account = _field('account', 'AccountWithUser')
+    status_code = _field('status_code')
+    error_type = _field('error_type')
+    error_message = _field('error_message')
+    created_at = _field('created_at')
+
+
+class User(Model):
+    __slots__ = ()
+    id = _field('id')
+    name = _field('name')
+    is_merchant = _field('is_merchant')
+
+
+class PrivateMoney(Model):
+    __slots__ = ()
+    id = _field('id')
+    name = _field('name')
+    unit = _field('unit')
+    is_exclusive = _field('is_exclusive')
+    description = _field('description')
+    oneline_message = _field('oneline_message')
+    organization = _field('organization', 'Organization')
+    max_balance = _field('max_balance')
+    transfer_limit = _field('transfer_limit')
+    money_topup_transfer_limit = _field('money_topup_transfer_limit')
+    type = _field('type')
+    expiration_type = _field('expiration_type')
+    enable_topup_by_member = _field('enable_topup_by_member')
+    display_money_and_point = _field('display_money_and_point')
+
+
+class Organization(Model):
+    __slots__ = ()
+    code = _field('code')
+    name = _field('name')
+
+
+class Transaction(Model):
+    __slots__ = ()
+    id = _field('id')
+    type = _field('type')
+    is_modified = _field('is_modified')
+    sender = _field('sender', 'User')
+    sender_account = _field('sender_account', 'Account')
+    receiver = _field('receiver', 'User')
+    receiver_account = _field('receiver_account', 'Account')
+    amount = _field('amount')
+    money_amount = _field('money_amount')
+    point_amount = _field('point_amount')
+    raw_point_amount = _field('raw_point_amount')
+    campaign_point_amount = _field('campaign_point_amount')
+    done_at = _field('done_at')
+    description = _field('description')
+
+
+class TransactionDetail(Model):
+    __slots__ = ()
+    id = _field('id')
+    type = _field('type')
+    is_modified = _field('is_modified')
+    sender = _field('sender', 'User')
+    sender_account = _field('sender_account', 'Account')
+    receiver = _field('receiver', 'User')
+    receiver_account = _field('receiver_account', 'Account')
+    amount = _field('amount')
+    money_amount = _field('money_amount')
+    point_amount = _field('point_amount')
+    raw_point_amount = _field('raw_point_amount')
+    campaign_point_amount = _field('campaign_point_amount')
+    done_at = _field('done_at')
+    description = _field('description')
+    transfers = _field('transfers', 'Transfer', many=True)
+
+
+class ShopWithMetadata(Model):
+    __slots__ = ()
+    id = _field('id')
+    name = _field('name')
+    organization_code = _field('organization_code')
+    status = _field('status')
+    postal_code = _field('postal_code')
+    address = _field('address')
+    tel = _field('tel')
+    email = _field('email')
+    external_id = _field('external_id')
+
+
+class ShopWithAccounts(Model):
+    __slots__ = ()
+    id = _field('id')
+    name = _field('name')
+    organization_code = _field('organization_code')
+    status = _field('status')
+    postal_code = _field('postal_code')
+    address = _field('address')
+    tel = _field('tel')
+    email = _field('email')
+    external_id = _field('external_id')
+    accounts = _field('accounts', 'ShopAccount', many=True)
+
+
+class BulkTransaction(Model):
+    __slots__ = ()
+    id = _field('id')
+    request_id = _field('request_id')
+    name = _field('name')
+    description = _field('description')
+    status = _field('status')
+    error = _field('error')
+    error_lineno = _field('error_lineno')
+    submitted_at = _field('submitted_at')
+    updated_at = _field('updated_at')
+
+
+class BulkTransactionJob(Model):
+    __slots__ = ()
+    id = _field('id')
+    bulk_transaction = _field('bulk_transaction', 'BulkTransaction')
+    type = _field('type')
+    sender_account_id = _field('sender_account_id')
+    receiver_account_id = _field('receiver_account_id')
+    money_amount = _field('money_amount')
+    point_amount = _field('point_amount')
+    description = _field('description')
+    bear_point_account_id = _field('bear_point_account_id')
+    point_expires_at = _field('point_expires_at')
+    status = _field('status')
+    error = _field('error')
+    lineno = _field('lineno')
+    transaction_id = _field('transaction_id')
+    created_at = _field('created_at')
+    updated_at = _field('updated_at')
+
+
+class PaginatedBulkTransactionJob(Model):
+    __slots__ = ()
+    rows = _field('rows', 'BulkTransactionJob', many=True)
+    count = _field('count')
+    pagination = _field('pagination', 'Pagination')
+
+
+class AccountWithoutPrivateMoneyDetail(Model):
+    __slots__ = ()
+    id = _field('id')
+    name = _field('name')
+    is_suspended = _field('is_suspended')
+    status = _field('status')
+    private_money_id = _field('private_money_id')
+    user = _field('user', 'User')
+
+
+class Transfer(Model):
+    __slots__ = ()
+    id = _field('id')
+    sender_account = _field(
+        'sender_account', 'AccountWithoutPrivateMoneyDetail')
+    receiver_account = _field(
+        'receiver_account', 'AccountWithoutPrivateMoneyDetail')
+    amount = _field('amount')
+    money_amount = _field('money_amount')
+    point_amount = _field('point_amount')
+    done_at = _field('done_at')
+    type = _field('type')
+    description = _field('description')
+    transaction_id = _field('transaction_id')
+
+
+class ExternalTransaction(Model):
+    __slots__ = ()
+    id = _field('id')
+    is_modified = _field('is_modified')
+    sender = _field('sender', 'User')
+    sender_account = _field('sender_account', 'Account')
+    receiver = _field('receiver', 'User')
+    receiver_account = _field('receiver_account', 'Account')
+    amount = _field('amount')
+    done_at = _field('done_at')
+    description = _field('description')
+
+
+class ExternalTransactionDetail(Model):
+    __slots__ = ()
+    id = _field('id')
+    is_modified = _field('is_modified')
+    sender = _field('sender', 'User')
+    sender_account = _field('sender_account', 'Account')
+    receiver = _field('receiver', 'User')
+    receiver_account = _field('receiver_account', 'Account')
+    amount = _field('amount')
+    done_at = _field('done_at')
+    description = _field('description')
+    transaction = _field('transaction', 'TransactionDetail')
+
+
+class Product(Model):
+    __slots__ = ()
+    jan_code = _field('jan_code')
+    name = _field('name')
+    unit_price = _field('unit_price')
+    price = _field('price')
+    quantity = _field('quantity')
+    is_discounted = _field('is_discounted')
+    other = _field('other')
+
+
+class OrganizationSummary(Model):
+    __slots__ = ()
+    count = _field('count')
+    money_amount = _field('money_amount')
+    money_count = _field('money_count')
+    point_amount = _field('point_amount')
+    raw_point_amount = _field('raw_point_amount')
+    campaign_point_amount = _field('campaign_point_amount')
+    point_count = _field('point_count')
+
+
+class PrivateMoneyOrganizationSummary(Model):
+    __slots__ = ()
+    organization_code = _field('organization_code')
+    topup = _field('topup', 'OrganizationSummary')
+    payment = _field('payment', 'OrganizationSummary')
+
+
+class PaginatedPrivateMoneyOrganizationSummaries(Model):
+    __slots__ = ()
+    rows = _field('rows', 'PrivateMoneyOrganizationSummary', many=True)
+    count = _field('count')
+    pagination = _field('pagination', 'Pagination')
+
+
+class PrivateMoneySummary(Model):
+    __slots__ = ()
+    topup_amount = _field('topup_amount')
+    refunded_topup_amount = _field('refunded_topup_amount')
+    payment_amount = _field('payment_amount')
+    refunded_payment_amount = _field('refunded_payment_amount')
+    added_point_amount = _field('added_point_amount')
+    topup_point_amount = _field('topup_point_amount')
+    campaign_point_amount = _field('campaign_point_amount')
+    refunded_added_point_amount = _field('refunded_added_point_amount')
+    exchange_inflow_amount = _field('exchange_inflow_amount')
+    exchange_outflow_amount = _field('exchange_outflow_amount')
+    transaction_count = _field('transaction_count')
+
+
+class UserStatsOperation(Model):
+    __slots__ = ()
+    id = _field('id')
+    start = _field('from')
+    to = _field('to')
+    status = _field('status')
+    error_reason = _field('error_reason')
+    done_at = _field('done_at')
+    file_url = _field('file_url')
+    requested_at = _field('requested_at')
+
+
+class UserDevice(Model):
+    __slots__ = ()
+    id = _field('id')
+    user = _field('user', 'User')
+    is_active = _field('is_active')
+    metadata = _field('metadata')
+
+
+class BankRegisteringInfo(Model):
+    __slots__ = ()
+    redirect_url = _field('redirect_url')
+    paytree_customer_number = _field('paytree_customer_number')
+
+
+class Bank(Model):
+    __slots__ = ()
+    id = _field('id')
+    private_money = _field('private_money', 'PrivateMoney')
+    bank_name = _field('bank_name')
+    bank_code = _field('bank_code')
+    branch_number = _field('branch_number')
+    branch_name = _field('branch_name')
+    deposit_type = _field('deposit_type')
+    masked_account_number = _field('masked_account_number')
+    account_name = _field('account_name')
+
+
+class Banks(Model):
+    __slots__ = ()
+    rows = _field('rows', 'Bank', many=True)
+    count = _field('count')
+
+
+class PaginatedTransaction(Model):
+    __slots__ = ()
+    rows = _field('rows', 'Transaction', many=True)
+    count = _field('count')
+    pagination = _field('pagination', 'Pagination')
+
+
+class PaginatedTransactionV2(Model):
+    __slots__ = ()
+    rows = _field('rows', 'Transaction', many=True)
+    per_page = _field('per_page')
+    count = _field('count')
+    next_page_cursor_id = _field('next_page_cursor_id')
+    prev_page_cursor_id = _field('prev_page_cursor_id')
+
+
+class PaginatedTransfers(Model):
+    __slots__ = ()
+    rows = _field('rows', 'Transfer', many=True)
+    count = _field('count')
+    pagination = _field('pagination', 'Pagination')
+
+
+class PaginatedTransfersV2(Model):
+    __slots__ = ()
+    rows = _field('rows', 'Transfer', many=True)
+    per_page = _field('per_page')
+    count = _field('count')
+    next_page_cursor_id = _field('next_page_cursor_id')
+    prev_page_cursor_id = _field('prev_page_cursor_id')
+
+
+class PaginatedAccounts(Model):
+    __slots__ = ()
+    rows = _field('rows', 'Account', many=True)
+    count = _field('count')
+    pagination = _field('pagination', 'Pagination')
+
+
+class PaginatedAccountWithUsers(Model):
+    __slots__ = ()
+    rows = _field('rows', 'AccountWithUser', many=True)
+    count = _field('count')
+    pagination = _field('pagination', 'Pagination')
+
+
+class PaginatedAccountDetails(Model):
+    __slots__ = ()
+    rows = _field('rows', 'AccountDetail', many=True)
+    count = _field('count')
+    pagination = _field('pagination', 'Pagination')
+
+
+class PaginatedAccountBalance(Model):
+    __slots__ = ()
+    rows = _field('rows', 'AccountBalance', many=True)
+    count = _field('count')
+    pagination = _field('pagination', 'Pagination')
+
+
+class PaginatedShops(Model):
+    __slots__ = ()
+    rows = _field('rows', 'ShopWithMetadata', many=True)
+    count = _field('count')
+    pagination = _field('pagination', 'Pagination')
+
+
+class PaginatedBills(Model):
+    __slots__ = ()
+    rows = _field('rows', 'Bill', many=True)
+    count = _field('count')
+    pagination = _field('pagination', 'Pagination')
+
+
+class PaginatedPrivateMoneys(Model):
+    __slots__ = ()
+    rows = _field('rows', 'PrivateMoney', many=True)
+    count = _field('count')
+    pagination = _field('pagination', 'Pagination')
+
+
+class Campaign(Model):
+    __slots__ = ()
+    id = _field('id')
+    name = _field('name')
+    applicable_shops = _field('applicable_shops', 'User', many=True)
+    is_exclusive = _field('is_exclusive')
+    starts_at = _field('starts_at')
+    ends_at = _field('ends_at')
+    point_expires_at = _field('point_expires_at')
+    point_expires_in_days = _field('point_expires_in_days')
+    priority = _field('priority')
+    description = _field('description')
+    bear_point_shop = _field('bear_point_shop', 'User')
+    private_money = _field('private_money', 'PrivateMoney')
+    dest_private_money = _field('dest_private_money', 'PrivateMoney')
+    max_total_point_amount = _field('max_total_point_amount')
+    point_calculation_rule = _field('point_calculation_rule')
+    point_calculation_rule_object = _field('point_calculation_rule_object')
+    status = _field('status')
+    budget_caps_amount = _field('budget_caps_amount')
+    budget_current_amount = _field('budget_current_amount')
+    budget_current_time = _field('budget_current_time')
+
+
+class PaginatedCampaigns(Model):
+    __slots__ = ()
+    rows = _field('rows', 'Campaign', many=True)
+    count = _field('count')
+    pagination = _field('pagination', 'Pagination')
+
+
+class AccountTransferSummaryElement(Model):
+    __slots__ = ()
+    transfer_type = _field('transfer_type')
+    money_amount = _field('money_amount')
+    point_amount = _field('point_amount')
+    count = _field('count')
+
+
+class AccountTransferSummary(Model):
+    __slots__ = ()
+    summaries = _field('summaries', 'AccountTransferSummaryElement', many=True)
+
+
+class OrganizationWorkerTaskWebhook(Model):
+    __slots__ = ()
+    id = _field('id')
+    organization_code = _field('organization_code')
+    task = _field('task')
+    url = _field('url')
+    content_type = _field('content_type')
+    is_active = _field('is_active')
+
+
+class PaginatedOrganizationWorkerTaskWebhook(Model):
+    __slots__ = ()
+    rows = _field('rows', 'OrganizationWorkerTaskWebhook', many=True)
+    count = _field('count')
+    pagination = _field('pagination', 'Pagination')
+
+
+class Coupon(Model):
+    __slots__ = ()
+    id = _field('id')
+    name = _field('name')
+    issued_shop = _field('issued_shop', 'User')
+    description = _field('description')
+    discount_amount = _field('discount_amount')
+    discount_percentage = _field('discount_percentage')
+    discount_upper_limit = _field('discount_upper_limit')
+    starts_at = _field('starts_at')
+    ends_at = _field('ends_at')
+    display_starts_at = _field('display_starts_at')
+    display_ends_at = _field('display_ends_at')
+    usage_limit = _field('usage_limit')
+    min_amount = _field('min_amount')
+    is_shop_specified = _field('is_shop_specified')
+    is_hidden = _field('is_hidden')
+    is_public = _field('is_public')
+    code = _field('code')
+    is_disabled = _field('is_disabled')
+    token = _field('token')
+
+
+class CouponDetail(Model):
+    __slots__ = ()
+    id = _field('id')
+    name = _field('name')
+    issued_shop = _field('issued_shop', 'User')
+    description = _field('description')
+    discount_amount = _field('discount_amount')
+    discount_percentage = _field('discount_percentage')
+    discount_upper_limit = _field('discount_upper_limit')
+    starts_at = _field('starts_at')
+    ends_at = _field('ends_at')
+    display_starts_at = _field('display_starts_at')
+    display_ends_at = _field('display_ends_at')
+    usage_limit = _field('usage_limit')
+    min_amount = _field('min_amount')
+    is_shop_specified = _field('is_shop_specified')
+    is_hidden = _field('is_hidden')
+    is_public = _field('is_public')
+    code = _field('code')
+    is_disabled = _field('is_disabled')
+    token = _field('token')
+    coupon_image = _field('coupon_image')
+    available_shops = _field('available_shops', 'User', many=True)
+    private_money = _field('private_money', 'PrivateMoney')
+
+
+class PaginatedCoupons(Model):
+    __slots__ = ()
+    rows = _field('rows', 'Coupon', many=True)
+    count = _field('count')
+    pagination = _field('pagination', 'Pagination')
+
+
+class PaginatedOrganizations(Model):
+    __slots__ = ()
+    rows = _field('rows', 'Organization', many=True)
+    count = _field('count')
+    pagination = _field('pagination', 'Pagination')
+
+
+class PartnerClientNotFound(Model):
+    __slots__ = ()
+    type = _field('type')
+    message = _field('message')
+
+
+class PartnerDecryptionFailed(Model):
+    __slots__ = ()
+    type = _field('type')
+    message = _field('message')
+
+
+class PartnerRequestExpired(Model):
+    __slots__ = ()
+    type = _field('type')
+    message = _field('message')
+
+
+class PartnerRequestAlreadyDone(Model):
+    __slots__ = ()
+    type = _field('type')
+    message = _field('message')
+
+
+class InvalidParameters(Model):
+    __slots__ = ()
+    type = _field('type')
+    message = _field('message')
+    errors = _field('errors')
+
+
+class Forbidden(Model):
+    __slots__ = ()
+    type = _field('type')
+    message = _field('message')
+
+
+class UnpermittedAdminUser(Model):
+    __slots__ = ()
+    type = _field('type')
+    message = _field('message')
+
+
+class NotFound(Model):
+    __slots__ = ()
+    type = _field('type')
+    message = _field('message')
+
+
+class UnprocessableEntity(Model):
+    __slots__ = ()
+    type = _field('type')
+    message = _field('message')
+
+
+class Conflict(Model):
+    __slots__ = ()
+    type = _field('type')
+    message = _field('message')
+
+
+class TemporarilyUnavailable(Model):
+    __slots__ = ()
+    type = _field('type')
+    message = _field('message')
+
+
+class UserStatsOperationServiceUnavailable(Model):
+    __slots__ = ()
+    type = _field('type')
+    message = _field('message')
+
+
+class PrivateMoneyNotAvailable(Model):
+    __slots__ = ()
+    type = _field('type')
+    message = _field('message')
+    object = _field('object')
+
+
+# Model of the rows of each paginated schema.
+ROW_MODELS = {
+    'Banks': 'Bank',
+    'PaginatedAccountBalance': 'AccountBalance',
+    'PaginatedAccountDetails': 'AccountDetail',
+    'PaginatedAccountWithUsers': 'AccountWithUser',
+    'PaginatedAccounts': 'Account',
+    'PaginatedBills': 'Bill',
+    'PaginatedBulkTransactionJob': 'BulkTransactionJob',
+    'PaginatedCampaigns': 'Campaign',
+    'PaginatedChecks': 'Check',
+    'PaginatedCoupons': 'Coupon',
+    'PaginatedOrganizationWorkerTaskWebhook': 'OrganizationWorkerTaskWebhook',
+    'PaginatedOrganizations': 'Organization',
+    'PaginatedPrivateMoneyOrganizationSummaries':
+        'PrivateMoneyOrganizationSummary',
+    'PaginatedPrivateMoneys': 'PrivateMoney',
+    'PaginatedShops': 'ShopWithMetadata',
+    'PaginatedTransaction': 'Transaction',
+    'PaginatedTransactionV2': 'Transaction',
+    'PaginatedTransfers': 'Transfer',
+    'PaginatedTransfersV2': 'Transfer',
+}
@@ -0,0 +1,80 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from .codec import get_codec
+from .crypto import AESCipher
+
+# Per worker process state, set up once by _init_worker.
+_worker_cipher = None
+_worker_codec = None
+
+
+def _init_worker(client_secret, codec_name):
+    global _worker_cipher, _worker_codec
+    _worker_cipher = AESCipher(client_secret)
+    _worker_codec = get_codec(codec_name)
+
+
+def _decode_in_worker(content):
+    res_dict = _worker_codec.loads(content)
+    return _worker_codec.loads(
+        _worker_cipher.decrypt_bytes(res_dict['response_data']))
+
+
+class DecodeOffload(object):
+    """Decrypt and parse large response bodies in worker processes.
+
+    Bodies of at least `threshold` bytes are shipped as raw bytes to a
+    process pool that runs the same decrypt-and-parse as Client.send and
+    returns the parsed body (pickled, which is much cheaper to load than
+    decrypting and parsing JSON). The calling thread only waits, so the
+    GIL stays available to the rest of the process. Smaller bodies are
+    decoded inline because the round trip would cost more than it saves.
+
+    The pool uses the 'spawn' start method, which is safe in processes
+    that already run threads, and is started on first use.
+    """
+
+    def __init__(self, client_secret, threshold=256 * 1024, max_workers=None,
+                 codec_name=None):
+        self.client_secret = client_secret
+        self.threshold = threshold
+        self.max_workers = max_workers
+        self.codec_name = codec_name
+        self.lock = threading.Lock()
+        self.executor = None
+        self.offloaded = 0
+
+    @classmethod
+    def from_profile(cls, profile, codec_name=None):
+        if profile.get('OFFLOAD_THRESHOLD') is None:
+            return None
+        return cls(profile.get('CLIENT_SECRET'),
+                   threshold=profile.getint('OFFLOAD_THRESHOLD'),
+                   max_workers=profile.getint('OFFLOAD_WORKERS', None),
+                   codec_name=codec_name)
+
+    def _get_executor(self):
+        with self.lock:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(self.client_secret, self.codec_name))
+            return self.executor
+
+    def should_offload(self, content):
+        return len(content) >= self.threshold
+
+    def decode(self, content):
+        future = self._get_executor().submit(_decode_in_worker, content)
+        with self.lock:
+            self.offloaded += 1
+        return future.result()
+
+    def close(self):
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown()
+                self.executor = None
@@ -0,0 +1,558 @@
+import collections
+import copy
+import math
+import threading
+import time
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+from .batch import _dispatch
+from .pipeline import _ReadAhead
+
+
+class PageError(Exception):
+    """Raised while iterating when a page request gets a non-2xx reply."""
+
+    def __init__(self, page, response):
+        super().__init__('page {} failed with status {}'.format(
+            page, response.status_code))
+        self.page = page
+        self.response = response
+
+
+def _with_params(request_object, **params):
+    # A shallow copy with its own body_params, so the caller's request
+    # object is left untouched.
+    request_object = copy.copy(request_object)
+    request_object.body_params = dict(request_object.body_params, **params)
+    return request_object
+
+
+# per_page maxima from partner.yaml; other lists only have a minimum.
+_PER_PAGE_MAX = {
+    'ListCampaigns': 50,
+    'ListTransactionsV2': 1000,
+    'ListTransfersV2': 1000,
+}
+
+
+class AdaptivePageSize(object):
+    """per_page tuned towards a target page latency.
+
+    Pass one (or per_page='auto') to the iterate helpers instead of a
+    fixed per_page. Each full page records the wall time of its call,
+    which covers the network, reading the body and decrypting and parsing
+    it. The size is then scaled by target_latency / latency, by at most
+    half or double per page and only when the latency is off by more than
+    a quarter. It stays within [min_size, max_size], the maximum of the
+    list in partner.yaml, and the size at which a body would exceed
+    max_bytes. stats() reports the current size and the smoothed page
+    measurements.
+    """
+
+    def __init__(self, initial=100, target_latency=1.0, min_size=10,
+                 max_size=1000, max_bytes=8 * 1024 * 1024, alpha=0.3):
+        self.per_page = initial
+        self.target_latency = target_latency
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.alpha = alpha
+        self.lock = threading.Lock()
+        self.pages = 0
+        self.latency = None
+        self.network = None
+        self.bytes_per_row = None
+
+    def size(self, request_object=None):
+        limit = _PER_PAGE_MAX.get(type(request_object).__name__,
+                                  self.max_size)
+        return max(1, min(self.per_page, self.max_size, limit))
+
+    def _smooth(self, current, sample):
+        if current is None:
+            return sample
+        return current + self.alpha * (sample - current)
+
+    def record(self, per_page, response, seconds):
+        rows = len(response.body.get('rows') or ())
+        if rows < per_page:
+            # The last page of a list says nothing about larger pages.
+            return
+        elapsed = getattr(response, 'elapsed', None)
+        length = response.headers.get('Content-Length')
+        with self.lock:
+            self.pages += 1
+            self.latency = self._smooth(self.latency, seconds)
+            if elapsed is not None:
+                self.network = self._smooth(self.network,
+                                            elapsed.total_seconds())
+            if length is not None:
+                self.bytes_per_row = self._smooth(self.bytes_per_row,
+                                                  int(length) / rows)
+            ratio = self.target_latency / max(seconds, 1e-6)
+            if 0.8 <= ratio <= 1.25:
+                return
+            size = int(per_page * min(2.0, max(0.5, ratio)))
+            if self.bytes_per_row:
+                size = min(size, int(self.max_bytes / self.bytes_per_row))
+            self.per_page = max(self.min_size, min(self.max_size, size))
+
+    def stats(self):
+        with self.lock:
+            decode = None
+            if self.latency is not None and self.network is not None:
+                decode = max(0.0, self.latency - self.network)
+            return {'per_page': self.per_page, 'pages': self.pages,
+                    'latency': self.latency, 'network': self.network,
+                    'decode': decode, 'bytes_per_row': self.bytes_per_row}
+
+
+def _adaptive(per_page):
+    if per_page == 'auto':
+        return AdaptivePageSize()
+    return per_page
+
+
+def _page_size(per_page, request_object):
+    if isinstance(per_page, AdaptivePageSize):
+        return per_page.size(request_object)
+    return per_page
+
+
+def _send_page(send, request_object, per_page):
+    # Send a page request, feeding its wall time to an AdaptivePageSize.
+    if not isinstance(per_page, AdaptivePageSize):
+        return send(request_object)
+    started = time.monotonic()
+    response = send(request_object)
+    if response.ok:
+        per_page.record(request_object.body_params['per_page'], response,
+                        time.monotonic() - started)
+    return response
+
+
+class PageIterator(object):
+    """Rows of a page-based list request (one with a `pagination` object).
+
+    Pages are requested one at a time with page=start_page, start_page+1,
+    ... until the last page, max_pages pages or limit rows. While the rows
+    of one page are being consumed the next page is already requested in
+    the background (unless prefetch is False), so at most the current and
+    the next page are held in memory. Stopping the iteration early (break,
+    close) does not request further pages. pagination and count describe
+    the last page received.
+
+    per_page may be an AdaptivePageSize (or 'auto'). When the size
+    changes, the page that holds the next unread row is requested with the
+    new size and the rows before it, already yielded, are skipped.
+    """
+
+    def __init__(self, send, request_object, per_page=None, start_page=1,
+                 max_pages=None, limit=None, prefetch=True):
+        self.send = send
+        self.request_object = request_object
+        self.per_page = _adaptive(per_page)
+        self.start_page = start_page
+        self.max_pages = max_pages
+        self.limit = limit
+        self.prefetch = prefetch
+        self.pages = 0
+        self.pagination = None
+        self.count = None
+        self.rows = self._iter_rows()
+
+    def __iter__(self):
+        return self.rows
+
+    def _request(self, page, size=None):
+        params = {'page': page}
+        if size is not None:
+            params['per_page'] = size
+        return _with_params(self.request_object, **params)
+
+    def _fetch(self, page, size=None):
+        return self._checked(page, _send_page(
+            self.send, self._request(page, size), self.per_page))
+
+    def _next_page(self, page, size):
+        # Page number and size of the page after `page`, and the number of
+        # rows at its head that were already read with the old size.
+        if not isinstance(self.per_page, AdaptivePageSize):
+            return page + 1, size, 0
+        offset = page * size
+        size = _page_size(self.per_page, self.request_object)
+        return offset // size + 1, size, offset % size
+
+    def _checked(self, page, response):
+        if not response.ok:
+            raise PageError(page, response)
+        if 'pagination' not in response.body:
+            raise ValueError('{} is not a page-based list response'.format(
+                type(response).__name__))
+        return response
+
+    def _has_next(self, response, yielded):
+        pagination = response.body['pagination']
+        if not pagination.get('has_next') or not response.body['rows']:
+            return False
+        if self.max_pages is not None and self.pages >= self.max_pages:
+            return False
+        if self.limit is not None and yielded >= self.limit:
+            return False
+        return True
+
+    def _iter_rows(self):
+        executor = None
+        future = None
+        page = self.start_page
+        size = _page_size(self.per_page, self.request_object)
+        skip = 0
+        yielded = 0
+        try:
+            response = self._fetch(page, size)
+            while True:
+                self.pages += 1
+                self.pagination = response.body['pagination']
+                self.count = response.body.get('count')
+                rows = response.body['rows'][skip:]
+                if self.limit is not None:
+                    rows = rows[:self.limit - yielded]
+                has_next = self._has_next(response, yielded + len(rows))
+                response = None
+                if has_next:
+                    page, size, skip = self._next_page(page, size)
+                if has_next and self.prefetch:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=1)
+                    future = executor.submit(self._fetch, page, size)
+                for row in rows:
+                    yield row
+                yielded += len(rows)
+                if not has_next:
+                    return
+                if future is not None:
+                    response, future = future.result(), None
+                else:
+                    response = self._fetch(page, size)
+        finally:
+            if future is not None:
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def close(self):
+        self.rows.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class ParallelPageIterator(PageIterator):
+    """Rows of a page-based list request, with pages fetched concurrently.
+
+    The first page tells max_page; the remaining pages are then requested
+    through the send_many dispatcher with max_concurrency workers (an int
+    or an AdaptiveLimit), and their rows are yielded in page order or, with
+    ordered=False, page by page as they arrive.
+
+    Rows inserted or deleted during the scan shift the others between
+    pages. Pages beyond the first max_page that later pages report are
+    fetched as well, and with dedupe (the default) a row whose id was
+    already yielded is skipped and counted in duplicates. Rows shifted
+    onto an already fetched page can still be missed; use a cursor based
+    list for an exact scan of data that is changing.
+    """
+
+    def __init__(self, send, request_object, max_concurrency=8, ordered=True,
+                 dedupe=True, per_page=None, start_page=1, max_pages=None,
+                 limit=None):
+        super().__init__(send, request_object, per_page=per_page,
+                         start_page=start_page, max_pages=max_pages,
+                         limit=limit)
+        if isinstance(self.per_page, AdaptivePageSize):
+            raise ValueError('parallel pages need a fixed per_page')
+        self.max_concurrency = max_concurrency
+        self.ordered = ordered
+        self.dedupe = dedupe
+        self.duplicates = 0
+
+    def _last_page(self, response):
+        last_page = response.body['pagination'].get('max_page') or 1
+        if self.max_pages is not None:
+            last_page = min(last_page, self.start_page + self.max_pages - 1)
+        return last_page
+
+    def _iter_page_rows(self, response, seen):
+        self.pages += 1
+        if self.pagination is None:
+            self.pagination = response.body['pagination']
+            self.count = response.body.get('count')
+        for row in response.body['rows']:
+            if seen is not None and isinstance(row, dict) and 'id' in row:
+                if row['id'] in seen:
+                    self.duplicates += 1
+                    continue
+                seen.add(row['id'])
+            yield row
+
+    def _iter_rows(self):
+        if self.limit is not None and self.limit <= 0:
+            return
+        seen = set() if self.dedupe else None
+        yielded = 0
+        response = self._fetch(self.start_page, self.per_page)
+        last_page = self._last_page(response)
+        responses = iter([response])
+        next_page = self.start_page + 1
+        while True:
+            for response in responses:
+                last_page = max(last_page, self._last_page(response))
+                for row in self._iter_page_rows(response, seen):
+                    yield row
+                    yielded += 1
+                    if self.limit is not None and yielded >= self.limit:
+                        return
+            if next_page > last_page:
+                return
+            responses = self._fan_out(next_page, last_page)
+            next_page = last_page + 1
+
+    def _fan_out(self, first_page, last_page):
+        request_objects = (self._request(page, self.per_page)
+                           for page in range(first_page, last_page + 1))
+        for result in _dispatch(self.send, request_objects,
+                                max_concurrency=self.max_concurrency,
+                                ordered=self.ordered):
+            if result.error is not None:
+                raise result.error
+            yield self._checked(first_page + result.index, result.response)
+
+
+def _iter_cursor_pages(send, request_object, cursor_key, per_page=None,
+                       cursor=None, max_pages=None):
+    pages = 0
+    while True:
+        params = {}
+        size = _page_size(per_page, request_object)
+        if size is not None:
+            params['per_page'] = size
+        if cursor is not None:
+            params[cursor_key] = cursor
+        response = _send_page(send, _with_params(request_object, **params),
+                              per_page)
+        if not response.ok:
+            raise PageError(pages + 1, response)
+        if cursor_key not in response.body:
+            raise ValueError('{} is not a cursor based list response'.format(
+                type(response).__name__))
+        pages += 1
+        yield response
+        cursor = response.body[cursor_key]
+        if cursor is None or not response.body['rows']:
+            return
+        if max_pages is not None and pages >= max_pages:
+            return
+
+
+class CursorIterator(object):
+    """Rows of a cursor based list request (ListTransactionsV2, ...).
+
+    Pages are followed through next_page_cursor_id or, with
+    direction='prev', through prev_page_cursor_id, whose rows are yielded
+    last to first so that the scan keeps moving in one direction. A
+    background thread reads up to `prefetch` pages ahead of the consumer.
+
+    cursor is the id of the last row yielded, which is exactly where the
+    server resumes from: pass it as cursor to a new iterator to continue an
+    interrupted scan. pages and count describe what has been received.
+    per_page may be an AdaptivePageSize (or 'auto').
+    """
+
+    def __init__(self, send, request_object, per_page=None, cursor=None,
+                 direction='next', max_pages=None, limit=None, prefetch=1):
+        if direction not in ('next', 'prev'):
+            raise ValueError("direction must be 'next' or 'prev'")
+        self.send = send
+        self.request_object = request_object
+        self.per_page = _adaptive(per_page)
+        self.cursor = cursor
+        self.direction = direction
+        self.cursor_key = direction + '_page_cursor_id'
+        self.max_pages = max_pages
+        self.limit = limit
+        self.prefetch = prefetch
+        self.pages = 0
+        self.count = None
+        self.rows = self._iter_rows()
+
+    def __iter__(self):
+        return self.rows
+
+    def _iter_rows(self):
+        if self.limit is not None and self.limit <= 0:
+            return
+        yielded = 0
+        pages = _iter_cursor_pages(self.send, self.request_object,
+                                   self.cursor_key, per_page=self.per_page,
+                                   cursor=self.cursor,
+                                   max_pages=self.max_pages)
+        if self.prefetch:
+            pages = _ReadAhead(pages, self.prefetch)
+        try:
+            for response in pages:
+                self.pages += 1
+                self.count = response.body.get('count')
+                rows = response.body['rows']
+                if self.direction == 'prev':
+                    rows = reversed(rows)
+                for row in rows:
+                    self.cursor = row['id']
+                    yield row
+                    yielded += 1
+                    if self.limit is not None and yielded >= self.limit:
+                        return
+        finally:
+            pages.close()
+
+    def close(self):
+        self.rows.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class _Split(object):
+    # Yielded instead of the pages of a window that is too dense.
+
+    def __init__(self, windows):
+        self.windows = windows
+
+
+def _split_window(start, end, parts):
+    # [start, end] cut into parts windows sharing their boundaries, newest
+    # first like the rows of a transaction list.
+    step = (end - start) / parts
+    bounds = [start + step * i for i in range(parts)] + [end]
+    return [(bounds[i - 1], bounds[i]) for i in range(parts, 0, -1)]
+
+
+class WindowScan(object):
+    """Rows of a cursor based list over [start, end], scanned concurrently.
+
+    A single cursor can only be followed one page at a time, so the range
+    is cut into time windows (from/to) that are each followed by their own
+    cursor on their own thread, with up to max_concurrency windows in
+    flight and up to buffer_pages pages read ahead per window.
+
+    A window whose first page reports more than twice target_pages pages of
+    rows (count) is split into windows of about target_pages pages, down to
+    min_window, and those are scanned instead, so the windows follow the
+    density of the data rather than the clock.
+
+    The list returns rows newest first, and the windows are consumed newest
+    first as well, so rows come out in done_at order. Windows share their
+    boundaries (from and to are inclusive); a row at a boundary comes out
+    once, and the repeats are counted in duplicates.
+    """
+
+    def __init__(self, send, request_object, start, end, max_concurrency=8,
+                 per_page=1000, target_pages=5, buffer_pages=None,
+                 min_window=timedelta(seconds=1)):
+        if not start < end:
+            raise ValueError('start must be before end')
+        self.send = send
+        self.request_object = request_object
+        self.start = start
+        self.end = end
+        self.max_concurrency = max_concurrency
+        self.per_page = _adaptive(per_page)
+        self.target_pages = target_pages
+        self.buffer_pages = buffer_pages or 2 * target_pages
+        self.min_window = min_window
+        self.windows = 0
+        self.splits = 0
+        self.pages = 0
+        self.duplicates = 0
+        self.rows = self._iter_rows()
+
+    def __iter__(self):
+        return self.rows
+
+    def _window_pages(self, start, end):
+        request_object = _with_params(self.request_object, **{
+            'from': start.isoformat(), 'to': end.isoformat()})
+        request_object.body_params.pop('start', None)
+        target_rows = self.target_pages * _page_size(self.per_page,
+                                                     request_object)
+        first = True
+        for response in _iter_cursor_pages(self.send, request_object,
+                                           'next_page_cursor_id',
+                                           per_page=self.per_page):
+            count = response.body.get('count')
+            if (first and count is not None and count > 2 * target_rows and
+                    end - start > self.min_window):
+                parts = min(math.ceil(count / target_rows),
+                            max(2, (end - start) // self.min_window))
+                yield _Split(_split_window(start, end, parts))
+                return
+            first = False
+            yield response
+
+    def _iter_rows(self):
+        windows = collections.deque(
+            [start, end, None] for start, end in _split_window(
+                self.start, self.end, self.max_concurrency))
+        last_done_at = None
+        last_ids = set()
+        try:
+            while windows:
+                for window in list(windows)[:self.max_concurrency]:
+                    if window[2] is None:
+                        window[2] = _ReadAhead(
+                            self._window_pages(window[0], window[1]),
+                            self.buffer_pages)
+                window = windows.popleft()
+                try:
+                    for item in window[2]:
+                        if isinstance(item, _Split):
+                            self.splits += 1
+                            windows.extendleft(
+                                [start, end, None] for start, end in
+                                reversed(item.windows))
+                            break
+                        self.pages += 1
+                        for row in item.body['rows']:
+                            # Rows repeated at a shared boundary have the
+                            # same done_at and come out next to each other.
+                            done_at = row.get('done_at')
+                            if done_at != last_done_at:
+                                last_done_at = done_at
+                                last_ids = set()
+                            if row['id'] in last_ids:
+                                self.duplicates += 1
+                                continue
+                            last_ids.add(row['id'])
+                            yield row
+                    else:
+                        self.windows += 1
+                finally:
+                    window[2].close()
+        finally:
+            for window in windows:
+                if window[2] is not None:
+                    window[2].close()
+
+    def close(self):
+        self.rows.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,104 @@
+import queue
+import threading
+import time
+
+
+class PreparedCall(object):
+    """A request whose encrypted form payload has been built ahead of time.
+
+    Returned by Client.prepare and consumed by Client.send_prepared. The
+    payload is used by the first attempt only, and only while it is younger
+    than the client's prepared_max_age; otherwise (a retry, the second leg
+    of a hedged call, or a call that waited too long) a fresh payload is
+    built at send time so that its timestamp is not expired by the server.
+    """
+
+    def __init__(self, request, params):
+        self.request = request
+        self.params = params
+        self.prepared_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    @property
+    def age(self):
+        return time.monotonic() - self.prepared_at
+
+    def claim(self, max_age):
+        with self.lock:
+            params, self.params = self.params, None
+        if params is None or self.age > max_age:
+            return None
+        return params
+
+    def __repr__(self):
+        return '<PreparedCall {} {}>'.format(self.request.method,
+                                             self.request.path)
+
+
+_DONE = object()
+
+
+class _ReadAhead(object):
+    # Drives the iterator items on a background thread, started right
+    # away, at most size items ahead of the consumer. An exception raised
+    # by items is raised to the consumer in its place.
+
+    def __init__(self, items, size):
+        self.buffer = queue.Queue(maxsize=size)
+        self.stop = threading.Event()
+        self.finished = False
+        self.thread = threading.Thread(target=self._produce, args=(items,),
+                                       daemon=True)
+        self.thread.start()
+
+    def _put(self, item):
+        while not self.stop.is_set():
+            try:
+                self.buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _produce(self, items):
+        try:
+            for item in items:
+                if not self._put((item, None)):
+                    return
+        except Exception as e:
+            self._put((_DONE, e))
+            return
+        self._put((_DONE, None))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.finished:
+            raise StopIteration
+        item, error = self.buffer.get()
+        if item is _DONE:
+            self.finished = True
+            if error is not None:
+                raise error
+            raise StopIteration
+        return item
+
+    def close(self):
+        self.finished = True
+        self.stop.set()
+        self.thread.join()
+
+
+def _prepared(prepare, request_objects, queue_size):
+    # CPU stage: prepare calls on a background thread, at most queue_size
+    # calls ahead of the I/O stage reading from the result. A request
+    # that fails to prepare is passed on with no payload and prepared
+    # again, inline, when it is sent.
+    def prepare_all():
+        for request_object in request_objects:
+            try:
+                yield prepare(request_object)
+            except Exception:
+                yield PreparedCall(request_object, None)
+    return _ReadAhead(prepare_all(), queue_size)
@@ -0,0 +1,120 @@
+import threading
+import time
+import weakref
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class PoolStats(object):
+    """Connection counters shared by every host pool of one adapter.
+
+    created counts connections that had to open a new socket (including
+    reconnects of dropped or expired ones), reused counts checkouts that
+    found a live pooled socket, and discarded counts connections closed
+    because the pool was already full when they were returned.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+        self.in_use = 0
+        self.pools = weakref.WeakSet()
+
+    def register(self, pool):
+        with self.lock:
+            self.pools.add(pool)
+
+    def host_pools(self):
+        # Pools closed by the pool manager (evicted or cleared) drop their
+        # queue; those are no longer counted.
+        with self.lock:
+            return [pool for pool in self.pools if pool.pool is not None]
+
+    def checkout(self, reused):
+        with self.lock:
+            self.in_use += 1
+            if reused:
+                self.reused += 1
+            else:
+                self.created += 1
+
+    def checkin(self, discarded):
+        with self.lock:
+            self.in_use -= 1
+            if discarded:
+                self.discarded += 1
+
+
+class _TrackedPoolMixin(object):
+    stats = None
+    keepalive = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats.register(self)
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout=timeout)
+        idle_since = getattr(conn, '_pokepay_idle_since', None)
+        if (self.keepalive is not None and idle_since is not None
+                and time.monotonic() - idle_since > self.keepalive):
+            conn.close()
+        self.stats.checkout(getattr(conn, 'sock', None) is not None)
+        return conn
+
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn._pokepay_idle_since = time.monotonic()
+        pool = self.pool
+        self.stats.checkin(pool is None or pool.full())
+        super()._put_conn(conn)
+
+    def idle_count(self):
+        pool = self.pool
+        if pool is None:
+            return 0
+        with pool.mutex:
+            return sum(1 for conn in pool.queue
+                       if conn is not None
+                       and getattr(conn, 'sock', None) is not None)
+
+
+class PoolingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose host pools expire idle sockets and keep counters.
+
+    keepalive is the number of seconds a pooled connection may sit idle
+    before it is closed and re-established on next use (None keeps it for
+    as long as the server does).
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=10,
+                 pool_block=False, keepalive=None, **kwargs):
+        self.stats = PoolStats()
+        self.keepalive = keepalive
+        super().__init__(pool_connections=pool_connections,
+                         pool_maxsize=pool_maxsize,
+                         pool_block=pool_block, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        attrs = {'stats': self.stats, 'keepalive': self.keepalive}
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': type('TrackedHTTPConnectionPool',
+                         (_TrackedPoolMixin, HTTPConnectionPool), attrs),
+            'https': type('TrackedHTTPSConnectionPool',
+                          (_TrackedPoolMixin, HTTPSConnectionPool), attrs),
+        }
+
+    def pool_stats(self):
+        host_pools = self.stats.host_pools()
+        with self.stats.lock:
+            return {
+                'pools': len(host_pools),
+                'in_use': self.stats.in_use,
+                'idle': sum(pool.idle_count() for pool in host_pools),
+                'created': self.stats.created,
+                'reused': self.stats.reused,
+                'discarded': self.stats.discarded,
+            }
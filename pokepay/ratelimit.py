@@ -0,0 +1,154 @@
+import json
+import os
+import threading
+import time
+from .endpoint import path_template
+from .timeout import DeadlineExceeded
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+def _refill(state, key, rate, burst, now):
+    # Return the balance after taking one token and how long the caller has
+    # to wait for it. The balance may go negative, which queues callers at
+    # 1 / rate intervals instead of letting them all wake up at once.
+    tokens, updated_at = state.get(key, (burst, now))
+    tokens = min(burst, tokens + max(0.0, now - updated_at) * rate) - 1
+    if tokens >= 0:
+        return tokens, 0.0
+    return tokens, -tokens / rate
+
+
+def _reserve(state, buckets, now, max_wait):
+    # Take a token from every bucket, unless the wait would exceed max_wait,
+    # in which case nothing is taken and None is returned.
+    reserved = [(key, _refill(state, key, rate, burst, now))
+                for key, rate, burst in buckets]
+    wait = max([w for _, (_, w) in reserved] + [0.0])
+    if max_wait is not None and wait > max_wait:
+        return None
+    for key, (tokens, _) in reserved:
+        state[key] = (tokens, now)
+    return wait
+
+
+class MemoryBackend(object):
+    """Bucket state shared by the threads of one process."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.state = {}
+
+    def reserve(self, buckets, max_wait=None):
+        with self.lock:
+            return _reserve(self.state, buckets, time.monotonic(), max_wait)
+
+
+class FileBackend(object):
+    """Bucket state shared by every process that uses the same file.
+
+    Each reservation takes an exclusive flock on the file, updates the JSON
+    encoded buckets and releases it, so workers started from the same
+    profile (e.g. gunicorn workers) draw from one quota.
+    """
+
+    def __init__(self, path):
+        if fcntl is None:
+            raise RuntimeError('FileBackend requires fcntl (POSIX only)')
+        self.path = path
+        self.lock = threading.Lock()
+
+    def reserve(self, buckets, max_wait=None):
+        with self.lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                with os.fdopen(os.dup(fd), 'r+') as f:
+                    data = f.read()
+                    state = dict((key, tuple(value)) for key, value
+                                 in json.loads(data or '{}').items())
+                    wait = _reserve(state, buckets, time.time(), max_wait)
+                    if wait is not None:
+                        f.seek(0)
+                        f.truncate()
+                        f.write(json.dumps(state))
+                return wait
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+
+
+def _parse_path_rates(value):
+    # One 'path = rate' or 'path = rate/burst' entry per line.
+    path_rates = {}
+    for line in (value or '').splitlines():
+        if not line.strip():
+            continue
+        path, limit = line.rsplit('=', 1)
+        rate, _, burst = limit.strip().partition('/')
+        path_rates[path.strip()] = (float(rate),
+                                    float(burst) if burst else None)
+    return path_rates
+
+
+class RateLimiter(object):
+    """Token buckets applied before every request sent by a Client.
+
+    rate is the global number of requests per second and burst the number
+    of requests that may go out back to back after an idle period.
+    path_rates maps path templates (see path_template) to their own rate
+    or (rate, burst) pair; a request waits for both buckets.
+    """
+
+    def __init__(self, rate=None, burst=None, path_rates=None, backend=None,
+                 sleep=time.sleep):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate or 1.0)
+        self.path_rates = {}
+        for path, limit in (path_rates or {}).items():
+            if not isinstance(limit, tuple):
+                limit = (limit, None)
+            path_rate, path_burst = limit
+            if path_burst is None:
+                path_burst = max(1.0, path_rate)
+            self.path_rates[path] = (float(path_rate), float(path_burst))
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.sleep = sleep
+
+    @classmethod
+    def from_profile(cls, profile):
+        rate = profile.getfloat('RATE_LIMIT', None)
+        path_rates = _parse_path_rates(profile.get('RATE_LIMIT_PATHS'))
+        if rate is None and not path_rates:
+            return None
+        backend = None
+        if profile.get('RATE_LIMIT_FILE'):
+            backend = FileBackend(profile.get('RATE_LIMIT_FILE'))
+        return cls(rate=rate, burst=profile.getfloat('RATE_LIMIT_BURST', None),
+                   path_rates=path_rates, backend=backend)
+
+    def acquire(self, path, expires_at=None):
+        # expires_at is a time.monotonic() deadline. If the next slot falls
+        # after it, nothing is reserved and DeadlineExceeded is raised.
+        buckets = []
+        if self.rate:
+            buckets.append(('*', self.rate, self.burst))
+        template = path_template(path)
+        if template in self.path_rates:
+            rate, burst = self.path_rates[template]
+            buckets.append((template, rate, burst))
+        if not buckets:
+            return 0.0
+        max_wait = None
+        if expires_at is not None:
+            max_wait = expires_at - time.monotonic()
+        wait = self.backend.reserve(buckets, max_wait)
+        if wait is None:
+            raise DeadlineExceeded(
+                'deadline exceeded waiting for the rate limit')
+        if wait > 0:
+            self.sleep(wait)
+        return wait
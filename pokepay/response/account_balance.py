@@ -4,18 +4,16 @@ from pokepay.response.response import PokepayResponse
 
 
 class AccountBalance(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.expires_at = response_body['expires_at']
-        self.money_amount = response_body['money_amount']
-        self.point_amount = response_body['point_amount']
+    __slots__ = ()
 
+    @property
     def expires_at(self):
-        return self.expires_at
+        return self._body['expires_at']
 
+    @property
     def money_amount(self):
-        return self.money_amount
+        return self._body['money_amount']
 
+    @property
     def point_amount(self):
-        return self.point_amount
-
+        return self._body['point_amount']
@@ -4,50 +4,48 @@ from pokepay.response.response import PokepayResponse
 
 
 class AccountDetail(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.id = response_body['id']
-        self.name = response_body['name']
-        self.is_suspended = response_body['is_suspended']
-        self.status = response_body['status']
-        self.balance = response_body['balance']
-        self.money_balance = response_body['money_balance']
-        self.point_balance = response_body['point_balance']
-        self.point_debt = response_body['point_debt']
-        self.private_money = response_body['private_money']
-        self.user = response_body['user']
-        self.external_id = response_body['external_id']
+    __slots__ = ()
 
+    @property
     def id(self):
-        return self.id
+        return self._body['id']
 
+    @property
     def name(self):
-        return self.name
+        return self._body['name']
 
+    @property
     def is_suspended(self):
-        return self.is_suspended
+        return self._body['is_suspended']
 
+    @property
     def status(self):
-        return self.status
+        return self._body['status']
 
+    @property
     def balance(self):
-        return self.balance
+        return self._body['balance']
 
+    @property
     def money_balance(self):
-        return self.money_balance
+        return self._body['money_balance']
 
+    @property
     def point_balance(self):
-        return self.point_balance
+        return self._body['point_balance']
 
+    @property
     def point_debt(self):
-        return self.point_debt
+        return self._body['point_debt']
 
+    @property
     def private_money(self):
-        return self.private_money
+        return self._body['private_money']
 
+    @property
     def user(self):
-        return self.user
+        return self._body['user']
 
+    @property
     def external_id(self):
-        return self.external_id
-
+        return self._body['external_id']
@@ -4,10 +4,8 @@ from pokepay.response.response import PokepayResponse
 
 
 class AccountTransferSummary(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.summaries = response_body['summaries']
+    __slots__ = ()
 
+    @property
     def summaries(self):
-        return self.summaries
-
+        return self._body['summaries']
@@ -4,22 +4,20 @@ from pokepay.response.response import PokepayResponse
 
 
 class AccountTransferSummaryElement(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.transfer_type = response_body['transfer_type']
-        self.money_amount = response_body['money_amount']
-        self.point_amount = response_body['point_amount']
-        self.count = response_body['count']
+    __slots__ = ()
 
+    @property
     def transfer_type(self):
-        return self.transfer_type
+        return self._body['transfer_type']
 
+    @property
     def money_amount(self):
-        return self.money_amount
+        return self._body['money_amount']
 
+    @property
     def point_amount(self):
-        return self.point_amount
+        return self._body['point_amount']
 
+    @property
     def count(self):
-        return self.count
-
+        return self._body['count']
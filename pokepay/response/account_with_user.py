@@ -4,30 +4,28 @@ from pokepay.response.response import PokepayResponse
 
 
 class AccountWithUser(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.id = response_body['id']
-        self.name = response_body['name']
-        self.is_suspended = response_body['is_suspended']
-        self.status = response_body['status']
-        self.private_money = response_body['private_money']
-        self.user = response_body['user']
+    __slots__ = ()
 
+    @property
     def id(self):
-        return self.id
+        return self._body['id']
 
+    @property
     def name(self):
-        return self.name
+        return self._body['name']
 
+    @property
     def is_suspended(self):
-        return self.is_suspended
+        return self._body['is_suspended']
 
+    @property
     def status(self):
-        return self.status
+        return self._body['status']
 
+    @property
     def private_money(self):
-        return self.private_money
+        return self._body['private_money']
 
+    @property
     def user(self):
-        return self.user
-
+        return self._body['user']
@@ -4,38 +4,36 @@ from pokepay.response.response import PokepayResponse
 
 
 class AdminUserWithShopsAndPrivateMoneys(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.id = response_body['id']
-        self.role = response_body['role']
-        self.email = response_body['email']
-        self.name = response_body['name']
-        self.is_active = response_body['is_active']
-        self.organization = response_body['organization']
-        self.shops = response_body['shops']
-        self.private_moneys = response_body['private_moneys']
+    __slots__ = ()
 
+    @property
     def id(self):
-        return self.id
+        return self._body['id']
 
+    @property
     def role(self):
-        return self.role
+        return self._body['role']
 
+    @property
     def email(self):
-        return self.email
+        return self._body['email']
 
+    @property
     def name(self):
-        return self.name
+        return self._body['name']
 
+    @property
     def is_active(self):
-        return self.is_active
+        return self._body['is_active']
 
+    @property
     def organization(self):
-        return self.organization
+        return self._body['organization']
 
+    @property
     def shops(self):
-        return self.shops
+        return self._body['shops']
 
+    @property
     def private_moneys(self):
-        return self.private_moneys
-
+        return self._body['private_moneys']
@@ -4,8 +4,4 @@ from pokepay.response.response import PokepayResponse
 
 
 class BadRequest(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        
-
-    
+    __slots__ = ()
@@ -4,38 +4,36 @@ from pokepay.response.response import PokepayResponse
 
 
 class Bill(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.id = response_body['id']
-        self.amount = response_body['amount']
-        self.max_amount = response_body['max_amount']
-        self.min_amount = response_body['min_amount']
-        self.description = response_body['description']
-        self.account = response_body['account']
-        self.is_disabled = response_body['is_disabled']
-        self.token = response_body['token']
+    __slots__ = ()
 
+    @property
     def id(self):
-        return self.id
+        return self._body['id']
 
+    @property
     def amount(self):
-        return self.amount
+        return self._body['amount']
 
+    @property
     def max_amount(self):
-        return self.max_amount
+        return self._body['max_amount']
 
+    @property
     def min_amount(self):
-        return self.min_amount
+        return self._body['min_amount']
 
+    @property
     def description(self):
-        return self.description
+        return self._body['description']
 
+    @property
     def account(self):
-        return self.account
+        return self._body['account']
 
+    @property
     def is_disabled(self):
-        return self.is_disabled
+        return self._body['is_disabled']
 
+    @property
     def token(self):
-        return self.token
-
+        return self._body['token']
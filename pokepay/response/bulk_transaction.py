@@ -4,42 +4,40 @@ from pokepay.response.response import PokepayResponse
 
 
 class BulkTransaction(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.id = response_body['id']
-        self.request_id = response_body['request_id']
-        self.name = response_body['name']
-        self.description = response_body['description']
-        self.status = response_body['status']
-        self.error = response_body['error']
-        self.error_lineno = response_body['error_lineno']
-        self.submitted_at = response_body['submitted_at']
-        self.updated_at = response_body['updated_at']
+    __slots__ = ()
 
+    @property
     def id(self):
-        return self.id
+        return self._body['id']
 
+    @property
     def request_id(self):
-        return self.request_id
+        return self._body['request_id']
 
+    @property
     def name(self):
-        return self.name
+        return self._body['name']
 
+    @property
     def description(self):
-        return self.description
+        return self._body['description']
 
+    @property
     def status(self):
-        return self.status
+        return self._body['status']
 
+    @property
     def error(self):
-        return self.error
+        return self._body['error']
 
+    @property
     def error_lineno(self):
-        return self.error_lineno
+        return self._body['error_lineno']
 
+    @property
     def submitted_at(self):
-        return self.submitted_at
+        return self._body['submitted_at']
 
+    @property
     def updated_at(self):
-        return self.updated_at
-
+        return self._body['updated_at']
@@ -4,70 +4,68 @@ from pokepay.response.response import PokepayResponse
 
 
 class BulkTransactionJob(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.id = response_body['id']
-        self.bulk_transaction = response_body['bulk_transaction']
-        self.type = response_body['type']
-        self.sender_account_id = response_body['sender_account_id']
-        self.receiver_account_id = response_body['receiver_account_id']
-        self.money_amount = response_body['money_amount']
-        self.point_amount = response_body['point_amount']
-        self.description = response_body['description']
-        self.bear_point_account_id = response_body['bear_point_account_id']
-        self.point_expires_at = response_body['point_expires_at']
-        self.status = response_body['status']
-        self.error = response_body['error']
-        self.lineno = response_body['lineno']
-        self.transaction_id = response_body['transaction_id']
-        self.created_at = response_body['created_at']
-        self.updated_at = response_body['updated_at']
+    __slots__ = ()
 
+    @property
     def id(self):
-        return self.id
+        return self._body['id']
 
+    @property
     def bulk_transaction(self):
-        return self.bulk_transaction
+        return self._body['bulk_transaction']
 
+    @property
     def type(self):
-        return self.type
+        return self._body['type']
 
+    @property
     def sender_account_id(self):
-        return self.sender_account_id
+        return self._body['sender_account_id']
 
+    @property
     def receiver_account_id(self):
-        return self.receiver_account_id
+        return self._body['receiver_account_id']
 
+    @property
     def money_amount(self):
-        return self.money_amount
+        return self._body['money_amount']
 
+    @property
     def point_amount(self):
-        return self.point_amount
+        return self._body['point_amount']
 
+    @property
     def description(self):
-        return self.description
+        return self._body['description']
 
+    @property
     def bear_point_account_id(self):
-        return self.bear_point_account_id
+        return self._body['bear_point_account_id']
 
+    @property
     def point_expires_at(self):
-        return self.point_expires_at
+        return self._body['point_expires_at']
 
+    @property
     def status(self):
-        return self.status
+        return self._body['status']
 
+    @property
     def error(self):
-        return self.error
+        return self._body['error']
 
+    @property
     def lineno(self):
-        return self.lineno
+        return self._body['lineno']
 
+    @property
     def transaction_id(self):
-        return self.transaction_id
+        return self._body['transaction_id']
 
+    @property
     def created_at(self):
-        return self.created_at
+        return self._body['created_at']
 
+    @property
     def updated_at(self):
-        return self.updated_at
-
+        return self._body['updated_at']
@@ -4,74 +4,72 @@ from pokepay.response.response import PokepayResponse
 
 
 class Campaign(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.id = response_body['id']
-        self.name = response_body['name']
-        self.applicable_shops = response_body['applicable_shops']
-        self.is_exclusive = response_body['is_exclusive']
-        self.starts_at = response_body['starts_at']
-        self.ends_at = response_body['ends_at']
-        self.point_expires_at = response_body['point_expires_at']
-        self.point_expires_in_days = response_body['point_expires_in_days']
-        self.priority = response_body['priority']
-        self.description = response_body['description']
-        self.bear_point_shop = response_body['bear_point_shop']
-        self.private_money = response_body['private_money']
-        self.dest_private_money = response_body['dest_private_money']
-        self.max_total_point_amount = response_body['max_total_point_amount']
-        self.point_calculation_rule = response_body['point_calculation_rule']
-        self.point_calculation_rule_object = response_body['point_calculation_rule_object']
-        self.status = response_body['status']
+    __slots__ = ()
 
+    @property
     def id(self):
-        return self.id
+        return self._body['id']
 
+    @property
     def name(self):
-        return self.name
+        return self._body['name']
 
+    @property
     def applicable_shops(self):
-        return self.applicable_shops
+        return self._body['applicable_shops']
 
+    @property
     def is_exclusive(self):
-        return self.is_exclusive
+        return self._body['is_exclusive']
 
+    @property
     def starts_at(self):
-        return self.starts_at
+        return self._body['starts_at']
 
+    @property
     def ends_at(self):
-        return self.ends_at
+        return self._body['ends_at']
 
+    @property
     def point_expires_at(self):
-        return self.point_expires_at
+        return self._body['point_expires_at']
 
+    @property
     def point_expires_in_days(self):
-        return self.point_expires_in_days
+        return self._body['point_expires_in_days']
 
+    @property
     def priority(self):
-        return self.priority
+        return self._body['priority']
 
+    @property
     def description(self):
-        return self.description
+        return self._body['description']
 
+    @property
     def bear_point_shop(self):
-        return self.bear_point_shop
+        return self._body['bear_point_shop']
 
+    @property
     def private_money(self):
-        return self.private_money
+        return self._body['private_money']
 
+    @property
     def dest_private_money(self):
-        return self.dest_private_money
+        return self._body['dest_private_money']
 
+    @property
     def max_total_point_amount(self):
-        return self.max_total_point_amount
+        return self._body['max_total_point_amount']
 
+    @property
     def point_calculation_rule(self):
-        return self.point_calculation_rule
+        return self._body['point_calculation_rule']
 
+    @property
     def point_calculation_rule_object(self):
-        return self.point_calculation_rule_object
+        return self._body['point_calculation_rule_object']
 
+    @property
     def status(self):
-        return self.status
-
+        return self._body['status']
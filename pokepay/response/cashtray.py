@@ -4,34 +4,32 @@ from pokepay.response.response import PokepayResponse
 
 
 class Cashtray(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.id = response_body['id']
-        self.amount = response_body['amount']
-        self.description = response_body['description']
-        self.account = response_body['account']
-        self.expires_at = response_body['expires_at']
-        self.canceled_at = response_body['canceled_at']
-        self.token = response_body['token']
+    __slots__ = ()
 
+    @property
     def id(self):
-        return self.id
+        return self._body['id']
 
+    @property
     def amount(self):
-        return self.amount
+        return self._body['amount']
 
+    @property
     def description(self):
-        return self.description
+        return self._body['description']
 
+    @property
     def account(self):
-        return self.account
+        return self._body['account']
 
+    @property
     def expires_at(self):
-        return self.expires_at
+        return self._body['expires_at']
 
+    @property
     def canceled_at(self):
-        return self.canceled_at
+        return self._body['canceled_at']
 
+    @property
     def token(self):
-        return self.token
-
+        return self._body['token']
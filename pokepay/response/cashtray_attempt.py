@@ -4,26 +4,24 @@ from pokepay.response.response import PokepayResponse
 
 
 class CashtrayAttempt(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.account = response_body['account']
-        self.status_code = response_body['status_code']
-        self.error_type = response_body['error_type']
-        self.error_message = response_body['error_message']
-        self.created_at = response_body['created_at']
+    __slots__ = ()
 
+    @property
     def account(self):
-        return self.account
+        return self._body['account']
 
+    @property
     def status_code(self):
-        return self.status_code
+        return self._body['status_code']
 
+    @property
     def error_type(self):
-        return self.error_type
+        return self._body['error_type']
 
+    @property
     def error_message(self):
-        return self.error_message
+        return self._body['error_message']
 
+    @property
     def created_at(self):
-        return self.created_at
-
+        return self._body['created_at']
@@ -4,70 +4,68 @@ from pokepay.response.response import PokepayResponse
 
 
 class Check(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.id = response_body['id']
-        self.created_at = response_body['created_at']
-        self.amount = response_body['amount']
-        self.money_amount = response_body['money_amount']
-        self.point_amount = response_body['point_amount']
-        self.description = response_body['description']
-        self.user = response_body['user']
-        self.is_onetime = response_body['is_onetime']
-        self.is_disabled = response_body['is_disabled']
-        self.expires_at = response_body['expires_at']
-        self.private_money = response_body['private_money']
-        self.usage_limit = response_body['usage_limit']
-        self.usage_count = response_body['usage_count']
-        self.point_expires_at = response_body['point_expires_at']
-        self.point_expires_in_days = response_body['point_expires_in_days']
-        self.token = response_body['token']
+    __slots__ = ()
 
+    @property
     def id(self):
-        return self.id
+        return self._body['id']
 
+    @property
     def created_at(self):
-        return self.created_at
+        return self._body['created_at']
 
+    @property
     def amount(self):
-        return self.amount
+        return self._body['amount']
 
+    @property
     def money_amount(self):
-        return self.money_amount
+        return self._body['money_amount']
 
+    @property
     def point_amount(self):
-        return self.point_amount
+        return self._body['point_amount']
 
+    @property
     def description(self):
-        return self.description
+        return self._body['description']
 
+    @property
     def user(self):
-        return self.user
+        return self._body['user']
 
+    @property
     def is_onetime(self):
-        return self.is_onetime
+        return self._body['is_onetime']
 
+    @property
     def is_disabled(self):
-        return self.is_disabled
+        return self._body['is_disabled']
 
+    @property
     def expires_at(self):
-        return self.expires_at
+        return self._body['expires_at']
 
+    @property
     def private_money(self):
-        return self.private_money
+        return self._body['private_money']
 
+    @property
     def usage_limit(self):
-        return self.usage_limit
+        return self._body['usage_limit']
 
+    @property
     def usage_count(self):
-        return self.usage_count
+        return self._body['usage_count']
 
+    @property
     def point_expires_at(self):
-        return self.point_expires_at
+        return self._body['point_expires_at']
 
+    @property
     def point_expires_in_days(self):
-        return self.point_expires_in_days
+        return self._body['point_expires_in_days']
 
+    @property
     def token(self):
-        return self.token
-
+        return self._body['token']
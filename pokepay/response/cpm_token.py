@@ -4,34 +4,32 @@ from pokepay.response.response import PokepayResponse
 
 
 class CpmToken(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.cpm_token = response_body['cpm_token']
-        self.account = response_body['account']
-        self.transaction = response_body['transaction']
-        self.event = response_body['event']
-        self.scopes = response_body['scopes']
-        self.expires_at = response_body['expires_at']
-        self.metadata = response_body['metadata']
+    __slots__ = ()
 
+    @property
     def cpm_token(self):
-        return self.cpm_token
+        return self._body['cpm_token']
 
+    @property
     def account(self):
-        return self.account
+        return self._body['account']
 
+    @property
     def transaction(self):
-        return self.transaction
+        return self._body['transaction']
 
+    @property
     def event(self):
-        return self.event
+        return self._body['event']
 
+    @property
     def scopes(self):
-        return self.scopes
+        return self._body['scopes']
 
+    @property
     def expires_at(self):
-        return self.expires_at
+        return self._body['expires_at']
 
+    @property
     def metadata(self):
-        return self.metadata
-
+        return self._body['metadata']
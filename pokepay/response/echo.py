@@ -4,14 +4,12 @@ from pokepay.response.response import PokepayResponse
 
 
 class Echo(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.status = response_body['status']
-        self.message = response_body['message']
+    __slots__ = ()
 
+    @property
     def status(self):
-        return self.status
+        return self._body['status']
 
+    @property
     def message(self):
-        return self.message
-
+        return self._body['message']
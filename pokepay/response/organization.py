@@ -4,14 +4,12 @@ from pokepay.response.response import PokepayResponse
 
 
 class Organization(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.code = response_body['code']
-        self.name = response_body['name']
+    __slots__ = ()
 
+    @property
     def code(self):
-        return self.code
+        return self._body['code']
 
+    @property
     def name(self):
-        return self.name
-
+        return self._body['name']
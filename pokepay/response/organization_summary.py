@@ -4,26 +4,24 @@ from pokepay.response.response import PokepayResponse
 
 
 class OrganizationSummary(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.count = response_body['count']
-        self.money_amount = response_body['money_amount']
-        self.money_count = response_body['money_count']
-        self.point_amount = response_body['point_amount']
-        self.point_count = response_body['point_count']
+    __slots__ = ()
 
+    @property
     def count(self):
-        return self.count
+        return self._body['count']
 
+    @property
     def money_amount(self):
-        return self.money_amount
+        return self._body['money_amount']
 
+    @property
     def money_count(self):
-        return self.money_count
+        return self._body['money_count']
 
+    @property
     def point_amount(self):
-        return self.point_amount
+        return self._body['point_amount']
 
+    @property
     def point_count(self):
-        return self.point_count
-
+        return self._body['point_count']
@@ -4,18 +4,16 @@ from pokepay.response.response import PokepayResponse
 
 
 class PaginatedAccountWithUsers(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.rows = response_body['rows']
-        self.count = response_body['count']
-        self.pagination = response_body['pagination']
+    __slots__ = ()
 
+    @property
     def rows(self):
-        return self.rows
+        return self._body['rows']
 
+    @property
     def count(self):
-        return self.count
+        return self._body['count']
 
+    @property
     def pagination(self):
-        return self.pagination
-
+        return self._body['pagination']
@@ -4,26 +4,24 @@ from pokepay.response.response import PokepayResponse
 
 
 class PaginatedTransfersV2(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.rows = response_body['rows']
-        self.per_page = response_body['per_page']
-        self.count = response_body['count']
-        self.next_page_cursor_id = response_body['next_page_cursor_id']
-        self.prev_page_cursor_id = response_body['prev_page_cursor_id']
+    __slots__ = ()
 
+    @property
     def rows(self):
-        return self.rows
+        return self._body['rows']
 
+    @property
     def per_page(self):
-        return self.per_page
+        return self._body['per_page']
 
+    @property
     def count(self):
-        return self.count
+        return self._body['count']
 
+    @property
     def next_page_cursor_id(self):
-        return self.next_page_cursor_id
+        return self._body['next_page_cursor_id']
 
+    @property
     def prev_page_cursor_id(self):
-        return self.prev_page_cursor_id
-
+        return self._body['prev_page_cursor_id']
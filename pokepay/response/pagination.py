@@ -4,26 +4,24 @@ from pokepay.response.response import PokepayResponse
 
 
 class Pagination(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.current = response_body['current']
-        self.per_page = response_body['per_page']
-        self.max_page = response_body['max_page']
-        self.has_prev = response_body['has_prev']
-        self.has_next = response_body['has_next']
+    __slots__ = ()
 
+    @property
     def current(self):
-        return self.current
+        return self._body['current']
 
+    @property
     def per_page(self):
-        return self.per_page
+        return self._body['per_page']
 
+    @property
     def max_page(self):
-        return self.max_page
+        return self._body['max_page']
 
+    @property
     def has_prev(self):
-        return self.has_prev
+        return self._body['has_prev']
 
+    @property
     def has_next(self):
-        return self.has_next
-
+        return self._body['has_next']
@@ -4,14 +4,12 @@ from pokepay.response.response import PokepayResponse
 
 
 class PartnerClientNotFound(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.type = response_body['type']
-        self.message = response_body['message']
+    __slots__ = ()
 
+    @property
     def type(self):
-        return self.type
+        return self._body['type']
 
+    @property
     def message(self):
-        return self.message
-
+        return self._body['message']
@@ -4,10 +4,8 @@ from pokepay.response.response import PokepayResponse
 
 
 class Pong(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.pong = response_body['pong']
+    __slots__ = ()
 
+    @property
     def pong(self):
-        return self.pong
-
+        return self._body['pong']
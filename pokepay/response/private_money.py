@@ -4,58 +4,56 @@ from pokepay.response.response import PokepayResponse
 
 
 class PrivateMoney(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.id = response_body['id']
-        self.name = response_body['name']
-        self.unit = response_body['unit']
-        self.is_exclusive = response_body['is_exclusive']
-        self.description = response_body['description']
-        self.oneline_message = response_body['oneline_message']
-        self.organization = response_body['organization']
-        self.max_balance = response_body['max_balance']
-        self.transfer_limit = response_body['transfer_limit']
-        self.type = response_body['type']
-        self.expiration_type = response_body['expiration_type']
-        self.enable_topup_by_member = response_body['enable_topup_by_member']
-        self.display_money_and_point = response_body['display_money_and_point']
+    __slots__ = ()
 
+    @property
     def id(self):
-        return self.id
+        return self._body['id']
 
+    @property
     def name(self):
-        return self.name
+        return self._body['name']
 
+    @property
     def unit(self):
-        return self.unit
+        return self._body['unit']
 
+    @property
     def is_exclusive(self):
-        return self.is_exclusive
+        return self._body['is_exclusive']
 
+    @property
     def description(self):
-        return self.description
+        return self._body['description']
 
+    @property
     def oneline_message(self):
-        return self.oneline_message
+        return self._body['oneline_message']
 
+    @property
     def organization(self):
-        return self.organization
+        return self._body['organization']
 
+    @property
     def max_balance(self):
-        return self.max_balance
+        return self._body['max_balance']
 
+    @property
     def transfer_limit(self):
-        return self.transfer_limit
+        return self._body['transfer_limit']
 
+    @property
     def type(self):
-        return self.type
+        return self._body['type']
 
+    @property
     def expiration_type(self):
-        return self.expiration_type
+        return self._body['expiration_type']
 
+    @property
     def enable_topup_by_member(self):
-        return self.enable_topup_by_member
+        return self._body['enable_topup_by_member']
 
+    @property
     def display_money_and_point(self):
-        return self.display_money_and_point
-
+        return self._body['display_money_and_point']
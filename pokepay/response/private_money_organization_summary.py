@@ -4,18 +4,16 @@ from pokepay.response.response import PokepayResponse
 
 
 class PrivateMoneyOrganizationSummary(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.organization_code = response_body['organization_code']
-        self.topup = response_body['topup']
-        self.payment = response_body['payment']
+    __slots__ = ()
 
+    @property
     def organization_code(self):
-        return self.organization_code
+        return self._body['organization_code']
 
+    @property
     def topup(self):
-        return self.topup
+        return self._body['topup']
 
+    @property
     def payment(self):
-        return self.payment
-
+        return self._body['payment']
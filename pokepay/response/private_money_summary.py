@@ -4,42 +4,40 @@ from pokepay.response.response import PokepayResponse
 
 
 class PrivateMoneySummary(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.topup_amount = response_body['topup_amount']
-        self.refunded_topup_amount = response_body['refunded_topup_amount']
-        self.payment_amount = response_body['payment_amount']
-        self.refunded_payment_amount = response_body['refunded_payment_amount']
-        self.added_point_amount = response_body['added_point_amount']
-        self.refunded_added_point_amount = response_body['refunded_added_point_amount']
-        self.exchange_inflow_amount = response_body['exchange_inflow_amount']
-        self.exchange_outflow_amount = response_body['exchange_outflow_amount']
-        self.transaction_count = response_body['transaction_count']
+    __slots__ = ()
 
+    @property
     def topup_amount(self):
-        return self.topup_amount
+        return self._body['topup_amount']
 
+    @property
     def refunded_topup_amount(self):
-        return self.refunded_topup_amount
+        return self._body['refunded_topup_amount']
 
+    @property
     def payment_amount(self):
-        return self.payment_amount
+        return self._body['payment_amount']
 
+    @property
     def refunded_payment_amount(self):
-        return self.refunded_payment_amount
+        return self._body['refunded_payment_amount']
 
+    @property
     def added_point_amount(self):
-        return self.added_point_amount
+        return self._body['added_point_amount']
 
+    @property
     def refunded_added_point_amount(self):
-        return self.refunded_added_point_amount
+        return self._body['refunded_added_point_amount']
 
+    @property
     def exchange_inflow_amount(self):
-        return self.exchange_inflow_amount
+        return self._body['exchange_inflow_amount']
 
+    @property
     def exchange_outflow_amount(self):
-        return self.exchange_outflow_amount
+        return self._body['exchange_outflow_amount']
 
+    @property
     def transaction_count(self):
-        return self.transaction_count
-
+        return self._body['transaction_count']
@@ -4,30 +4,28 @@ from pokepay.response.response import PokepayResponse
 
 
 class Product(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.jan_code = response_body['jan_code']
-        self.name = response_body['name']
-        self.unit_price = response_body['unit_price']
-        self.price = response_body['price']
-        self.is_discounted = response_body['is_discounted']
-        self.other = response_body['other']
+    __slots__ = ()
 
+    @property
     def jan_code(self):
-        return self.jan_code
+        return self._body['jan_code']
 
+    @property
     def name(self):
-        return self.name
+        return self._body['name']
 
+    @property
     def unit_price(self):
-        return self.unit_price
+        return self._body['unit_price']
 
+    @property
     def price(self):
-        return self.price
+        return self._body['price']
 
+    @property
     def is_discounted(self):
-        return self.is_discounted
+        return self._body['is_discounted']
 
+    @property
     def other(self):
-        return self.other
-
+        return self._body['other']
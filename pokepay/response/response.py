@@ -1,26 +1,35 @@
 class PokepayResponse(object):
+    # The decrypted body is kept once; the generated subclasses expose its
+    # fields as properties and add no per-instance state of their own.
+    __slots__ = ('_body', '_elapsed', '_status_code', '_headers', '_url')
+
     def __init__(self, response, response_body):
-        self.body = response_body
-        self.elapsed = response.elapsed
-        self.status_code = response.status_code
-        self.ok = response.ok
-        self.headers = response.headers
-        self.url = response.url
+        self._body = response_body
+        self._elapsed = response.elapsed
+        self._status_code = response.status_code
+        self._headers = response.headers
+        self._url = response.url
 
+    @property
     def body(self):
-        return self.body
+        return self._body
 
+    @property
     def elapsed(self):
-        return self.elapsed
+        return self._elapsed
 
+    @property
     def status_code(self):
-        return self.status_code
+        return self._status_code
 
+    @property
     def ok(self):
-        return self.ok
+        return self._status_code < 400
 
+    @property
     def headers(self):
-        return self.headers
+        return self._headers
 
+    @property
     def url(self):
-        return self.url
+        return self._url
@@ -4,38 +4,36 @@ from pokepay.response.response import PokepayResponse
 
 
 class ShopWithMetadata(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.id = response_body['id']
-        self.name = response_body['name']
-        self.organization_code = response_body['organization_code']
-        self.postal_code = response_body['postal_code']
-        self.address = response_body['address']
-        self.tel = response_body['tel']
-        self.email = response_body['email']
-        self.external_id = response_body['external_id']
+    __slots__ = ()
 
+    @property
     def id(self):
-        return self.id
+        return self._body['id']
 
+    @property
     def name(self):
-        return self.name
+        return self._body['name']
 
+    @property
     def organization_code(self):
-        return self.organization_code
+        return self._body['organization_code']
 
+    @property
     def postal_code(self):
-        return self.postal_code
+        return self._body['postal_code']
 
+    @property
     def address(self):
-        return self.address
+        return self._body['address']
 
+    @property
     def tel(self):
-        return self.tel
+        return self._body['tel']
 
+    @property
     def email(self):
-        return self.email
+        return self._body['email']
 
+    @property
     def external_id(self):
-        return self.external_id
-
+        return self._body['external_id']
@@ -4,58 +4,56 @@ from pokepay.response.response import PokepayResponse
 
 
 class TransactionDetail(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.id = response_body['id']
-        self.type = response_body['type']
-        self.is_modified = response_body['is_modified']
-        self.sender = response_body['sender']
-        self.sender_account = response_body['sender_account']
-        self.receiver = response_body['receiver']
-        self.receiver_account = response_body['receiver_account']
-        self.amount = response_body['amount']
-        self.money_amount = response_body['money_amount']
-        self.point_amount = response_body['point_amount']
-        self.done_at = response_body['done_at']
-        self.description = response_body['description']
-        self.transfers = response_body['transfers']
+    __slots__ = ()
 
+    @property
     def id(self):
-        return self.id
+        return self._body['id']
 
+    @property
     def type(self):
-        return self.type
+        return self._body['type']
 
+    @property
     def is_modified(self):
-        return self.is_modified
+        return self._body['is_modified']
 
+    @property
     def sender(self):
-        return self.sender
+        return self._body['sender']
 
+    @property
     def sender_account(self):
-        return self.sender_account
+        return self._body['sender_account']
 
+    @property
     def receiver(self):
-        return self.receiver
+        return self._body['receiver']
 
+    @property
     def receiver_account(self):
-        return self.receiver_account
+        return self._body['receiver_account']
 
+    @property
     def amount(self):
-        return self.amount
+        return self._body['amount']
 
+    @property
     def money_amount(self):
-        return self.money_amount
+        return self._body['money_amount']
 
+    @property
     def point_amount(self):
-        return self.point_amount
+        return self._body['point_amount']
 
+    @property
     def done_at(self):
-        return self.done_at
+        return self._body['done_at']
 
+    @property
     def description(self):
-        return self.description
+        return self._body['description']
 
+    @property
     def transfers(self):
-        return self.transfers
-
+        return self._body['transfers']
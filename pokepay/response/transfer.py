@@ -4,46 +4,44 @@ from pokepay.response.response import PokepayResponse
 
 
 class Transfer(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.id = response_body['id']
-        self.sender_account = response_body['sender_account']
-        self.receiver_account = response_body['receiver_account']
-        self.amount = response_body['amount']
-        self.money_amount = response_body['money_amount']
-        self.point_amount = response_body['point_amount']
-        self.done_at = response_body['done_at']
-        self.type = response_body['type']
-        self.description = response_body['description']
-        self.transaction_id = response_body['transaction_id']
+    __slots__ = ()
 
+    @property
     def id(self):
-        return self.id
+        return self._body['id']
 
+    @property
     def sender_account(self):
-        return self.sender_account
+        return self._body['sender_account']
 
+    @property
     def receiver_account(self):
-        return self.receiver_account
+        return self._body['receiver_account']
 
+    @property
     def amount(self):
-        return self.amount
+        return self._body['amount']
 
+    @property
     def money_amount(self):
-        return self.money_amount
+        return self._body['money_amount']
 
+    @property
     def point_amount(self):
-        return self.point_amount
+        return self._body['point_amount']
 
+    @property
     def done_at(self):
-        return self.done_at
+        return self._body['done_at']
 
+    @property
     def type(self):
-        return self.type
+        return self._body['type']
 
+    @property
     def description(self):
-        return self.description
+        return self._body['description']
 
+    @property
     def transaction_id(self):
-        return self.transaction_id
-
+        return self._body['transaction_id']
@@ -4,18 +4,16 @@ from pokepay.response.response import PokepayResponse
 
 
 class User(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.id = response_body['id']
-        self.name = response_body['name']
-        self.is_merchant = response_body['is_merchant']
+    __slots__ = ()
 
+    @property
     def id(self):
-        return self.id
+        return self._body['id']
 
+    @property
     def name(self):
-        return self.name
+        return self._body['name']
 
+    @property
     def is_merchant(self):
-        return self.is_merchant
-
+        return self._body['is_merchant']
@@ -4,38 +4,36 @@ from pokepay.response.response import PokepayResponse
 
 
 class UserStatsOperation(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.id = response_body['id']
-        self.start = response_body['from']
-        self.to = response_body['to']
-        self.status = response_body['status']
-        self.error_reason = response_body['error_reason']
-        self.done_at = response_body['done_at']
-        self.file_url = response_body['file_url']
-        self.requested_at = response_body['requested_at']
+    __slots__ = ()
 
+    @property
     def id(self):
-        return self.id
+        return self._body['id']
 
+    @property
     def start(self):
-        return self.start
+        return self._body['from']
 
+    @property
     def to(self):
-        return self.to
+        return self._body['to']
 
+    @property
     def status(self):
-        return self.status
+        return self._body['status']
 
+    @property
     def error_reason(self):
-        return self.error_reason
+        return self._body['error_reason']
 
+    @property
     def done_at(self):
-        return self.done_at
+        return self._body['done_at']
 
+    @property
     def file_url(self):
-        return self.file_url
+        return self._body['file_url']
 
+    @property
     def requested_at(self):
-        return self.requested_at
-
+        return self._body['requested_at']
@@ -4,50 +4,48 @@ from pokepay.response.response import PokepayResponse
 
 
 class UserTransaction(PokepayResponse):
-    def __init__(self, response, response_body):
-        super().__init__(response, response_body)
-        self.id = response_body['id']
-        self.user = response_body['user']
-        self.balance = response_body['balance']
-        self.amount = response_body['amount']
-        self.money_amount = response_body['money_amount']
-        self.point_amount = response_body['point_amount']
-        self.account = response_body['account']
-        self.description = response_body['description']
-        self.done_at = response_body['done_at']
-        self.type = response_body['type']
-        self.is_modified = response_body['is_modified']
+    __slots__ = ()
 
+    @property
     def id(self):
-        return self.id
+        return self._body['id']
 
+    @property
     def user(self):
-        return self.user
+        return self._body['user']
 
+    @property
     def balance(self):
-        return self.balance
+        return self._body['balance']
 
+    @property
     def amount(self):
-        return self.amount
+        return self._body['amount']
 
+    @property
     def money_amount(self):
-        return self.money_amount
+        return self._body['money_amount']
 
+    @property
     def point_amount(self):
-        return self.point_amount
+        return self._body['point_amount']
 
+    @property
     def account(self):
-        return self.account
+        return self._body['account']
 
+    @property
     def description(self):
-        return self.description
+        return self._body['description']
 
+    @property
     def done_at(self):
-        return self.done_at
+        return self._body['done_at']
 
+    @property
     def type(self):
-        return self.type
+        return self._body['type']
 
+    @property
     def is_modified(self):
-        return self.is_modified
-
+        return self._body['is_modified']
@@ -0,0 +1,99 @@
+import random
+import time
+import requests
+
+
+def _is_idempotent(request_object):
+    # Reads can always be repeated. Writes are only repeated when they carry
+    # a request_id, which the Partner API uses to reject duplicates.
+    if request_object.method == 'GET':
+        return True
+    return request_object.body_params.get('request_id') is not None
+
+
+def _retry_after(response):
+    value = getattr(response, 'headers', {}).get('Retry-After')
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy(object):
+    """Exponential backoff with full jitter for idempotent requests.
+
+    A request is attempted at most max_attempts times. The n-th retry waits
+    a random time in [0, min(backoff_max, backoff * 2 ** (n - 1))], or the
+    server's Retry-After when it is given. No retry is started once
+    max_elapsed seconds have passed since the first attempt, nor one that
+    would start after the caller's deadline (expires_at).
+
+    Connection timeouts are retried for every request because nothing
+    reached the server; other failures only for GET requests and for
+    writes that carry a request_id.
+    """
+
+    retry_statuses = frozenset([429, 502, 503, 504])
+    retry_exceptions = (requests.ConnectionError, requests.Timeout)
+
+    def __init__(self, max_attempts=3, backoff=0.2, backoff_max=5.0,
+                 max_elapsed=30.0, sleep=time.sleep):
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be positive')
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.max_elapsed = max_elapsed
+        self.sleep = sleep
+
+    @classmethod
+    def from_profile(cls, profile):
+        if profile.get('RETRY_MAX_ATTEMPTS') is None:
+            return None
+        return cls(max_attempts=profile.getint('RETRY_MAX_ATTEMPTS'),
+                   backoff=profile.getfloat('RETRY_BACKOFF', 0.2),
+                   backoff_max=profile.getfloat('RETRY_BACKOFF_MAX', 5.0),
+                   max_elapsed=profile.getfloat('RETRY_MAX_ELAPSED', 30.0))
+
+    def is_retryable(self, request_object, response=None, error=None):
+        if error is not None:
+            if isinstance(error, requests.ConnectTimeout):
+                return True
+            return (isinstance(error, self.retry_exceptions)
+                    and _is_idempotent(request_object))
+        if response.ok or response.status_code not in self.retry_statuses:
+            return False
+        return _is_idempotent(request_object)
+
+    def delay(self, attempt, response=None):
+        if response is not None:
+            retry_after = _retry_after(response)
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+        cap = min(self.backoff_max, self.backoff * (2 ** (attempt - 1)))
+        return random.uniform(0, cap)
+
+    def call(self, send, request_object, expires_at=None):
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            response, error = None, None
+            try:
+                response = send(request_object)
+            except self.retry_exceptions as e:
+                error = e
+            if (attempt >= self.max_attempts
+                    or not self.is_retryable(request_object, response, error)):
+                break
+            delay = self.delay(attempt, response)
+            now = time.monotonic()
+            if (self.max_elapsed is not None and
+                    now - started + delay > self.max_elapsed):
+                break
+            if expires_at is not None and now + delay >= expires_at:
+                break
+            self.sleep(delay)
+        if error is not None:
+            raise error
+        return response
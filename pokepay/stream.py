@@ -0,0 +1,215 @@
+import codecs
+import json
+import re
+import binascii
+from Cryptodome.Cipher import AES
+from .crypto import _URLSAFE_TO_STD
+
+_BLOCK_SIZE = 16
+_RESPONSE_DATA_KEY = b'"response_data"'
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def _iter_response_data(chunks):
+    # Yield the base64url characters of the envelope's response_data value
+    # without buffering the rest of the body. The value never contains a
+    # quote or backslash, so its end is the next '"'.
+    chunks = iter(chunks)
+    buf = b''
+    for chunk in chunks:
+        buf += chunk
+        index = buf.find(_RESPONSE_DATA_KEY)
+        if index >= 0:
+            buf = buf[index + len(_RESPONSE_DATA_KEY):]
+            break
+        buf = buf[-len(_RESPONSE_DATA_KEY):]
+    else:
+        raise ValueError('response_data not found in response body')
+    while True:
+        index = buf.find(b'"')
+        if index >= 0:
+            buf = buf[index + 1:]
+            break
+        buf = next(chunks, None)
+        if buf is None:
+            raise ValueError('truncated response body')
+    while True:
+        index = buf.find(b'"')
+        if index >= 0:
+            if index:
+                yield buf[:index]
+            return
+        if buf:
+            yield buf
+        buf = next(chunks, None)
+        if buf is None:
+            raise ValueError('truncated response body')
+
+
+def _iter_base64url(chunks):
+    rest = b''
+    for chunk in chunks:
+        data = rest + chunk.translate(_URLSAFE_TO_STD)
+        usable = len(data) - len(data) % 4
+        rest = data[usable:]
+        if usable:
+            yield binascii.a2b_base64(data[:usable])
+    if rest:
+        yield binascii.a2b_base64(rest + b'=' * (-len(rest) % 4))
+
+
+def _iter_decrypt(key_bytes, chunks):
+    # CBC-decrypt block-aligned pieces as they arrive. The last plaintext
+    # block is held back until the end so that its padding can be removed.
+    cipher = None
+    pending = b''
+    held = b''
+    for chunk in chunks:
+        data = pending + chunk
+        if cipher is None:
+            if len(data) < _BLOCK_SIZE:
+                pending = data
+                continue
+            cipher = AES.new(key_bytes, AES.MODE_CBC, data[:_BLOCK_SIZE])
+            data = data[_BLOCK_SIZE:]
+        usable = len(data) - len(data) % _BLOCK_SIZE
+        pending = data[usable:]
+        if not usable:
+            continue
+        plaintext = held + cipher.decrypt(data[:usable])
+        held = plaintext[-_BLOCK_SIZE:]
+        if len(plaintext) > _BLOCK_SIZE:
+            yield plaintext[:-_BLOCK_SIZE]
+    if pending or not held:
+        raise ValueError('ciphertext is not a whole number of blocks')
+    if held[:-held[-1]]:
+        yield held[:-held[-1]]
+
+
+class _TextReader(object):
+    """Pulls JSON values one at a time out of a stream of UTF-8 chunks."""
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.json = json.JSONDecoder()
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        if self.eof:
+            return False
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            self.eof = True
+            text = self.decoder.decode(b'', final=True)
+        else:
+            text = self.decoder.decode(chunk)
+        self.buf = self.buf[self.pos:] + text
+        self.pos = 0
+        return True
+
+    def peek(self):
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, chars):
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError('unexpected {!r} in response body'.format(char))
+        self.pos += 1
+        return char
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.json.raw_decode(self.buf, self.pos)
+                if self.eof or self.complete(value, end):
+                    self.pos = end
+                    return value
+            except ValueError:
+                if self.eof:
+                    raise
+            self.fill()
+
+    def complete(self, value, end):
+        # A number or literal ending the buffer may continue in the next
+        # chunk, so it only counts once something follows it. A number
+        # cut after its '.' or 'e' ("12." of "12.5") decodes as a shorter
+        # one, so it also has to be followed by a separator.
+        if end == len(self.buf):
+            return False
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            after = _WHITESPACE.match(self.buf, end).end()
+            return after == len(self.buf) or self.buf[after] in ',]}'
+        return True
+
+
+def _iter_rows(reader, meta):
+    reader.expect('{')
+    if reader.peek() == '}':
+        return
+    while True:
+        key = reader.value()
+        reader.expect(':')
+        if key == 'rows' and reader.peek() == '[':
+            reader.expect('[')
+            if reader.peek() == ']':
+                reader.expect(']')
+            else:
+                while True:
+                    yield reader.value()
+                    if reader.expect(',]') == ']':
+                        break
+        else:
+            meta[key] = reader.value()
+        if reader.expect(',}') == '}':
+            return
+
+
+class StreamedPage(object):
+    """A list response whose rows are decrypted and parsed while iterated.
+
+    Iterating yields the raw row dicts one by one; only the current chunk
+    of the body and the current row are held in memory. The other fields
+    of the body (count, pagination, next_page_cursor_id, ...) are collected
+    into meta as the parser reaches them, so they are complete once
+    iteration has finished.
+    """
+
+    def __init__(self, response, key_bytes, chunk_size=64 * 1024):
+        self.response = response
+        self.status_code = response.status_code
+        self.ok = response.ok
+        self.headers = response.headers
+        self.url = response.url
+        self.elapsed = response.elapsed
+        self.meta = {}
+        plaintext = _iter_decrypt(key_bytes, _iter_base64url(
+            _iter_response_data(response.iter_content(chunk_size))))
+        self.rows = _iter_rows(_TextReader(plaintext), self.meta)
+
+    def __iter__(self):
+        return self.rows
+
+    def consume(self):
+        # Drain the remaining rows so that meta is complete.
+        for _ in self.rows:
+            pass
+        return self.meta
+
+    def close(self):
+        self.rows.close()
+        self.response.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
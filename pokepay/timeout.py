@@ -0,0 +1,82 @@
+import time
+import requests
+from .endpoint import path_template
+
+
+class DeadlineExceeded(requests.Timeout):
+    """Raised when the deadline of a send() call passes before an attempt."""
+
+
+def _parse_timeout(value):
+    # 'read' or 'connect/read', in seconds.
+    connect, _, read = value.strip().rpartition('/')
+    return (float(connect) if connect else None, float(read))
+
+
+def _parse_overrides(value):
+    overrides = {}
+    for line in (value or '').splitlines():
+        if not line.strip():
+            continue
+        key, timeout = line.rsplit('=', 1)
+        overrides[key.strip()] = _parse_timeout(timeout)
+    return overrides
+
+
+class TimeoutProfile(object):
+    """Connect/read timeouts per operation and an overall call deadline.
+
+    overrides maps a request class name (e.g. 'ListTransactionsV2') or a
+    path template (e.g. '/transactions/cpm') to a read timeout or a
+    (connect, read) pair; a None connect keeps the default. Class names
+    take precedence over paths. deadline bounds a whole send() call,
+    retries included.
+    """
+
+    def __init__(self, connect=5.0, read=5.0, overrides=None, deadline=None):
+        self.connect = connect
+        self.read = read
+        self.overrides = {}
+        for key, timeout in (overrides or {}).items():
+            if not isinstance(timeout, tuple):
+                timeout = (None, timeout)
+            self.overrides[key] = timeout
+        self.deadline = deadline
+
+    @classmethod
+    def from_profile(cls, profile):
+        return cls(connect=float(profile.get('CONNECTTIMEOUT') or 5.0),
+                   read=float(profile.get('TIMEOUT') or 5.0),
+                   overrides=_parse_overrides(profile.get('TIMEOUTS')),
+                   deadline=profile.getfloat('DEADLINE', None))
+
+    def for_request(self, request_object, timeout=None):
+        if timeout is None:
+            timeout = self.overrides.get(type(request_object).__name__)
+        if timeout is None:
+            timeout = self.overrides.get(path_template(request_object.path))
+        if timeout is None:
+            return (self.connect, self.read)
+        if not isinstance(timeout, tuple):
+            timeout = (None, timeout)
+        connect, read = timeout
+        return (float(self.connect if connect is None else connect),
+                float(read))
+
+    def expires_at(self, deadline=None):
+        if deadline is None:
+            deadline = self.deadline
+        if deadline is None:
+            return None
+        return time.monotonic() + deadline
+
+
+def _bounded(timeout, expires_at):
+    # Shrink an attempt's timeouts so that it cannot outlive the deadline.
+    if expires_at is None:
+        return timeout
+    remaining = expires_at - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceeded('deadline exceeded')
+    connect, read = timeout
+    return (min(connect, remaining), min(read, remaining))
@@ -0,0 +1,114 @@
+import json
+import threading
+import requests
+
+try:
+    # pip install httpx[http2]
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class TransportResponse(object):
+    """Minimal stand-in for requests.Response built by non-requests transports.
+
+    It carries the attributes response classes read (elapsed, status_code,
+    ok, headers, url) and is returned as is for non-2xx replies, like
+    Client.send returns the raw requests.Response.
+    """
+
+    def __init__(self, status_code, headers, url, content, elapsed):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.headers = headers
+        self.url = url
+        self.content = content
+        self.elapsed = elapsed
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8')
+
+    def json(self):
+        return json.loads(self.content)
+
+
+def _translate_error(e):
+    # Surface httpx failures as the requests exceptions that the retry
+    # policy, circuit breaker and concurrency limits already understand.
+    if isinstance(e, httpx.ConnectTimeout):
+        return requests.ConnectTimeout(str(e))
+    if isinstance(e, httpx.TimeoutException):
+        return requests.ReadTimeout(str(e))
+    if isinstance(e, (httpx.NetworkError, httpx.RemoteProtocolError)):
+        return requests.ConnectionError(str(e))
+    return requests.RequestException(str(e))
+
+
+class Http2Transport(object):
+    """HTTP/2 transport multiplexing concurrent calls over few connections.
+
+    Used by Client in place of requests.Session when HTTP2 is enabled. The
+    form-encoded, encrypted envelope is unchanged. Plain http:// base URLs
+    speak HTTP/2 with prior knowledge (h2c), https:// ones negotiate it
+    through ALPN.
+    """
+
+    def __init__(self, api_base_url, cert=None, max_connections=10,
+                 keepalive=None):
+        if httpx is None:
+            raise ImportError(
+                'Http2Transport requires httpx: pip install httpx[http2]')
+        cleartext = api_base_url.startswith('http://')
+        self.client = httpx.Client(
+            http1=not cleartext, http2=True, cert=cert,
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_connections,
+                                keepalive_expiry=keepalive))
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.in_flight = 0
+        self.http2_responses = 0
+
+    def post(self, url, data, timeout):
+        connect, read = timeout
+        with self.lock:
+            self.requests += 1
+            self.in_flight += 1
+        try:
+            res = self.client.post(url, data=data, timeout=httpx.Timeout(
+                read, connect=connect))
+        except httpx.HTTPError as e:
+            raise _translate_error(e) from e
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+        if res.http_version == 'HTTP/2':
+            with self.lock:
+                self.http2_responses += 1
+        return TransportResponse(res.status_code, res.headers, str(res.url),
+                                 res.content, res.elapsed)
+
+    def pool_stats(self):
+        with self.lock:
+            stats = {
+                'requests': self.requests,
+                'in_flight': self.in_flight,
+                'http2_responses': self.http2_responses,
+            }
+        # httpx has no public view of its pool. The connection counts come
+        # from httpcore internals and are left out if those have changed.
+        try:
+            connections = list(self.client._transport._pool.connections)
+            stats.update({
+                'connections': len(connections),
+                'idle': sum(1 for conn in connections if conn.is_idle()),
+                'http2': sum(1 for conn in connections
+                             if 'HTTP/2' in conn.info()),
+            })
+        except (AttributeError, TypeError):
+            pass
+        return stats
+
+    def close(self):
+        self.client.close()
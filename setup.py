@@ -25,7 +25,9 @@ REQUIRED = ['requests', 'configparser', 'uuid', 'pytz', 'pycryptodomex']
 
 # What packages are optional?
 EXTRAS = {
-    # 'fancy feature': ['django'],
+    'async': ['aiohttp'],
+    'http2': ['httpx[http2]>=0.23,<1.0'],
+    'orjson': ['orjson'],
 }
 
 # The rest you shouldn't have to touch too much :)
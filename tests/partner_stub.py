@@ -0,0 +1,228 @@
+# coding: utf-8
+# Local stand-in for the Partner API used by the offline client tests.
+
+import base64
+import json
+import os
+import re
+import socket
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+from pokepay.crypto import AESCipher
+
+CLIENT_ID = '00000000-0000-0000-0000-000000000000'
+CLIENT_SECRET = base64.urlsafe_b64encode(bytes(range(32))).decode().rstrip('=')
+
+
+def write_config(api_base_url, **options):
+    lines = ['[global]',
+             'CLIENT_ID = ' + CLIENT_ID,
+             'CLIENT_SECRET = ' + CLIENT_SECRET,
+             'API_BASE_URL = ' + api_base_url,
+             'TIMEZONE = Asia/Tokyo',
+             'CONNECTTIMEOUT = 5',
+             'TIMEOUT = 5']
+    for key, value in options.items():
+        lines.append('{} = {}'.format(key, value))
+    fd, path = tempfile.mkstemp(suffix='.ini')
+    with os.fdopen(fd, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+    return path
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients that time out on purpose close the socket mid-reply.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class PartnerStub(object):
+    """Decrypts envelopes and answers from registered route handlers.
+
+    A handler is called as handler(request_method, request_data) and returns
+    either a body dict (200, encrypted) or a (status, body) tuple, in which
+    case non-2xx bodies are sent as plain JSON like the real error replies.
+
+    clock_offset shifts the stub's clock (and Date header) in seconds. With
+    max_skew set, envelopes whose timestamp is further than that from the
+    stub's clock are rejected with partner_request_expired.
+    """
+
+    def __init__(self):
+        self.cipher = AESCipher(CLIENT_SECRET)
+        self.routes = []
+        self.calls = []
+        self.clock_offset = 0.0
+        self.max_skew = None
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                status, payload = stub.respond(self.path,
+                                               self.rfile.read(length))
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def date_time_string(self, timestamp=None):
+                return super().date_time_string(stub.now())
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = _Server(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever,
+                                       daemon=True)
+
+    @property
+    def base_url(self):
+        return 'http://127.0.0.1:{}'.format(self.server.server_address[1])
+
+    def route(self, path_pattern, handler):
+        # Later routes take precedence so tests can override defaults.
+        self.routes.insert(0, (re.compile(path_pattern), handler))
+
+    def now(self):
+        return time.time() + self.clock_offset
+
+    def expired(self, envelope):
+        if self.max_skew is None:
+            return False
+        timestamp = datetime.fromisoformat(envelope['timestamp']).timestamp()
+        return abs(timestamp - self.now()) > self.max_skew
+
+    def respond(self, path, form_body):
+        form = parse_qs(form_body.decode('utf-8'))
+        envelope = json.loads(self.cipher.decrypt(form['data'][0]))
+        if self.expired(envelope):
+            with self.lock:
+                self.calls.append((path, form['request_method'][0], envelope))
+            return 400, json.dumps({
+                'type': 'partner_request_expired',
+                'message': 'This request is expired.'}).encode('utf-8')
+        status, body = self.dispatch(path, form['request_method'][0], envelope)
+        if 200 <= status < 300:
+            payload = json.dumps({
+                'response_data': self.cipher.encrypt(json.dumps(body)),
+                'timestamp': envelope['timestamp'],
+                'partner_call_id': envelope['partner_call_id']})
+        else:
+            payload = json.dumps(body)
+        return status, payload.encode('utf-8')
+
+    def dispatch(self, path, method, envelope):
+        with self.lock:
+            self.calls.append((path, method, envelope))
+        for pattern, handler in self.routes:
+            if pattern.fullmatch(path):
+                result = handler(method, envelope['request_data'])
+                if isinstance(result, tuple):
+                    return result
+                return 200, result
+        return 404, {'type': 'api_error', 'message': 'Not Found'}
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class H2PartnerStub(PartnerStub):
+    """Same stand-in speaking cleartext HTTP/2 (h2c, prior knowledge)."""
+
+    def __init__(self):
+        import h2.config
+        import h2.connection
+        import h2.events
+        self.h2 = h2
+        self.cipher = AESCipher(CLIENT_SECRET)
+        self.routes = []
+        self.calls = []
+        self.clock_offset = 0.0
+        self.max_skew = None
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.listen(16)
+        self.port = self.sock.getsockname()[1]
+        self.thread = threading.Thread(target=self.accept_loop, daemon=True)
+
+    @property
+    def base_url(self):
+        return 'http://127.0.0.1:{}'.format(self.port)
+
+    def accept_loop(self):
+        while True:
+            try:
+                sock, _ = self.sock.accept()
+            except OSError:
+                return
+            with self.lock:
+                self.connections += 1
+            threading.Thread(target=self.serve, args=(sock,),
+                             daemon=True).start()
+
+    def serve(self, sock):
+        h2 = self.h2
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(
+            client_side=False, header_encoding='utf-8'))
+        conn.initiate_connection()
+        sock.sendall(conn.data_to_send())
+        streams = {}
+        with sock:
+            while True:
+                try:
+                    data = sock.recv(65535)
+                except OSError:
+                    return
+                if not data:
+                    return
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.RequestReceived):
+                        streams[event.stream_id] = [dict(event.headers), b'']
+                    elif isinstance(event, h2.events.DataReceived):
+                        streams[event.stream_id][1] += event.data
+                        conn.acknowledge_received_data(
+                            event.flow_controlled_length, event.stream_id)
+                    elif isinstance(event, h2.events.StreamEnded):
+                        headers, body = streams.pop(event.stream_id)
+                        status, payload = self.respond(headers[':path'], body)
+                        conn.send_headers(event.stream_id, [
+                            (':status', str(status)),
+                            ('content-type', 'application/json'),
+                            ('content-length', str(len(payload)))])
+                        size = conn.max_outbound_frame_size
+                        for i in range(0, len(payload), size):
+                            conn.send_data(event.stream_id,
+                                           payload[i:i + size])
+                        conn.end_stream(event.stream_id)
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        sock.sendall(conn.data_to_send())
+                        return
+                sock.sendall(conn.data_to_send())
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.sock.close()
+        self.sock = None
@@ -0,0 +1,57 @@
+# coding: utf-8
+
+import asyncio
+import os
+import unittest
+import pokepay as pp
+from pokepay.async_client import AsyncClient
+from tests.partner_stub import PartnerStub, write_config
+
+
+class AsyncClientTest(unittest.TestCase):
+
+    def setUp(self):
+        self.stub = PartnerStub().start()
+        self.stub.route('/echo', lambda method, data: {
+            'status': 'ok', 'message': data['message']})
+        self.config_path = write_config(self.stub.base_url)
+
+    def tearDown(self):
+        self.stub.stop()
+        os.remove(self.config_path)
+
+    def test_send_returns_response_class(self):
+        async def run():
+            async with AsyncClient(self.config_path) as client:
+                return await client.send(pp.SendEcho('hello'))
+
+        response = asyncio.run(run())
+        self.assertIsInstance(response, pp.Echo)
+        self.assertEqual(response.message, 'hello')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.stub.calls[0][1], 'POST')
+
+    def test_concurrent_sends_share_session(self):
+        async def run():
+            async with AsyncClient(self.config_path,
+                                   connection_limit=8) as client:
+                return await asyncio.gather(
+                    *[client.send(pp.SendEcho(str(i))) for i in range(32)])
+
+        responses = asyncio.run(run())
+        self.assertEqual([r.message for r in responses],
+                         [str(i) for i in range(32)])
+
+    def test_error_returns_raw_response(self):
+        async def run():
+            async with AsyncClient(self.config_path) as client:
+                return await client.send(pp.GetPing())
+
+        response = asyncio.run(run())
+        self.assertFalse(response.ok)
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()['type'], 'api_error')
+
+
+if __name__ == '__main__':
+    unittest.main()
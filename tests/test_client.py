@@ -0,0 +1,839 @@
+# coding: utf-8
+
+import json
+import os
+import tempfile
+import requests
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+import pokepay as pp
+from pokepay.client import Client
+from pokepay.retry import RetryPolicy
+from pokepay.circuit import CircuitBreaker, CircuitOpenError
+from pokepay.hedge import HedgePolicy
+from pokepay.ratelimit import RateLimiter
+from pokepay.timeout import DeadlineExceeded
+from pokepay.codec import JsonCodec
+from tests.partner_stub import PartnerStub, write_config
+
+
+class ClientTestCase(unittest.TestCase):
+    config_options = {}
+
+    def setUp(self):
+        self.stub = PartnerStub().start()
+        self.stub.route('/echo', lambda method, data: {
+            'status': 'ok', 'message': data['message']})
+        self.config_path = write_config(self.stub.base_url,
+                                        **self.config_options)
+        self.client = Client(self.config_path)
+
+    def tearDown(self):
+        self.stub.stop()
+        os.remove(self.config_path)
+
+
+class SendTest(ClientTestCase):
+
+    def test_send(self):
+        response = self.client.send(pp.SendEcho('hello'))
+        self.assertIsInstance(response, pp.Echo)
+        self.assertEqual(response.message, 'hello')
+
+    def test_send_with_stdlib_codec(self):
+        client = Client(self.config_path, json_codec=JsonCodec())
+        self.assertEqual(client.send(pp.SendEcho('こんにちは')).message,
+                         'こんにちは')
+
+    def test_send_error_returns_raw_response(self):
+        response = self.client.send(pp.GetPing())
+        self.assertEqual(response.status_code, 404)
+
+
+class SendManyTest(ClientTestCase):
+
+    def test_ordered(self):
+        requests = (pp.SendEcho(str(i)) for i in range(50))
+        results = list(self.client.send_many(requests, max_concurrency=4))
+        self.assertEqual([r.index for r in results], list(range(50)))
+        self.assertEqual([r.response.message for r in results],
+                         [str(i) for i in range(50)])
+        self.assertTrue(all(r.ok for r in results))
+
+    def test_unordered(self):
+        requests = [pp.SendEcho(str(i)) for i in range(50)]
+        results = list(self.client.send_many(requests, max_concurrency=4,
+                                             ordered=False))
+        self.assertEqual(sorted(r.index for r in results), list(range(50)))
+
+    def test_errors_are_captured(self):
+        requests = [pp.SendEcho('a'), pp.GetPing(), pp.SendEcho('b')]
+        results = list(self.client.send_many(requests))
+        self.assertTrue(results[0].ok)
+        self.assertFalse(results[1].ok)
+        self.assertEqual(results[1].response.status_code, 404)
+        self.assertTrue(results[2].ok)
+
+        self.client.api_base_url = 'http://127.0.0.1:1'
+        results = list(self.client.send_many(requests))
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(r.error is not None for r in results))
+
+
+class PoolTest(ClientTestCase):
+    config_options = {'POOL_MAXSIZE': 4, 'POOL_BLOCK': 'true'}
+
+    def test_options_from_profile(self):
+        self.assertEqual(self.client.adapter._pool_maxsize, 4)
+        self.assertTrue(self.client.adapter._pool_block)
+
+    def test_connections_are_reused(self):
+        for i in range(5):
+            self.client.send(pp.SendEcho(str(i)))
+        stats = self.client.pool_stats()
+        self.assertEqual(stats['pools'], 1)
+        self.assertEqual(stats['created'], 1)
+        self.assertEqual(stats['reused'], 4)
+        self.assertEqual(stats['in_use'], 0)
+        self.assertEqual(stats['idle'], 1)
+
+    def test_concurrency_bounded_by_pool(self):
+        requests = [pp.SendEcho(str(i)) for i in range(40)]
+        results = list(self.client.send_many(requests, max_concurrency=8))
+        self.assertTrue(all(r.ok for r in results))
+        stats = self.client.pool_stats()
+        self.assertLessEqual(stats['created'], 4)
+        self.assertEqual(stats['discarded'], 0)
+
+    def test_closed_pools_are_not_counted(self):
+        self.client.send(pp.SendEcho('a'))
+        self.client.adapter.poolmanager.clear()
+        stats = self.client.pool_stats()
+        self.assertEqual(stats['pools'], 0)
+        self.assertEqual(stats['idle'], 0)
+
+    def test_idle_keepalive_expiry(self):
+        self.client.adapter.close()
+        self.client = Client(self.config_path, keepalive=0)
+        self.client.send(pp.SendEcho('a'))
+        self.client.send(pp.SendEcho('b'))
+        stats = self.client.pool_stats()
+        self.assertEqual(stats['created'], 2)
+        self.assertEqual(stats['reused'], 0)
+
+
+def flaky(failures, status=503, body=None):
+    state = {'calls': 0}
+
+    def handler(method, data):
+        state['calls'] += 1
+        if state['calls'] <= failures:
+            return status, {'type': 'temporarily_unavailable',
+                            'message': 'Service Unavailable'}
+        return body or {'pong': 'ok'}
+    return handler
+
+
+class RetryTest(ClientTestCase):
+    config_options = {'RETRY_MAX_ATTEMPTS': 3, 'RETRY_BACKOFF': 0}
+
+    def test_policy_from_profile(self):
+        self.assertEqual(self.client.retry.max_attempts, 3)
+
+    def test_get_is_retried(self):
+        self.stub.route('/ping', flaky(2))
+        response = self.client.send(pp.GetPing())
+        self.assertEqual(response.pong, 'ok')
+        self.assertEqual(len(self.stub.calls), 3)
+
+    def test_gives_up_after_max_attempts(self):
+        self.stub.route('/ping', flaky(5))
+        response = self.client.send(pp.GetPing())
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(self.stub.calls), 3)
+
+    def test_write_without_request_id_is_not_retried(self):
+        self.stub.route('/transactions/topup', flaky(1))
+        response = self.client.send(pp.CreateTopupTransaction(
+            'shop', 'customer', 'money'))
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(self.stub.calls), 1)
+
+    def test_write_with_request_id_is_retried(self):
+        self.stub.route('/echo', flaky(1, body={
+            'status': 'ok', 'message': 'hello'}))
+        request = pp.SendEcho('hello')
+        request.body_params['request_id'] = 'req-1'
+        response = self.client.send(request)
+        self.assertEqual(response.message, 'hello')
+        self.assertEqual(len(self.stub.calls), 2)
+        call_ids = set(call[2]['partner_call_id'] for call in self.stub.calls)
+        self.assertEqual(len(call_ids), 2)
+
+    def test_client_errors_are_not_retried(self):
+        self.stub.route('/ping', flaky(1, status=400))
+        response = self.client.send(pp.GetPing())
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(len(self.stub.calls), 1)
+
+    def test_backoff_is_bounded(self):
+        delays = []
+        policy = RetryPolicy(max_attempts=6, backoff=1.0, backoff_max=4.0,
+                             sleep=delays.append)
+        self.client.retry = policy
+        self.stub.route('/ping', flaky(5))
+        self.client.send(pp.GetPing())
+        self.assertEqual(len(delays), 5)
+        for attempt, delay in enumerate(delays, 1):
+            self.assertLessEqual(delay, min(4.0, 2 ** (attempt - 1)))
+
+    def test_max_elapsed(self):
+        self.client.retry = RetryPolicy(max_attempts=10, backoff=1.0,
+                                        max_elapsed=0.0)
+        self.stub.route('/ping', flaky(5))
+        self.client.send(pp.GetPing())
+        self.assertEqual(len(self.stub.calls), 1)
+
+
+class CircuitBreakerTest(ClientTestCase):
+    config_options = {'CIRCUIT_FAILURE_THRESHOLD': 2}
+
+    def setUp(self):
+        super().setUp()
+        self.now = [0.0]
+        self.client.circuit_breaker = CircuitBreaker(
+            failure_threshold=2, recovery_timeout=10,
+            clock=lambda: self.now[0])
+        self.stub.route('/accounts/[^/]+', flaky(2, status=502, body={
+            'status': 'ok', 'message': 'recovered'}))
+
+    def test_from_profile(self):
+        self.assertEqual(
+            Client(self.config_path).circuit_breaker.failure_threshold, 2)
+
+    def test_opens_after_threshold_and_recovers(self):
+        path = '/accounts/ce82075e-0d91-419b-b5bc-31458306bc55'
+        request = pp.SendEcho('x')
+        request.path = path
+        self.assertEqual(self.client.send(request).status_code, 502)
+        self.assertEqual(self.client.send(request).status_code, 502)
+        with self.assertRaises(CircuitOpenError) as cm:
+            self.client.send(request)
+        self.assertEqual(cm.exception.path, '/accounts/:id')
+        self.assertEqual(len(self.stub.calls), 2)
+
+        # Other paths are unaffected.
+        self.assertEqual(self.client.send(pp.SendEcho('y')).message, 'y')
+
+        self.now[0] = 10.0
+        self.assertEqual(self.client.circuit_breaker.state(path), 'half_open')
+        self.assertEqual(self.client.send(request).message, 'recovered')
+        self.assertEqual(self.client.circuit_breaker.state(path), 'closed')
+
+    def test_failed_probe_reopens(self):
+        self.stub.route('/echo', flaky(10, status=503))
+        request = pp.SendEcho('x')
+        self.client.send(request)
+        self.client.send(request)
+        self.now[0] = 10.0
+        self.assertEqual(self.client.send(request).status_code, 503)
+        self.assertEqual(self.client.circuit_breaker.state('/echo'), 'open')
+        with self.assertRaises(CircuitOpenError):
+            self.client.send(request)
+
+    def test_results_admitted_before_a_state_change_are_ignored(self):
+        breaker = self.client.circuit_breaker
+        path = '/transactions-v2'
+        raw = requests.Response()
+        raw.status_code = 200
+        ok = pp.PokepayResponse(raw, {})
+        slow = breaker.before(path)
+        for _ in range(2):
+            breaker.record(breaker.before(path), error=requests.ReadTimeout())
+        self.assertEqual(breaker.state(path), 'open')
+        breaker.record(slow, response=ok)
+        self.assertEqual(breaker.state(path), 'open')
+
+        # Only the probe's result moves a half-open circuit.
+        self.now[0] = 10.0
+        probe = breaker.before(path)
+        breaker.record(slow, response=ok)
+        self.assertEqual(breaker.state(path), 'half_open')
+        with self.assertRaises(CircuitOpenError):
+            breaker.before(path)
+        breaker.record(probe, response=ok)
+        self.assertEqual(breaker.state(path), 'closed')
+
+
+def slow_first(body, seconds=1.0):
+    state = {'calls': 0}
+    lock = threading.Lock()
+
+    def handler(method, data):
+        with lock:
+            state['calls'] += 1
+            calls = state['calls']
+        if calls == 1:
+            time.sleep(seconds)
+        return body
+    return handler
+
+
+class HedgeTest(ClientTestCase):
+    config_options = {'HEDGE_PERCENTILE': 0.9, 'HEDGE_INITIAL_DELAY': 0.05}
+
+    def test_slow_get_is_hedged(self):
+        self.stub.route('/ping', slow_first({'pong': 'ok'}, seconds=2.0))
+        started = time.monotonic()
+        response = self.client.send(pp.GetPing())
+        self.assertEqual(response.pong, 'ok')
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(self.client.hedge.stats(),
+                         {'hedged': 1, 'hedge_wins': 1})
+
+    def test_fast_get_is_not_hedged(self):
+        self.stub.route('/ping', lambda method, data: {'pong': 'ok'})
+        self.client.hedge = HedgePolicy(initial_delay=1.0)
+        self.client.send(pp.GetPing())
+        self.assertEqual(len(self.stub.calls), 1)
+        self.assertEqual(self.client.hedge.stats()['hedged'], 0)
+
+    def test_flat_latency_above_executor_size_is_not_hedged(self):
+        # More concurrent calls than workers: the time a primary waits for
+        # a worker does not count towards its hedge delay.
+        def ping(method, data):
+            time.sleep(0.2)
+            return {'pong': 'ok'}
+        self.stub.route('/ping', ping)
+        self.client.hedge = HedgePolicy(initial_delay=0.5, max_workers=2)
+        results = list(self.client.send_many(
+            [pp.GetPing() for _ in range(16)], max_concurrency=16))
+        self.assertTrue(all(r.ok for r in results))
+        self.assertEqual(self.client.hedge.stats()['hedged'], 0)
+        self.assertEqual(len(self.stub.calls), 16)
+
+    def test_executor_sized_from_profile(self):
+        self.assertEqual(self.client.hedge.executor._max_workers, 10)
+        config_path = write_config(self.stub.base_url, POOL_MAXSIZE=4,
+                                   **self.config_options)
+        self.addCleanup(os.remove, config_path)
+        hedge = Client(config_path).hedge
+        self.assertEqual(hedge.primaries._max_workers, 4)
+        self.assertEqual(hedge.executor._max_workers, 4)
+        config_path = write_config(self.stub.base_url, HEDGE_WORKERS=32,
+                                   **self.config_options)
+        self.addCleanup(os.remove, config_path)
+        self.assertEqual(Client(config_path).hedge.executor._max_workers, 32)
+
+    def test_writes_are_never_hedged(self):
+        self.stub.route('/echo', slow_first(
+            {'status': 'ok', 'message': 'x'}, seconds=0.3))
+        self.client.send(pp.SendEcho('x'))
+        self.assertEqual(len(self.stub.calls), 1)
+
+    def test_delay_follows_observed_latency(self):
+        hedge = HedgePolicy(percentile=0.5, min_samples=3, initial_delay=1.0)
+        self.assertEqual(hedge.delay('/ping'), 1.0)
+        for seconds in [0.1, 0.2, 0.3]:
+            hedge.samples['/ping'].append(seconds)
+        self.assertEqual(hedge.delay('/ping'), 0.2)
+
+
+class TimeoutTest(ClientTestCase):
+    config_options = {'TIMEOUTS': '\n    ListTransactionsV2 = 60'
+                                  '\n    /transactions/cpm = 1/2'
+                                  '\n    /accounts/:id = 3'}
+
+    def test_overrides(self):
+        timeouts = self.client.timeouts
+        self.assertEqual(timeouts.for_request(pp.ListTransactionsV2()),
+                         (5.0, 60.0))
+        self.assertEqual(timeouts.for_request(pp.CreateCpmTransaction(
+            'token', 'shop', 100)), (1.0, 2.0))
+        self.assertEqual(timeouts.for_request(pp.GetAccount(
+            'ce82075e-0d91-419b-b5bc-31458306bc55')), (5.0, 3.0))
+        self.assertEqual(timeouts.for_request(pp.GetPing()), (5.0, 5.0))
+        self.assertEqual(timeouts.for_request(pp.GetPing(), (0.5, 0.7)),
+                         (0.5, 0.7))
+
+    def test_send_timeout(self):
+        self.stub.route('/ping', slow_first({'pong': 'ok'}, seconds=1.0))
+        with self.assertRaises(requests.ReadTimeout):
+            self.client.send(pp.GetPing(), timeout=0.1)
+
+    def test_deadline_covers_retries(self):
+        self.stub.route('/ping', lambda method, data: (
+            time.sleep(0.2) or (503, {'type': 'temporarily_unavailable'})))
+        self.client.retry = RetryPolicy(max_attempts=100, backoff=0.01)
+        started = time.monotonic()
+        try:
+            response = self.client.send(pp.GetPing(), deadline=0.5)
+            self.assertEqual(response.status_code, 503)
+        except requests.Timeout:
+            # The last attempt was cut short by the deadline.
+            pass
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertLessEqual(len(self.stub.calls), 3)
+
+    def test_expired_deadline(self):
+        with self.assertRaises(DeadlineExceeded):
+            self.client.send(pp.GetPing(), deadline=0)
+
+    def test_deadline_covers_rate_limit_wait(self):
+        self.client.rate_limiter = RateLimiter(rate=1, burst=1)
+        self.client.send(pp.SendEcho('a'))
+        started = time.monotonic()
+        with self.assertRaises(DeadlineExceeded):
+            self.client.send(pp.SendEcho('b'), deadline=0.2)
+        self.assertLess(time.monotonic() - started, 0.2)
+        self.assertEqual(len(self.stub.calls), 1)
+
+
+class PreparedCallTest(ClientTestCase):
+
+    def prepared_call_id(self, prepared):
+        envelope = json.loads(self.client.cipher.decrypt(
+            prepared.params['data']))
+        return envelope['partner_call_id']
+
+    def test_send_prepared(self):
+        prepared = self.client.prepare(pp.SendEcho('hello'))
+        call_id = self.prepared_call_id(prepared)
+        self.assertEqual(self.client.send_prepared(prepared).message, 'hello')
+        self.assertEqual(self.stub.calls[-1][2]['partner_call_id'], call_id)
+
+    def test_stale_payload_is_rebuilt(self):
+        self.client.prepared_max_age = 0.0
+        prepared = self.client.prepare(pp.SendEcho('hello'))
+        call_id = self.prepared_call_id(prepared)
+        self.assertEqual(self.client.send_prepared(prepared).message, 'hello')
+        self.assertNotEqual(self.stub.calls[-1][2]['partner_call_id'],
+                            call_id)
+
+    def test_pipelined(self):
+        requests = (pp.SendEcho(str(i)) for i in range(50))
+        results = list(self.client.send_pipelined(requests,
+                                                  max_concurrency=4))
+        self.assertEqual([r.index for r in results], list(range(50)))
+        self.assertEqual([r.request.body_params['message'] for r in results],
+                         [str(i) for i in range(50)])
+        self.assertEqual([r.response.message for r in results],
+                         [str(i) for i in range(50)])
+
+    def test_pipelined_early_exit(self):
+        requests = (pp.SendEcho(str(i)) for i in range(1000))
+        results = self.client.send_pipelined(requests, max_concurrency=2,
+                                             ordered=False)
+        self.assertTrue(next(results).ok)
+        results.close()
+        self.assertLess(len(self.stub.calls), 100)
+
+
+class ClockSkewTest(ClientTestCase):
+
+    def test_synchronized_clock_is_not_shifted(self):
+        self.client.send(pp.SendEcho('hello'))
+        stats = self.client.clock_skew.stats()
+        self.assertEqual(stats['samples'], 1)
+        self.assertEqual(stats['offset'], 0.0)
+        self.assertLess(abs(stats['estimate']), 1.0)
+
+    def test_offset_is_learned_from_date_header(self):
+        self.stub.clock_offset = -120.0
+        self.client.send(pp.SendEcho('hello'))
+        self.assertAlmostEqual(self.client.clock_skew.offset, -120.0,
+                               delta=1.0)
+        self.client.send(pp.SendEcho('hello'))
+        timestamp = datetime.fromisoformat(
+            self.stub.calls[-1][2]['timestamp']).timestamp()
+        self.assertAlmostEqual(timestamp, self.stub.now(), delta=1.5)
+
+    def test_expired_request_is_resent_once(self):
+        self.stub.clock_offset = 600.0
+        self.stub.max_skew = 60.0
+        self.assertEqual(self.client.send(pp.SendEcho('hello')).message,
+                         'hello')
+        self.assertEqual(len(self.stub.calls), 2)
+        self.assertEqual(self.client.clock_skew.stats()['resent'], 1)
+        self.client.send(pp.SendEcho('hello'))
+        self.assertEqual(len(self.stub.calls), 3)
+
+    def test_disabled(self):
+        self.stub.clock_offset = 600.0
+        self.stub.max_skew = 60.0
+        config_path = write_config(self.stub.base_url, CLOCK_SKEW='false')
+        self.addCleanup(os.remove, config_path)
+        client = Client(config_path)
+        self.assertIsNone(client.clock_skew)
+        response = client.send(pp.SendEcho('hello'))
+        self.assertIsInstance(response, requests.Response)
+        self.assertEqual(response.json()['type'], 'partner_request_expired')
+
+
+def paged(total, default_per_page=10):
+    # Handler serving rows 0..total-1 as a page-based list.
+    def handler(method, data):
+        page = data.get('page', 1)
+        per_page = data.get('per_page', default_per_page)
+        max_page = max(1, -(-total // per_page))
+        start = (page - 1) * per_page
+        return {'rows': [{'id': str(i)} for i in
+                         range(start, min(start + per_page, total))],
+                'count': total,
+                'pagination': {'current': page, 'per_page': per_page,
+                               'max_page': max_page, 'has_prev': page > 1,
+                               'has_next': page < max_page}}
+    return handler
+
+
+class IterateTest(ClientTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.stub.route('/bills', paged(95))
+
+    def pages_requested(self):
+        return [call[2]['request_data'].get('page')
+                for call in self.stub.calls]
+
+    def test_all_pages(self):
+        rows = list(self.client.iterate(pp.ListBills(is_disabled=False)))
+        self.assertEqual([row['id'] for row in rows],
+                         [str(i) for i in range(95)])
+        self.assertEqual(self.pages_requested(), list(range(1, 11)))
+        self.assertFalse(self.stub.calls[0][2]['request_data']['is_disabled'])
+
+    def test_per_page_and_start_page(self):
+        request = pp.ListBills()
+        pages = self.client.iterate(request, per_page=50, start_page=2)
+        self.assertEqual([row['id'] for row in pages],
+                         [str(i) for i in range(50, 95)])
+        self.assertEqual(pages.pagination['current'], 2)
+        self.assertEqual(pages.count, 95)
+        self.assertEqual(request.body_params, {})
+
+    def test_limits(self):
+        rows = list(self.client.iterate(pp.ListBills(), limit=25))
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(self.pages_requested(), [1, 2, 3])
+        self.stub.calls = []
+        rows = list(self.client.iterate(pp.ListBills(), max_pages=2))
+        self.assertEqual(len(rows), 20)
+        self.assertEqual(self.pages_requested(), [1, 2])
+
+    def test_next_page_is_prefetched(self):
+        pages = self.client.iterate(pp.ListBills())
+        next(iter(pages))
+        time.sleep(0.2)
+        self.assertEqual(self.pages_requested(), [1, 2])
+        pages.close()
+        time.sleep(0.2)
+        self.assertEqual(self.pages_requested(), [1, 2])
+        pages = self.client.iterate(pp.ListBills(), prefetch=False)
+        next(iter(pages))
+        time.sleep(0.2)
+        self.assertEqual(self.pages_requested(), [1, 2, 1])
+
+    def test_adaptive_per_page(self):
+        # Pages cost 2ms per row against a 100ms target, so the size
+        # grows; no row may be lost or repeated across the size changes.
+        handler = paged(95)
+
+        def slow(method, data):
+            time.sleep(0.002 * data.get('per_page', 10))
+            return handler(method, data)
+        self.stub.route('/bills', slow)
+        page_size = pp.AdaptivePageSize(initial=5, target_latency=0.1,
+                                        min_size=1)
+        rows = list(self.client.iterate(pp.ListBills(), per_page=page_size))
+        self.assertEqual([row['id'] for row in rows],
+                         [str(i) for i in range(95)])
+        sizes = [call[2]['request_data']['per_page']
+                 for call in self.stub.calls]
+        self.assertEqual(sizes[0], 5)
+        self.assertGreater(max(sizes), 10)
+        self.assertEqual(page_size.stats()['per_page'], sizes[-1])
+
+    def test_failed_page(self):
+        self.stub.route('/bills', lambda method, data: (400, {
+            'type': 'invalid_parameters', 'message': 'Invalid parameters'}))
+        with self.assertRaises(pp.PageError) as context:
+            list(self.client.iterate(pp.ListBills()))
+        self.assertEqual(context.exception.page, 1)
+        self.assertEqual(context.exception.response.status_code, 400)
+
+
+class IterateParallelTest(ClientTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.stub.route('/bills', paged(95))
+
+    def test_ordered(self):
+        pages = self.client.iterate_parallel(pp.ListBills(),
+                                             max_concurrency=4)
+        self.assertEqual([row['id'] for row in pages],
+                         [str(i) for i in range(95)])
+        self.assertEqual(pages.pages, 10)
+        self.assertEqual(pages.duplicates, 0)
+
+    def test_unordered(self):
+        rows = list(self.client.iterate_parallel(
+            pp.ListBills(), per_page=7, ordered=False))
+        self.assertEqual(sorted(int(row['id']) for row in rows),
+                         list(range(95)))
+        self.assertTrue(all(call[2]['request_data']['per_page'] == 7
+                            for call in self.stub.calls))
+
+    def test_limits(self):
+        rows = list(self.client.iterate_parallel(pp.ListBills(),
+                                                 max_pages=3))
+        self.assertEqual(len(rows), 30)
+        rows = list(self.client.iterate_parallel(pp.ListBills(), limit=15))
+        self.assertEqual([row['id'] for row in rows],
+                         [str(i) for i in range(15)])
+
+    def test_shifted_rows(self):
+        # Six rows are inserted at the head once page 1 has been served:
+        # page 2 repeats six rows of page 1 and a page 11 appears.
+        ids = [str(i) for i in range(95)]
+
+        def handler(method, data):
+            page = data.get('page', 1)
+            rows = [{'id': i} for i in ids[(page - 1) * 10:page * 10]]
+            max_page = -(-len(ids) // 10)
+            if page == 1:
+                ids[:0] = ['new{}'.format(i) for i in range(6)]
+            return {'rows': rows, 'count': len(ids),
+                    'pagination': {'current': page, 'per_page': 10,
+                                   'max_page': max_page,
+                                   'has_prev': page > 1,
+                                   'has_next': page < max_page}}
+        self.stub.route('/bills', handler)
+        pages = self.client.iterate_parallel(pp.ListBills())
+        rows = [row['id'] for row in pages]
+        self.assertEqual(sorted(rows, key=int), [str(i) for i in range(95)])
+        self.assertEqual(pages.duplicates, 6)
+        self.assertEqual(pages.pages, 11)
+
+
+def cursored(total, default_per_page=50):
+    # Handler serving rows 0..total-1 as a cursor based list; a cursor is
+    # the id of the row the page starts after (next) or ends before (prev).
+    def handler(method, data):
+        per_page = data.get('per_page', default_per_page)
+        if 'prev_page_cursor_id' in data:
+            end = int(data['prev_page_cursor_id'])
+            start = max(0, end - per_page)
+        else:
+            start = int(data.get('next_page_cursor_id', -1)) + 1
+            end = min(total, start + per_page)
+        rows = [{'id': str(i)} for i in range(start, end)]
+        return {'rows': rows, 'per_page': per_page, 'count': total,
+                'next_page_cursor_id': rows[-1]['id'] if end < total
+                else None,
+                'prev_page_cursor_id': rows[0]['id'] if start > 0 else None}
+    return handler
+
+
+class IterateCursorTest(ClientTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.stub.route('/transactions-v2', cursored(230))
+
+    def test_all_pages(self):
+        pages = self.client.iterate_cursor(pp.ListTransactionsV2(),
+                                           per_page=100)
+        self.assertEqual([row['id'] for row in pages],
+                         [str(i) for i in range(230)])
+        self.assertEqual(pages.pages, 3)
+        self.assertEqual(pages.cursor, '229')
+        self.assertEqual([call[2]['request_data'].get('next_page_cursor_id')
+                          for call in self.stub.calls], [None, '99', '199'])
+
+    def test_resume(self):
+        pages = self.client.iterate_cursor(pp.ListTransactionsV2(),
+                                           limit=120, prefetch=3)
+        self.assertEqual(len(list(pages)), 120)
+        rest = self.client.iterate_cursor(pp.ListTransactionsV2(),
+                                          cursor=pages.cursor)
+        self.assertEqual([row['id'] for row in rest],
+                         [str(i) for i in range(120, 230)])
+
+    def test_adaptive_per_page(self):
+        pages = self.client.iterate_cursor(pp.ListTransactionsV2(),
+                                           per_page='auto')
+        self.assertEqual([row['id'] for row in pages],
+                         [str(i) for i in range(230)])
+        self.assertEqual([call[2]['request_data']['per_page']
+                          for call in self.stub.calls], [100, 200])
+
+    def test_prev_direction(self):
+        pages = self.client.iterate_cursor(pp.ListTransactionsV2(),
+                                           cursor='120', direction='prev')
+        self.assertEqual([row['id'] for row in pages],
+                         [str(i) for i in range(119, -1, -1)])
+
+    def test_failed_page(self):
+        self.stub.route('/transactions-v2', lambda method, data: (400, {
+            'type': 'invalid_parameters', 'message': 'Invalid parameters'}))
+        with self.assertRaises(pp.PageError):
+            list(self.client.iterate_cursor(pp.ListTransactionsV2()))
+
+
+def ledger(done_ats):
+    # Handler for /transactions-v2 over rows with the given done_at times,
+    # filtered by from/to (inclusive) and listed newest first.
+    rows = sorted(({'id': str(i), 'done_at': done_at.isoformat()}
+                   for i, done_at in enumerate(done_ats)),
+                  key=lambda row: row['done_at'], reverse=True)
+
+    def handler(method, data):
+        start = datetime.fromisoformat(data['from'])
+        end = datetime.fromisoformat(data['to'])
+        window = [row for row in rows
+                  if start <= datetime.fromisoformat(row['done_at']) <= end]
+        index = 0
+        if 'next_page_cursor_id' in data:
+            index = [row['id'] for row in window].index(
+                data['next_page_cursor_id']) + 1
+        page = window[index:index + data['per_page']]
+        more = index + len(page) < len(window)
+        return {'rows': page, 'per_page': data['per_page'],
+                'count': len(window),
+                'next_page_cursor_id': page[-1]['id'] if more else None,
+                'prev_page_cursor_id': None}
+    return handler
+
+
+class IterateWindowsTest(ClientTestCase):
+    start = datetime(2026, 10, 1, tzinfo=timezone(timedelta(hours=9)))
+    end = start + timedelta(days=1)
+
+    def test_rows_in_done_at_order(self):
+        # One row per minute, plus a burst of 300 rows in one minute and
+        # rows on window boundaries.
+        done_ats = [self.start + timedelta(minutes=i) for i in range(1441)]
+        done_ats += [self.start + timedelta(hours=5, microseconds=i * 100)
+                     for i in range(300)]
+        self.stub.route('/transactions-v2', ledger(done_ats))
+        scan = self.client.iterate_windows(
+            pp.ListTransactionsV2(private_money_id='money'), self.start,
+            self.end, max_concurrency=4, per_page=50, target_pages=2)
+        rows = list(scan)
+        self.assertEqual(sorted(int(row['id']) for row in rows),
+                         list(range(len(done_ats))))
+        keys = [row['done_at'] for row in rows]
+        self.assertEqual(keys, sorted(keys, reverse=True))
+        self.assertGreater(scan.splits, 0)
+        self.assertGreater(scan.duplicates, 0)
+        requested = [call[2]['request_data'] for call in self.stub.calls]
+        self.assertTrue(all(data['private_money_id'] == 'money'
+                            for data in requested))
+
+    def test_close(self):
+        done_ats = [self.start + timedelta(seconds=i) for i in range(5000)]
+        self.stub.route('/transactions-v2', ledger(done_ats))
+        scan = self.client.iterate_windows(pp.ListTransactionsV2(),
+                                           self.start, self.end, per_page=10)
+        next(iter(scan))
+        scan.close()
+        calls = len(self.stub.calls)
+        time.sleep(0.3)
+        self.assertEqual(len(self.stub.calls), calls)
+
+
+class ExportTest(ClientTestCase):
+    start = datetime(2026, 10, 1, tzinfo=timezone(timedelta(hours=9)))
+    end = start + timedelta(days=1)
+
+    def setUp(self):
+        super().setUp()
+        done_ats = [self.start + timedelta(minutes=i) for i in range(1000)]
+        self.stub.route('/transactions-v2', ledger(done_ats))
+        fd, self.checkpoint_path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        os.remove(self.checkpoint_path)
+        self.addCleanup(lambda: os.path.exists(self.checkpoint_path) and
+                        os.remove(self.checkpoint_path))
+        self.exported = []
+
+    def sink(self, fail_after=None):
+        def sink(rows):
+            if fail_after is not None and len(self.exported) >= fail_after:
+                raise IOError('disk full')
+            self.exported.extend(row['id'] for row in rows)
+        return sink
+
+    def export(self, checkpoint, **options):
+        return self.client.export(
+            pp.ListTransactionsV2(private_money_id='money'), checkpoint,
+            per_page=50, start=self.start, end=self.end, **options)
+
+    def check_resume(self, checkpoint, **options):
+        with self.assertRaises(IOError):
+            self.export(checkpoint, **options).run(self.sink(fail_after=300))
+        crashed = len(self.exported)
+        self.assertGreater(crashed, 0)
+        export = self.export(checkpoint, **options)
+        export.load()
+        self.assertEqual(export.rows, crashed)
+        self.assertEqual(export.run(self.sink()), 1000)
+        self.assertTrue(export.done)
+        self.assertEqual(sorted(self.exported, key=int),
+                         [str(i) for i in range(1000)])
+
+    def test_resume(self):
+        calls = len(self.stub.calls)
+        self.check_resume(pp.FileCheckpoint(self.checkpoint_path))
+        # 20 pages, plus the page that failed to commit and the one read
+        # ahead of it.
+        self.assertLessEqual(len(self.stub.calls) - calls, 22)
+
+    def test_sharded_resume(self):
+        self.check_resume(pp.FileCheckpoint(self.checkpoint_path), shards=4)
+        state = pp.FileCheckpoint(self.checkpoint_path).load()
+        self.assertEqual(len(state['shards']), 4)
+        self.assertEqual(sum(shard['rows'] for shard in state['shards']),
+                         1000)
+
+    def test_sqlite(self):
+        checkpoint = pp.SqliteCheckpoint(self.checkpoint_path)
+        self.addCleanup(checkpoint.close)
+        self.check_resume(checkpoint, shards=2)
+        calls = len(self.stub.calls)
+        self.assertEqual(self.export(checkpoint, shards=2).run(self.sink()),
+                         1000)
+        self.assertEqual(len(self.stub.calls), calls)
+
+    def test_other_filters_are_rejected(self):
+        checkpoint = pp.FileCheckpoint(self.checkpoint_path)
+        self.export(checkpoint).load()
+        export = self.client.export(
+            pp.ListTransactionsV2(private_money_id='other'), checkpoint,
+            start=self.start, end=self.end)
+        with self.assertRaises(ValueError):
+            export.run(self.sink())
+
+
+class OffloadTest(ClientTestCase):
+    config_options = {'OFFLOAD_THRESHOLD': 4096, 'OFFLOAD_WORKERS': 1}
+
+    def tearDown(self):
+        self.client.offload.close()
+        super().tearDown()
+
+    def test_large_bodies_are_decoded_in_workers(self):
+        self.client.send(pp.SendEcho('small'))
+        self.assertEqual(self.client.offload.offloaded, 0)
+        message = 'あ' * 10000
+        response = self.client.send(pp.SendEcho(message))
+        self.assertEqual(response.message, message)
+        self.assertEqual(self.client.offload.offloaded, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+# coding: utf-8
+
+import json
+import unittest
+from pokepay.codec import get_codec, JsonCodec, orjson
+
+
+class CodecTest(unittest.TestCase):
+    value = {'request_data': {'message': 'こんにちは', 'amount': 100,
+                              'flag': True, 'none': None},
+             'timestamp': '2026-10-18T10:00:00+09:00'}
+
+    def test_json_codec_is_compact_utf8(self):
+        encoded = JsonCodec().dumps(self.value)
+        self.assertIsInstance(encoded, bytes)
+        self.assertNotIn(b', ', encoded)
+        self.assertIn('こんにちは'.encode('utf-8'), encoded)
+        self.assertEqual(json.loads(encoded), self.value)
+
+    @unittest.skipIf(orjson is None, 'orjson is not installed')
+    def test_codecs_agree(self):
+        self.assertEqual(get_codec().name, 'orjson')
+        self.assertEqual(get_codec('orjson').dumps(self.value),
+                         get_codec('json').dumps(self.value))
+
+    def test_unknown_codec(self):
+        with self.assertRaises(ValueError):
+            get_codec('yaml')
+
+
+if __name__ == '__main__':
+    unittest.main()
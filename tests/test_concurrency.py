@@ -0,0 +1,90 @@
+# coding: utf-8
+
+import threading
+import unittest
+from datetime import timedelta
+import requests
+from pokepay.batch import _dispatch
+from pokepay.concurrency import AdaptiveLimit
+
+
+class FakeResponse(object):
+
+    def __init__(self, seconds, status_code=200, body=None):
+        self.elapsed = timedelta(seconds=seconds)
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.body = body or {}
+
+    def json(self):
+        return self.body
+
+
+class AdaptiveLimitTest(unittest.TestCase):
+
+    def complete(self, limit, response=None, error=None, count=1):
+        # Keep the limiter saturated: fill every slot, then complete them.
+        while count > 0:
+            epochs = [limit.acquire() for _ in range(min(count, limit.limit))]
+            for epoch in epochs:
+                limit.record(epoch, response, error)
+            count -= len(epochs)
+
+    def test_grows_while_latency_is_flat(self):
+        limit = AdaptiveLimit(initial=1, max_limit=4, window=5)
+        self.complete(limit, FakeResponse(0.1), count=40)
+        self.assertEqual(limit.limit, 4)
+        self.assertAlmostEqual(limit.stats()['p90'], 0.1)
+
+    def test_holds_when_latency_rises(self):
+        limit = AdaptiveLimit(initial=1, max_limit=8, window=5)
+        self.complete(limit, FakeResponse(0.1), count=5)
+        self.complete(limit, FakeResponse(1.0), count=10)
+        self.assertEqual(limit.limit, 2)
+
+    def test_cuts_on_overload(self):
+        for response, error in [
+                (FakeResponse(0.1, 503), None),
+                (FakeResponse(0.1, 400, {
+                    'type': 'user_stats_operation_service_unavailable'}),
+                 None),
+                (None, requests.ReadTimeout())]:
+            limit = AdaptiveLimit(initial=8, max_limit=8)
+            self.complete(limit, response, error)
+            self.assertEqual(limit.limit, 4)
+
+    def test_client_errors_do_not_cut(self):
+        limit = AdaptiveLimit(initial=8, max_limit=8)
+        self.complete(limit, FakeResponse(0.1, 400,
+                                          {'type': 'invalid_parameters'}))
+        self.assertEqual(limit.limit, 8)
+
+    def test_one_cut_per_epoch(self):
+        limit = AdaptiveLimit(initial=8, max_limit=8)
+        epochs = [limit.acquire() for _ in range(4)]
+        for epoch in epochs:
+            limit.record(epoch, FakeResponse(0.1, 502))
+        self.assertEqual(limit.limit, 4)
+        self.assertEqual(limit.stats()['cuts'], 1)
+
+    def test_limits_in_flight_calls(self):
+        limit = AdaptiveLimit(initial=3, max_limit=3)
+        state = {'now': 0, 'peak': 0}
+        lock = threading.Lock()
+
+        def send(request_object):
+            with lock:
+                state['now'] += 1
+                state['peak'] = max(state['peak'], state['now'])
+            threading.Event().wait(0.01)
+            with lock:
+                state['now'] -= 1
+            return FakeResponse(0.01)
+
+        results = list(_dispatch(send, range(30), max_concurrency=limit))
+        self.assertEqual(len(results), 30)
+        self.assertLessEqual(state['peak'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+# coding: utf-8
+
+import unittest
+from pokepay.crypto import AESCipher, _encrypt, _decrypt
+from tests.partner_stub import CLIENT_SECRET
+
+
+class AESCipherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cipher = AESCipher(CLIENT_SECRET)
+
+    def test_wire_format_matches_reference(self):
+        # Sizes straddle block boundaries and the ECB/CBC decrypt switch.
+        for size in [0, 1, 15, 16, 17, 1000, 2031, 2032, 2048, 5000]:
+            plaintext = ('あ' + 'x' * size)[:size]
+            encrypted = self.cipher.encrypt(plaintext)
+            self.assertNotIn('=', encrypted)
+            self.assertEqual(_decrypt(encrypted, CLIENT_SECRET), plaintext)
+            self.assertEqual(
+                self.cipher.decrypt(_encrypt(plaintext, CLIENT_SECRET)),
+                plaintext)
+
+    def test_bytes_api(self):
+        encrypted = self.cipher.encrypt_bytes(b'{"a": 1}')
+        self.assertIsInstance(encrypted, bytes)
+        self.assertEqual(self.cipher.decrypt_bytes(encrypted), b'{"a": 1}')
+        self.assertEqual(self.cipher.decrypt_bytes(encrypted.decode()),
+                         b'{"a": 1}')
+
+    def test_truncated_ciphertext(self):
+        with self.assertRaises(ValueError):
+            self.cipher.decrypt_bytes(self.cipher.encrypt_bytes(b'x')[:-4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+# coding: utf-8
+
+import uuid
+import unittest
+from datetime import datetime
+import pokepay as pp
+from pokepay.client import _current_timestamp
+from pokepay.envelope import _partner_call_id, _compact_body_params
+
+
+class EnvelopeTest(unittest.TestCase):
+
+    def test_partner_call_id_is_uuid4(self):
+        ids = set()
+        for _ in range(1000):
+            call_id = _partner_call_id()
+            parsed = uuid.UUID(call_id)
+            self.assertEqual(str(parsed), call_id)
+            self.assertEqual(parsed.version, 4)
+            self.assertEqual(parsed.variant, uuid.RFC_4122)
+            ids.add(call_id)
+        self.assertEqual(len(ids), 1000)
+
+    def test_timestamp(self):
+        timestamp = datetime.fromisoformat(_current_timestamp('Asia/Tokyo'))
+        self.assertEqual(timestamp.utcoffset().total_seconds(), 9 * 3600)
+        timestamp = datetime.fromisoformat(_current_timestamp(None))
+        self.assertEqual(timestamp.utcoffset().total_seconds(), 9 * 3600)
+
+    def test_null_optionals_are_dropped(self):
+        request = pp.CreateTopupTransaction('shop', 'customer', 'money',
+                                            description=None, amount=10)
+        self.assertEqual(_compact_body_params(request), {
+            'shop_id': 'shop', 'customer_id': 'customer',
+            'private_money_id': 'money', 'amount': 10})
+        self.assertIn('description', request.body_params)
+
+    def test_nullable_params_are_kept(self):
+        request = pp.UpdateBill('bill', amount=None, description=None)
+        self.assertEqual(_compact_body_params(request), {'amount': None})
+
+    def test_params_without_nulls_are_not_copied(self):
+        request = pp.GetPing()
+        self.assertIs(_compact_body_params(request), request.body_params)
+
+
+if __name__ == '__main__':
+    unittest.main()
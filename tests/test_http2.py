@@ -0,0 +1,65 @@
+# coding: utf-8
+
+import os
+import unittest
+from unittest import mock
+import pokepay as pp
+from pokepay.client import Client
+from pokepay.transport import Http2Transport
+from tests.partner_stub import H2PartnerStub, write_config
+
+
+class Http2Test(unittest.TestCase):
+
+    def setUp(self):
+        self.stub = H2PartnerStub().start()
+        self.stub.route('/echo', lambda method, data: {
+            'status': 'ok', 'message': data['message']})
+        self.config_path = write_config(self.stub.base_url, HTTP2='true')
+        self.client = Client(self.config_path)
+
+    def tearDown(self):
+        self.client.transport.close()
+        self.stub.stop()
+        os.remove(self.config_path)
+
+    def test_transport_from_profile(self):
+        self.assertIsInstance(self.client.transport, Http2Transport)
+
+    def test_send(self):
+        response = self.client.send(pp.SendEcho('hello'))
+        self.assertIsInstance(response, pp.Echo)
+        self.assertEqual(response.message, 'hello')
+        stats = self.client.pool_stats()
+        self.assertEqual(stats['http2'], 1)
+        self.assertEqual(stats['requests'], 1)
+        self.assertEqual(stats['http2_responses'], 1)
+        self.assertEqual(stats['in_flight'], 0)
+
+    def test_pool_stats_without_httpx_internals(self):
+        self.client.send(pp.SendEcho('hello'))
+        with mock.patch.object(self.client.transport.client, '_transport',
+                               object()):
+            self.assertEqual(self.client.pool_stats(), {
+                'requests': 1, 'in_flight': 0, 'http2_responses': 1})
+
+    def test_error_returns_raw_response(self):
+        response = self.client.send(pp.GetPing())
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()['type'], 'api_error')
+
+    def test_stream_requires_http1(self):
+        with self.assertRaises(RuntimeError):
+            self.client.stream(pp.ListTransactionsV2())
+
+    def test_concurrent_sends_are_multiplexed(self):
+        self.client.send(pp.SendEcho('warm up'))
+        requests = [pp.SendEcho(str(i)) for i in range(50)]
+        results = list(self.client.send_many(requests, max_concurrency=16))
+        self.assertEqual([r.response.message for r in results],
+                         [str(i) for i in range(50)])
+        self.assertEqual(self.stub.connections, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# coding: utf-8
+
+import unittest
+from datetime import timedelta
+import pokepay as pp
+from pokepay import models
+
+
+def transaction(i):
+    account = {'id': 'a{}'.format(i), 'name': '口座',
+               'is_suspended': False, 'status': 'active',
+               'private_money': {'id': 'm', 'name': 'マネー', 'unit': 'pt'}}
+    return {'id': str(i), 'type': 'payment', 'amount': i,
+            'sender': {'id': 'u', 'name': 'ユーザー', 'is_merchant': False},
+            'sender_account': account, 'receiver_account': account}
+
+
+class FakeResponse(object):
+    status_code = 200
+    headers = {}
+    url = ''
+    elapsed = timedelta(0)
+
+
+class ModelTest(unittest.TestCase):
+
+    def test_wraps_without_copying(self):
+        row = transaction(1)
+        model = models.Transaction(row)
+        self.assertIs(model.to_dict(), row)
+        self.assertEqual(model.id, '1')
+        self.assertEqual(model['amount'], 1)
+        row['amount'] = 2
+        self.assertEqual(model.amount, 2)
+
+    def test_nested_models_are_built_on_access(self):
+        model = models.Transaction(transaction(1))
+        self.assertIsNone(model._nested)
+        account = model.sender_account
+        self.assertIsInstance(account, models.Account)
+        self.assertIsInstance(account.private_money, models.PrivateMoney)
+        self.assertEqual(account.private_money.unit, 'pt')
+        self.assertIs(model.sender_account, account)
+        self.assertEqual(model.sender.name, 'ユーザー')
+
+    def test_missing_field(self):
+        model = models.Transaction(transaction(1))
+        with self.assertRaises(AttributeError):
+            model.done_at
+        self.assertIsNone(getattr(model, 'description', None))
+
+    def test_read_only(self):
+        model = models.User({'id': 'u'})
+        with self.assertRaises(AttributeError):
+            model.id = 'v'
+        with self.assertRaises(AttributeError):
+            model.extra = 1
+
+    def test_renamed_field(self):
+        self.assertEqual(models.UserStatsOperation({'from': 'a'}).start, 'a')
+
+    def test_typed_rows(self):
+        body = {'rows': [transaction(i) for i in range(3)], 'per_page': 3,
+                'count': 3, 'next_page_cursor_id': None,
+                'prev_page_cursor_id': None}
+        rows = pp.typed_rows(pp.PaginatedTransactionV2(FakeResponse(), body))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual([row.amount for row in rows], [0, 1, 2])
+        self.assertEqual(rows[1], models.Transaction(body['rows'][1]))
+        self.assertEqual(rows[1:][0].id, '1')
+        page = models.PaginatedTransactionV2(body)
+        self.assertEqual(page.rows[2].sender_account.id, 'a2')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+# coding: utf-8
+
+import unittest
+from datetime import timedelta
+import pokepay as pp
+from pokepay.paginate import AdaptivePageSize
+
+
+class FakePage(object):
+
+    def __init__(self, rows, seconds=0.0, length=None):
+        self.body = {'rows': [{}] * rows}
+        self.elapsed = timedelta(seconds=seconds)
+        self.headers = {}
+        if length is not None:
+            self.headers['Content-Length'] = str(length)
+
+
+class AdaptivePageSizeTest(unittest.TestCase):
+
+    def test_grows_towards_target_latency(self):
+        page_size = AdaptivePageSize(initial=50, target_latency=1.0)
+        page_size.record(50, FakePage(50), 0.1)
+        self.assertEqual(page_size.size(), 100)
+        page_size.record(100, FakePage(100), 0.4)
+        self.assertEqual(page_size.size(), 200)
+        page_size.record(200, FakePage(200), 0.9)
+        self.assertEqual(page_size.size(), 200)
+
+    def test_shrinks_on_slow_pages(self):
+        page_size = AdaptivePageSize(initial=800, target_latency=1.0,
+                                     min_size=100)
+        page_size.record(800, FakePage(800), 1.6)
+        self.assertEqual(page_size.size(), 500)
+        for _ in range(5):
+            page_size.record(page_size.size(), FakePage(page_size.size()),
+                             10.0)
+        self.assertEqual(page_size.size(), 100)
+
+    def test_short_pages_are_ignored(self):
+        page_size = AdaptivePageSize(initial=100)
+        page_size.record(100, FakePage(3), 0.01)
+        self.assertEqual(page_size.size(), 100)
+        self.assertEqual(page_size.stats()['pages'], 0)
+
+    def test_limits(self):
+        page_size = AdaptivePageSize(initial=40, max_bytes=100 * 1000)
+        page_size.record(40, FakePage(40, length=40 * 1000), 0.01)
+        self.assertEqual(page_size.size(), 80)
+        page_size.record(80, FakePage(80, length=80 * 1000), 0.01)
+        self.assertEqual(page_size.size(), 100)
+        page_size = AdaptivePageSize(initial=400)
+        self.assertEqual(page_size.size(pp.ListCampaigns('money')), 50)
+        self.assertEqual(page_size.size(pp.ListTransactionsV2()), 400)
+
+    def test_stats(self):
+        page_size = AdaptivePageSize(initial=10, target_latency=1.0)
+        page_size.record(10, FakePage(10, seconds=0.3, length=5000), 0.5)
+        stats = page_size.stats()
+        self.assertEqual(stats['per_page'], 20)
+        self.assertAlmostEqual(stats['latency'], 0.5)
+        self.assertAlmostEqual(stats['network'], 0.3)
+        self.assertAlmostEqual(stats['decode'], 0.2)
+        self.assertAlmostEqual(stats['bytes_per_row'], 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
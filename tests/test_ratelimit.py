@@ -0,0 +1,109 @@
+# coding: utf-8
+
+import configparser
+import os
+import tempfile
+import time
+import unittest
+from pokepay.endpoint import path_template
+from pokepay.ratelimit import RateLimiter, MemoryBackend, FileBackend
+from pokepay.timeout import DeadlineExceeded
+
+
+class PathTemplateTest(unittest.TestCase):
+
+    def test_ids_are_replaced(self):
+        self.assertEqual(
+            path_template('/accounts/ce82075e-0d91-419b-b5bc-31458306bc55'
+                          '/balances'),
+            '/accounts/:id/balances')
+        self.assertEqual(path_template('/cpm/8lmqeJQjhfBcHEGzD2ZBwy'),
+                         '/cpm/:id')
+        self.assertEqual(path_template('/transactions-v2'),
+                         '/transactions-v2')
+        self.assertEqual(path_template('/accounts/customers'),
+                         '/accounts/customers')
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    def test_burst_then_paced(self):
+        waits = []
+        limiter = RateLimiter(rate=10, burst=3, sleep=waits.append)
+        for _ in range(6):
+            limiter.acquire('/ping')
+        self.assertEqual(len(waits), 3)
+        for i, wait in enumerate(waits, 1):
+            self.assertAlmostEqual(wait, i * 0.1, delta=0.02)
+
+    def test_path_buckets(self):
+        waits = []
+        limiter = RateLimiter(path_rates={'/accounts/:id': (1, 1)},
+                              sleep=waits.append)
+        limiter.acquire('/accounts/ce82075e-0d91-419b-b5bc-31458306bc55')
+        limiter.acquire('/ping')
+        self.assertEqual(waits, [])
+        limiter.acquire('/accounts/3f9092d1-1997-4132-869d-a7c75a5d798b')
+        self.assertEqual(len(waits), 1)
+
+    def test_wait_past_deadline(self):
+        waits = []
+        limiter = RateLimiter(rate=1, burst=1, sleep=waits.append)
+        limiter.acquire('/ping', time.monotonic() + 0.1)
+        with self.assertRaises(DeadlineExceeded):
+            limiter.acquire('/ping', time.monotonic() + 0.1)
+        self.assertEqual(waits, [])
+        limiter.acquire('/ping', time.monotonic() + 10)
+        self.assertEqual(len(waits), 1)
+
+    def test_rejected_acquire_does_not_delay_others(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        for backend in [MemoryBackend(), FileBackend(path)]:
+            waits = []
+            limiter = RateLimiter(rate=10, burst=1, backend=backend,
+                                  sleep=waits.append)
+            limiter.acquire('/ping')
+            for _ in range(50):
+                with self.assertRaises(DeadlineExceeded):
+                    limiter.acquire('/ping', time.monotonic() + 0.05)
+            limiter.acquire('/ping')
+            self.assertEqual(len(waits), 1)
+            self.assertLessEqual(waits[0], 0.1)
+
+    def test_file_backend_is_shared(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            waits = []
+            a = RateLimiter(rate=10, burst=2, backend=FileBackend(path),
+                            sleep=waits.append)
+            b = RateLimiter(rate=10, burst=2, backend=FileBackend(path),
+                            sleep=waits.append)
+            a.acquire('/ping')
+            b.acquire('/ping')
+            self.assertEqual(waits, [])
+            a.acquire('/ping')
+            b.acquire('/ping')
+            self.assertEqual(len(waits), 2)
+        finally:
+            os.remove(path)
+
+    def test_from_profile(self):
+        conf = configparser.ConfigParser()
+        conf.read_string('[global]\n'
+                         'RATE_LIMIT = 50\n'
+                         'RATE_LIMIT_PATHS =\n'
+                         '    /transactions-v2 = 5\n'
+                         '    /accounts/:id = 20/4\n')
+        limiter = RateLimiter.from_profile(conf['global'])
+        self.assertEqual(limiter.rate, 50)
+        self.assertEqual(limiter.path_rates, {
+            '/transactions-v2': (5.0, 5.0), '/accounts/:id': (20.0, 4.0)})
+        conf.read_string('[empty]\n')
+        self.assertIsNone(RateLimiter.from_profile(conf['empty']))
+
+
+if __name__ == '__main__':
+    unittest.main()
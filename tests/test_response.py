@@ -0,0 +1,48 @@
+# coding: utf-8
+
+import unittest
+from datetime import timedelta
+import pokepay as pp
+
+
+class FakeResponse(object):
+    status_code = 200
+    ok = True
+    headers = {'Content-Type': 'application/json'}
+    url = 'http://localhost/echo'
+    elapsed = timedelta(seconds=0.1)
+
+
+class ResponseTest(unittest.TestCase):
+
+    def test_fields_are_read_from_body(self):
+        body = {'status': 'ok', 'message': 'hello'}
+        response = pp.Echo(FakeResponse(), body)
+        self.assertEqual(response.message, 'hello')
+        self.assertIs(response.body, body)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.ok)
+        self.assertEqual(response.url, 'http://localhost/echo')
+        self.assertEqual(response.elapsed, timedelta(seconds=0.1))
+        self.assertEqual(response.headers['Content-Type'], 'application/json')
+
+    def test_no_instance_dict(self):
+        response = pp.Echo(FakeResponse(), {'status': 'ok', 'message': ''})
+        self.assertFalse(hasattr(response, '__dict__'))
+        with self.assertRaises(AttributeError):
+            response.extra = 1
+
+    def test_field_shadows_response_attribute(self):
+        body = {'account': {}, 'status_code': 900, 'error_type': None,
+                'error_message': None, 'created_at': None}
+        response = pp.CashtrayAttempt(FakeResponse(), body)
+        self.assertEqual(response.status_code, 900)
+        self.assertTrue(response.ok)
+
+    def test_renamed_field(self):
+        response = pp.UserStatsOperation(FakeResponse(), {'from': 'a'})
+        self.assertEqual(response.start, 'a')
+
+
+if __name__ == '__main__':
+    unittest.main()
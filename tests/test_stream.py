@@ -0,0 +1,107 @@
+# coding: utf-8
+
+import json
+import os
+import unittest
+import pokepay as pp
+from pokepay.client import Client
+from pokepay.crypto import AESCipher
+from pokepay.stream import (_iter_response_data, _iter_base64url,
+                            _iter_decrypt, _iter_rows, _TextReader)
+from tests.partner_stub import PartnerStub, write_config, CLIENT_SECRET
+
+
+def transactions(count):
+    return [{'id': str(i), 'amount': i * 1.5, 'done_at': None,
+             'description': 'チャージ "{}" \\ {}'.format(i, 'x' * (i % 50)),
+             'sender_account': {'id': 'a', 'private_money': {'id': 'm'}}}
+            for i in range(count)]
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class StreamPipelineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cipher = AESCipher(CLIENT_SECRET)
+
+    def envelope(self, body):
+        return json.dumps({
+            'timestamp': '2026-10-18T10:00:00+09:00',
+            'response_data': self.cipher.encrypt(json.dumps(body)),
+            'partner_call_id': 'x'}).encode('utf-8')
+
+    def parse(self, content, size):
+        meta = {}
+        plaintext = _iter_decrypt(self.cipher.key_bytes, _iter_base64url(
+            _iter_response_data(chunked(content, size))))
+        rows = list(_iter_rows(_TextReader(plaintext), meta))
+        return rows, meta
+
+    def test_matches_whole_body_decoding(self):
+        body = {'rows': transactions(200), 'per_page': 200, 'count': 1000,
+                'next_page_cursor_id': 'c', 'prev_page_cursor_id': None}
+        content = self.envelope(body)
+        for size in [1, 3, 16, 17, 1000, len(content)]:
+            rows, meta = self.parse(content, size)
+            self.assertEqual(rows, body['rows'])
+            self.assertEqual(meta, {'per_page': 200, 'count': 1000,
+                                    'next_page_cursor_id': 'c',
+                                    'prev_page_cursor_id': None})
+
+    def test_empty_rows_and_meta_first(self):
+        body = {'pagination': {'current': 1, 'has_next': False}, 'rows': [],
+                'count': 0}
+        rows, meta = self.parse(self.envelope(body), 5)
+        self.assertEqual(rows, [])
+        self.assertEqual(meta['pagination']['current'], 1)
+        self.assertEqual(meta['count'], 0)
+
+    def test_numbers_split_at_every_offset(self):
+        text = ('{"count":12.5,"rows":[1.25e3,-0.5,7,true,null,"x",10],'
+                '"per_page":3E+2, "total": 40 }').encode('utf-8')
+        body = json.loads(text)
+        expected = body.pop('rows')
+        for i in range(1, len(text)):
+            meta = {}
+            rows = list(_iter_rows(_TextReader([text[:i], text[i:]]), meta))
+            self.assertEqual(rows, expected)
+            self.assertEqual(meta, body)
+
+    def test_truncated_body(self):
+        content = self.envelope({'rows': transactions(10)})
+        with self.assertRaises(ValueError):
+            self.parse(content[:len(content) // 2], 64)
+
+
+class ClientStreamTest(unittest.TestCase):
+
+    def setUp(self):
+        self.stub = PartnerStub().start()
+        self.rows = transactions(1000)
+        self.stub.route('/transactions-v2', lambda method, data: {
+            'rows': self.rows, 'per_page': 1000, 'count': 1000,
+            'next_page_cursor_id': None, 'prev_page_cursor_id': None})
+        self.config_path = write_config(self.stub.base_url)
+        self.client = Client(self.config_path)
+
+    def tearDown(self):
+        self.stub.stop()
+        os.remove(self.config_path)
+
+    def test_stream_rows(self):
+        with self.client.stream(pp.ListTransactionsV2(per_page=1000),
+                                chunk_size=4096) as page:
+            self.assertEqual(page.status_code, 200)
+            self.assertEqual(list(page), self.rows)
+            self.assertEqual(page.meta['count'], 1000)
+
+    def test_stream_error(self):
+        response = self.client.stream(pp.GetPing())
+        self.assertEqual(response.status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()